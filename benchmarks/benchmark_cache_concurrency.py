@@ -0,0 +1,79 @@
+"""
+Benchmarking multi-threaded throughput of the QuantumNet-Core cache manager.
+Runs a hot-key read mix with occasional cold misses against managers with
+different shard counts, optionally with simulated slow-tier latency.
+"""
+import sys
+import os
+import time
+import logging
+import tempfile
+import threading
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from utils.cache_manager import QuantumCacheManager
+
+def add_backend_latency(manager: QuantumCacheManager, delay: float) -> None:
+    """Simulate a remote persistent tier by delaying every SQLite lookup."""
+    store_get = manager.store.get
+
+    def slow_get(key):
+        time.sleep(delay)
+        return store_get(key)
+
+    manager.store.get = slow_get
+
+def run_workload(manager: QuantumCacheManager, n_threads: int, ops_per_thread: int,
+                 n_hot: int, n_cold: int, miss_ratio: float) -> float:
+    """Run the read mix from several threads and return operations per second."""
+    barrier = threading.Barrier(n_threads + 1)
+
+    def worker(seed):
+        rng = np.random.default_rng(seed)
+        hot = rng.integers(0, n_hot, ops_per_thread)
+        cold = rng.integers(0, n_cold, ops_per_thread)
+        miss = rng.random(ops_per_thread) < miss_ratio
+        barrier.wait()
+        for i in range(ops_per_thread):
+            manager.get(f"cold-{cold[i]}" if miss[i] else f"hot-{hot[i]}")
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return n_threads * ops_per_thread / (time.perf_counter() - start_time)
+
+def benchmark(num_shards: int, n_threads: int, backend_delay: float, tmpdir: str) -> dict:
+    n_hot, n_cold = 200, 5000
+    db_path = os.path.join(tmpdir, f"cache_{num_shards}_{n_threads}_{backend_delay}.db")
+    manager = QuantumCacheManager(db_path=db_path, redis_port=1, cache_size_limit=n_hot + 100,
+                                  num_shards=num_shards, eviction_policy="lru")
+    for i in range(n_hot):
+        manager.put(f"hot-{i}", np.random.randn(16))
+    if backend_delay:
+        add_backend_latency(manager, backend_delay)
+    ops = run_workload(manager, n_threads, ops_per_thread=2000, n_hot=n_hot,
+                       n_cold=n_cold, miss_ratio=0.02)
+    metrics = manager.get_metrics()
+    manager.close()
+    return {'ops_per_sec': ops, 'hit_rate': metrics['hit_rate'],
+            'single_flight_shared': metrics['single_flight_shared']}
+
+def main():
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        print(f"{'delay (ms)':<12}{'shards':<8}{'threads':<9}{'ops/s':>12}{'hit rate':>10}{'shared':>8}")
+        for backend_delay in (0.0, 0.002):
+            for num_shards in (1, 16):
+                for n_threads in (1, 4, 16):
+                    result = benchmark(num_shards, n_threads, backend_delay, tmpdir)
+                    print(f"{backend_delay * 1000:<12.1f}{num_shards:<8}{n_threads:<9}"
+                          f"{result['ops_per_sec']:>12.0f}{result['hit_rate']:>10.3f}"
+                          f"{result['single_flight_shared']:>8}")
+
+if __name__ == "__main__":
+    main()
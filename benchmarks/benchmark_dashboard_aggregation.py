@@ -0,0 +1,62 @@
+"""
+Benchmarking metric aggregation in the dashboard API.
+Compares loading every row and aggregating in Python (the former aggregate_metrics)
+with the SQL aggregates over the rollup tables, as the raw table grows.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import time
+import random
+from datetime import datetime, timedelta
+
+DB_DIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(DB_DIR, 'metrics.db')}"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'dashboard'))
+from backend import api
+
+NAMES = ['network_latency', 'packet_loss', 'throughput', 'qubit_fidelity']
+
+def ingest(rows: int, start: datetime):
+    """Insert ``rows`` metrics spread one second apart, maintaining the rollups as the API does."""
+    db = api.SessionLocal()
+    batch = [(random.choice(NAMES), start + timedelta(seconds=i), random.uniform(10, 100)) for i in range(rows)]
+    db.execute(api.MetricModel.__table__.insert(),
+               [{'name': name, 'timestamp': timestamp, 'value': value} for name, timestamp, value in batch])
+    api.record_rollups(db, batch)
+    db.commit()
+    db.close()
+
+def python_aggregate():
+    db = api.SessionLocal()
+    metrics = db.query(api.MetricModel).all()
+    db.close()
+    values = [metric.value for metric in metrics]
+    return {'average': sum(values) / len(values), 'min': min(values), 'max': max(values)}
+
+def timed(fn, *args, **kwargs):
+    start_time = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start_time
+
+def main():
+    random.seed(0)
+    start = datetime(2024, 1, 1)
+    total = 0
+    print(f"{'raw rows':>10}{'python all() s':>16}{'rollup agg s':>14}{'hourly series s':>17}{'buckets':>9}")
+    for rows in [10_000, 90_000, 400_000]:
+        ingest(rows, start + timedelta(seconds=total))
+        total += rows
+        expected, python_s = timed(python_aggregate)
+        db = api.SessionLocal()
+        result, rollup_s = timed(api.query_aggregate, db)
+        assert abs(result['average'] - expected['average']) < 1e-6 and result['count'] == total
+        series, series_s = timed(api.query_series, db, name='network_latency', bucket=3600)
+        db.close()
+        print(f"{total:>10}{python_s:>16.3f}{rollup_s:>14.4f}{series_s:>17.4f}{len(series):>9}")
+    api.engine.dispose()
+    shutil.rmtree(DB_DIR)
+
+if __name__ == "__main__":
+    main()
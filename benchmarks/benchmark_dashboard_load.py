@@ -0,0 +1,117 @@
+"""
+Load test for the dashboard API.
+Starts the API under a local uvicorn process on a fresh SQLite database, seeds it,
+then drives it with concurrent clients issuing a mix of reads and writes, and
+reports p50/p99 latency and throughput per endpoint.
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import httpx
+import numpy as np
+
+DASHBOARD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'dashboard')
+NAMES = ['network_latency', 'packet_loss', 'throughput', 'qubit_fidelity']
+
+# (label, weight, method, path, params)
+REQUESTS = [
+    ('GET /metrics/', 4, 'GET', '/metrics/', {'limit': 50, 'sort_by': 'timestamp'}),
+    ('GET /metrics/aggregate/', 2, 'GET', '/metrics/aggregate/', {'name': 'packet_loss'}),
+    ('GET /metrics/series/', 2, 'GET', '/metrics/series/', {'name': 'throughput', 'bucket': 3600}),
+    ('POST /metrics/', 2, 'POST', '/metrics/', None),
+]
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_server(database_url: str, port: int) -> subprocess.Popen:
+    env = dict(os.environ, DATABASE_URL=database_url)
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'backend.api:app', '--port', str(port), '--log-level', 'warning'],
+        cwd=DASHBOARD_DIR, env=env
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            httpx.get(f'http://127.0.0.1:{port}/metrics/', params={'limit': 1}).raise_for_status()
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("uvicorn did not start")
+
+def seed(base_url: str, rows: int):
+    """Insert ``rows`` metrics one request at a time (works against any API version)."""
+    start = datetime(2024, 1, 1)
+    with httpx.Client(base_url=base_url) as client:
+        for i in range(rows):
+            client.post('/metrics/', json={'name': random.choice(NAMES), 'value': random.uniform(10, 100),
+                                           'timestamp': (start + timedelta(seconds=30 * i)).isoformat()})
+
+async def client_loop(client: httpx.AsyncClient, deadline: float, latencies: dict, errors: dict):
+    weights = [weight for _, weight, *_ in REQUESTS]
+    while time.perf_counter() < deadline:
+        label, _, method, path, params = random.choices(REQUESTS, weights)[0]
+        start_time = time.perf_counter()
+        try:
+            if method == 'GET':
+                response = await client.get(path, params=params)
+            else:
+                response = await client.post(path, json={'name': random.choice(NAMES),
+                                                          'value': random.uniform(10, 100)})
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            ok = False
+        if ok:
+            latencies[label].append(time.perf_counter() - start_time)
+        else:
+            errors[label] += 1
+
+async def run_load(base_url: str, clients: int, duration: float):
+    latencies = {label: [] for label, *_ in REQUESTS}
+    errors = {label: 0 for label, *_ in REQUESTS}
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*(client_loop(client, deadline, latencies, errors) for _ in range(clients)))
+    return latencies, errors
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load test of the dashboard API.")
+    parser.add_argument('--clients', type=int, nargs='+', default=[1, 16, 64], help='Concurrent clients per run')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds per run')
+    parser.add_argument('--seed-rows', type=int, default=2000, help='Metrics inserted before the runs')
+    args = parser.parse_args()
+
+    random.seed(0)
+    workdir = tempfile.mkdtemp()
+    port = free_port()
+    server = start_server(f"sqlite:///{os.path.join(workdir, 'metrics.db')}", port)
+    base_url = f'http://127.0.0.1:{port}'
+    try:
+        seed(base_url, args.seed_rows)
+        print(f"{'clients':>7}  {'endpoint':<26}{'requests':>9}{'errors':>8}{'p50 ms':>9}{'p99 ms':>9}{'req/s':>8}")
+        for clients in args.clients:
+            latencies, errors = asyncio.run(run_load(base_url, clients, args.duration))
+            for label, samples in latencies.items():
+                p50, p99 = np.percentile(samples, [50, 99]) * 1e3 if samples else (float('nan'),) * 2
+                print(f"{clients:>7}  {label:<26}{len(samples):>9}{errors[label]:>8}{p50:>9.1f}{p99:>9.1f}"
+                      f"{len(samples) / args.duration:>8.0f}")
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(workdir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmarking downsampling of long telemetry series for plots and the dashboard.
+Renders a 1200-pixel-wide line plot of every raw point, of the LTTB selection and
+of the min/max-per-bucket selection. Reports render time, the share of pixels that
+differ from the raw rendering, and the size of the /telemetry JSON payload.
+"""
+import sys
+import os
+import json
+import time
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from utils.downsampling import downsample, downsample_columns, target_points
+from utils.ring_buffer import ColumnarRingBuffer
+
+WIDTH_PX = 1200
+
+def telemetry(count: int, rng):
+    timestamps = np.datetime64('2024-01-01T00:00:00', 'ns') + np.arange(count) * np.timedelta64(5, 's')
+    temperature = 20 + np.sin(np.arange(count) / 5000) * 3 + rng.normal(0, 0.5, count)
+    temperature[rng.integers(0, count, 20)] += 15  # Sensor spikes that must stay visible
+    return timestamps, temperature
+
+def render(x, y):
+    """Seconds to draw the plot, and its pixels."""
+    fig = plt.figure(figsize=(WIDTH_PX / 100, 4), dpi=100)
+    start_time = time.perf_counter()
+    plt.plot(x, y, linewidth=0.8)
+    fig.canvas.draw()
+    elapsed = time.perf_counter() - start_time
+    pixels = np.asarray(fig.canvas.buffer_rgba())[..., :3].copy()
+    plt.close(fig)
+    return elapsed, pixels
+
+def main():
+    rng = np.random.default_rng(0)
+    points = target_points(WIDTH_PX)
+    print(f"{WIDTH_PX} px wide plot, {points} point budget\n")
+    print(f"{'samples':>9}  {'series':<8}{'points':>8}{'reduce ms':>11}{'render ms':>11}"
+          f"{'pixels differ %':>17}{'json KiB':>10}")
+    for count in [100_000, 1_000_000]:
+        x, y = telemetry(count, rng)
+        raw_s, raw_pixels = render(x, y)
+        raw_json = len(json.dumps(ColumnarRingBuffer.to_records({'timestamp': x, 'temperature': y}))) / 1024
+        print(f"{count:>9}  {'raw':<8}{count:>8}{0:>11.1f}{raw_s * 1e3:>11.1f}{0:>17.2f}{raw_json:>10.0f}")
+        for method in ['lttb', 'minmax']:
+            start_time = time.perf_counter()
+            window = downsample_columns({'timestamp': x, 'temperature': y}, 'timestamp', points, method)
+            reduce_s = time.perf_counter() - start_time
+            render_s, pixels = render(*downsample(x, y, points, method))
+            differ = np.any(pixels != raw_pixels, axis=-1).mean() * 100
+            payload = len(json.dumps(ColumnarRingBuffer.to_records(window))) / 1024
+            print(f"{count:>9}  {method:<8}{len(window['timestamp']):>8}{reduce_s * 1e3:>11.1f}"
+                  f"{render_s * 1e3:>11.1f}{differ:>17.2f}{payload:>10.0f}")
+
+if __name__ == "__main__":
+    main()
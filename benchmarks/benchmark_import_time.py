@@ -0,0 +1,64 @@
+"""
+Import-time regression check for QuantumNet-Core packages.
+Each package is imported in a fresh interpreter; the best of several runs is compared
+with a time budget, and heavy optional dependencies must not be loaded as a side
+effect. Exits with status 1 when any package is over budget or loads one of them.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Budgets in seconds; generous compared with the ~0.1s these take on a laptop
+BUDGETS = {
+    'quantum_state': 0.5,
+    'utils': 0.5,
+}
+
+HEAVY_MODULES = ['matplotlib', 'sklearn', 'scipy', 'seaborn', 'plotly', 'pandas',
+                 'requests', 'redis', 'pennylane', 'qiskit', 'cirq', 'tensorflow', 'torch']
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(name for name in {heavy!r} if name in sys.modules)
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+def measure(module: str, repeat: int) -> dict:
+    """Import ``module`` in ``repeat`` fresh interpreters and keep the fastest run."""
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=SRC_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if best is None or result['elapsed'] < best['elapsed']:
+            best = result
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Check package import times against a budget.")
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreters per package')
+    parser.add_argument('--scale', type=float, default=1.0, help='Multiply every budget, e.g. for slow CI machines')
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'package':<16}{'import s':>10}{'budget s':>10}  heavy modules loaded")
+    for module, budget in BUDGETS.items():
+        result = measure(module, args.repeat)
+        budget *= args.scale
+        over = result['elapsed'] > budget or result['heavy']
+        failed = failed or bool(over)
+        print(f"{module:<16}{result['elapsed']:>10.3f}{budget:>10.3f}  "
+              f"{', '.join(result['heavy']) or '-'}{'  FAIL' if over else ''}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmarking simulator throughput under the QuantumNet-Core logging setup.
+Each round generates a BB84 key and runs a consensus vote. "before" emits every
+per-bit and per-vote message through a synchronous file handler, as the modules
+did at INFO when they configured logging at import; "after" runs at INFO with
+the per-item messages demoted to DEBUG and records written by a QueueListener.
+"""
+import sys
+import os
+import logging
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from utils.logger import configure_logging, shutdown_logging, throttle_logger
+from network.protocols.qkd_bb84 import BB84Protocol
+from consensus.quantum_consensus import QuantumConsensus
+
+FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+def simulate(rounds: int, num_bits: int = 256, participants: int = 64) -> float:
+    """Run the simulator loop and return rounds per second."""
+    bb84 = BB84Protocol(num_bits=num_bits)
+    consensus = QuantumConsensus(participants, threshold=0.6)
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        key = bb84.generate_key()
+        for participant_id in range(participants):
+            consensus.cast_vote(participant_id, int(key[participant_id % len(key)]))
+        consensus.consensus_reached()
+    return rounds / (time.perf_counter() - start_time)
+
+def sync_logging(level: int, log_file: str) -> None:
+    """Equivalent of the old import-time basicConfig, writing to ``log_file``."""
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = logging.FileHandler(log_file)
+    handler.setFormatter(logging.Formatter(FORMAT))
+    root.addHandler(handler)
+    root.setLevel(level)
+
+def queued_logging(level: int, log_file: str) -> None:
+    configure_logging(level, handlers=[logging.FileHandler(log_file)], fmt=FORMAT)
+
+def main():
+    rounds = 200
+    log_file = os.path.join(tempfile.mkdtemp(), 'benchmark.log')
+    scenarios = [
+        ('before: sync handler, per-item messages', lambda: sync_logging(logging.DEBUG, log_file)),
+        ('sync handler, INFO', lambda: sync_logging(logging.INFO, log_file)),
+        ('queue listener, per-item messages', lambda: queued_logging(logging.DEBUG, log_file)),
+        ('queue listener, per-item rate-limited', lambda: (queued_logging(logging.DEBUG, log_file),
+                                                           throttle_logger('network.protocols.qkd_bb84', rate=100),
+                                                           throttle_logger('consensus.quantum_consensus', rate=100))),
+        ('after: queue listener, INFO', lambda: queued_logging(logging.INFO, log_file)),
+    ]
+
+    print(f"{rounds} rounds of BB84 (256 bits) + 64-participant consensus\n")
+    print(f"{'scenario':<42}{'rounds/s':>10}{'speedup':>9}{'log lines':>11}")
+    baseline = None
+    for name, setup in scenarios:
+        open(log_file, 'w').close()
+        setup()
+        simulate(5)  # Warm-up
+        throughput = simulate(rounds)
+        shutdown_logging()
+        throttle_logger('network.protocols.qkd_bb84')
+        throttle_logger('consensus.quantum_consensus')
+        for handler in list(logging.getLogger().handlers):
+            handler.close()
+            logging.getLogger().removeHandler(handler)
+        with open(log_file) as f:
+            lines = sum(1 for _ in f)
+        baseline = baseline or throughput
+        print(f"{name:<42}{throughput:>10.1f}{throughput / baseline:>8.1f}x{lines:>11}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmarking metric ingestion into the dashboard API.
+Compares one POST /metrics/ per metric with POST /metrics/batch carrying a JSON
+array or newline-delimited JSON, using an in-process client against SQLite.
+"""
+import sys
+import os
+import json
+import shutil
+import tempfile
+import time
+import random
+from datetime import datetime, timedelta
+
+DB_DIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(DB_DIR, 'metrics.db')}"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'dashboard'))
+from fastapi.testclient import TestClient
+from backend import api
+
+NAMES = ['network_latency', 'packet_loss', 'throughput', 'qubit_fidelity']
+
+def make_metrics(count: int, start: datetime):
+    return [{'name': random.choice(NAMES), 'value': random.uniform(10, 100),
+             'timestamp': (start + timedelta(milliseconds=10 * i)).isoformat()} for i in range(count)]
+
+def main():
+    random.seed(0)
+    client = TestClient(api.app)
+    start = datetime(2024, 1, 1)
+    print(f"{'mode':<28}{'metrics':>9}{'seconds':>10}{'metrics/s':>12}")
+
+    metrics = make_metrics(1000, start)
+    start_time = time.perf_counter()
+    for metric in metrics:
+        client.post('/metrics/', json=metric).raise_for_status()
+    elapsed = time.perf_counter() - start_time
+    print(f"{'POST /metrics/ per metric':<28}{len(metrics):>9}{elapsed:>10.2f}{len(metrics) / elapsed:>12.0f}")
+
+    for mode, batch_size in [('json', 1000), ('json', 10000), ('ndjson', 10000)]:
+        metrics = make_metrics(100_000, start)
+        start_time = time.perf_counter()
+        for i in range(0, len(metrics), batch_size):
+            batch = metrics[i:i + batch_size]
+            if mode == 'json':
+                response = client.post('/metrics/batch', json=batch)
+            else:
+                response = client.post('/metrics/batch', content='\n'.join(map(json.dumps, batch)),
+                                       headers={'Content-Type': 'application/x-ndjson'})
+            assert response.json()['inserted'] == len(batch)
+        elapsed = time.perf_counter() - start_time
+        label = f"batch {mode} x{batch_size}"
+        print(f"{label:<28}{len(metrics):>9}{elapsed:>10.2f}{len(metrics) / elapsed:>12.0f}")
+
+    api.engine.dispose()
+    shutil.rmtree(DB_DIR)
+
+if __name__ == "__main__":
+    main()
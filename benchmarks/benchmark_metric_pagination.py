@@ -0,0 +1,71 @@
+"""
+Benchmarking metric pagination and response caching in the dashboard API.
+Compares offset paging (skip/limit) with keyset paging (after=cursor) at increasing
+depths, and a repeated poll served from the database, the response cache and a
+304 revalidation via If-None-Match.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import time
+import random
+from datetime import datetime, timedelta
+
+DB_DIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(DB_DIR, 'metrics.db')}"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'dashboard'))
+from fastapi.testclient import TestClient
+from backend import api
+
+NAMES = ['network_latency', 'packet_loss', 'throughput', 'qubit_fidelity']
+PAGE = 100
+
+def seed(rows: int):
+    start = datetime(2024, 1, 1)
+    db = api.SessionLocal()
+    for offset in range(0, rows, 100_000):
+        api.insert_metrics(db, [api.Metric(name=random.choice(NAMES), value=random.uniform(10, 100),
+                                           timestamp=start + timedelta(seconds=i))
+                                for i in range(offset, min(offset + 100_000, rows))])
+    db.commit()
+    db.close()
+
+def best_of(fn, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start_time)
+    return best * 1e3
+
+def main():
+    random.seed(0)
+    rows = 500_000
+    seed(rows)
+    db = api.SessionLocal()
+    print(f"{rows} metrics, {PAGE} per page\n")
+    print(f"{'page depth':>10}{'offset ms':>11}{'keyset ms':>11}")
+    for depth in [0, 1000, 4000]:
+        skip = depth * PAGE
+        # The cursor of the page before, as a client walking the pages would hold it
+        _, cursor = api.query_metrics(db, skip=max(skip - PAGE, 0), limit=PAGE, sort_by='timestamp')
+        offset_ms = best_of(lambda: api.query_metrics(db, skip=skip, limit=PAGE, sort_by='timestamp'))
+        keyset_ms = best_of(lambda: api.query_metrics(db, limit=PAGE, after=cursor if skip else None))
+        print(f"{depth:>10}{offset_ms:>11.2f}{keyset_ms:>11.2f}")
+    db.close()
+
+    client = TestClient(api.app)
+    params = {'name': 'packet_loss', 'bucket': 60}
+    uncached_ms = best_of(lambda: (api.response_cache.invalidate(), client.get('/metrics/series/', params=params)))
+    client.get('/metrics/series/', params=params)
+    cached_ms = best_of(lambda: client.get('/metrics/series/', params=params))
+    etag = client.get('/metrics/series/', params=params).headers['etag']
+    not_modified_ms = best_of(lambda: client.get('/metrics/series/', params=params, headers={'If-None-Match': etag}))
+    print(f"\nrepeated poll of /metrics/series/ (1-minute buckets): database {uncached_ms:.1f} ms, "
+          f"cache {cached_ms:.1f} ms, 304 {not_modified_ms:.1f} ms")
+    api.engine.dispose()
+    shutil.rmtree(DB_DIR)
+
+if __name__ == "__main__":
+    main()
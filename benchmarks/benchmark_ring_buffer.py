@@ -0,0 +1,52 @@
+"""
+Benchmarking live telemetry storage for the dashboard.
+Compares growing a DataFrame by one row per sample (pd.concat, what DataFrame.append
+did) with the fixed-size columnar ring buffer, for append time, memory and the cost
+of serializing the last hour for /telemetry.
+"""
+import sys
+import os
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from utils.ring_buffer import ColumnarRingBuffer
+
+FIELDS = {'timestamp': 'datetime64[ns]', 'temperature': np.float64, 'humidity': np.float64}
+HOUR = 720  # samples per hour at one sample every 5 seconds
+
+def samples(count: int, rng):
+    start = np.datetime64('2024-01-01T00:00:00', 'ns')
+    for i in range(count):
+        yield {'timestamp': start + np.timedelta64(5 * i, 's'),
+               'temperature': rng.normal(20, 2), 'humidity': rng.uniform(30, 90)}
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'samples':>8}  {'store':<14}{'append us':>10}{'memory KiB':>12}{'last hour json ms':>19}")
+    for count in [2000, 10000, 40000]:
+        frame = pd.DataFrame(columns=list(FIELDS))
+        start_time = time.perf_counter()
+        for row in samples(count, rng):
+            frame = pd.concat([frame, pd.DataFrame([row])], ignore_index=True)
+        append_us = (time.perf_counter() - start_time) / count * 1e6
+        start_time = time.perf_counter()
+        frame.to_json(orient='records')
+        json_ms = (time.perf_counter() - start_time) * 1e3
+        memory = frame.memory_usage(deep=True).sum() / 1024
+        print(f"{count:>8}  {'DataFrame':<14}{append_us:>10.1f}{memory:>12.0f}{json_ms:>19.2f}")
+
+        # A week of 5-second samples, as the dashboard allocates it
+        buffer = ColumnarRingBuffer(7 * 24 * 720, FIELDS)
+        start_time = time.perf_counter()
+        for row in samples(count, rng):
+            buffer.append(**row)
+        append_us = (time.perf_counter() - start_time) / count * 1e6
+        start_time = time.perf_counter()
+        ColumnarRingBuffer.to_records(buffer.window(HOUR))
+        json_ms = (time.perf_counter() - start_time) * 1e3
+        print(f"{count:>8}  {'ring buffer':<14}{append_us:>10.1f}{buffer.nbytes / 1024:>12.0f}{json_ms:>19.2f}")
+
+if __name__ == "__main__":
+    main()
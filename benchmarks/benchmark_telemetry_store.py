@@ -0,0 +1,69 @@
+"""
+Benchmarking the columnar telemetry store against re-parsing the CSV with pandas.
+Each query asks for some metrics of a few nodes over a time window; the baseline
+is pd.read_csv of the whole file followed by boolean filtering.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from utils.telemetry_store import TelemetryStore
+
+METRICS = ['cpu_usage', 'memory_usage', 'network_latency', 'error_rate']
+
+def generate_csv(path: str, days: int, nodes: int, interval_s: int, rng) -> int:
+    """Write node_telemetry.csv-style rows, one day at a time."""
+    per_day = 86400 // interval_s
+    for day in range(days):
+        times = pd.Timestamp('2024-01-01') + pd.to_timedelta(day * 86400 + np.arange(per_day) * interval_s, unit='s')
+        frame = pd.DataFrame({
+            'timestamp': np.repeat(times, nodes),
+            'node_id': np.tile([f'node_{i}' for i in range(nodes)], per_day),
+            **{metric: rng.random(per_day * nodes) * 100 for metric in METRICS},
+        })
+        frame.to_csv(path, mode='a', header=day == 0, index=False)
+    return days * per_day * nodes
+
+def pandas_query(csv_path, metrics, nodes, start, end):
+    frame = pd.read_csv(csv_path, parse_dates=['timestamp'])
+    mask = frame['node_id'].isin(nodes) & (frame['timestamp'] >= start) & (frame['timestamp'] < end)
+    return frame.loc[mask, ['timestamp', 'node_id'] + metrics]
+
+def timed(fn, *args):
+    start_time = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start_time
+
+def main():
+    rng = np.random.default_rng(7)
+    workdir = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(workdir, 'node_telemetry.csv')
+        rows = generate_csv(csv_path, days=7, nodes=40, interval_s=60, rng=rng)
+        store = TelemetryStore(os.path.join(workdir, 'store'))
+        _, import_s = timed(store.import_csv, csv_path)
+        print(f"{rows} rows, {os.path.getsize(csv_path) / 2 ** 20:.1f} MiB CSV, "
+              f"store format {store.format}, import {import_s:.2f}s\n")
+
+        queries = [
+            ('1 metric, 1 node, 1 hour', ['cpu_usage'], ['node_3'], '2024-01-03 10:00', '2024-01-03 11:00'),
+            ('2 metrics, 5 nodes, 1 day', ['cpu_usage', 'error_rate'], [f'node_{i}' for i in range(5)],
+             '2024-01-05', '2024-01-06'),
+            ('all metrics, 1 node, 7 days', METRICS, ['node_12'], '2024-01-01', '2024-01-08'),
+        ]
+        print(f"{'query':<30}{'rows':>8}{'read_csv s':>12}{'store s':>10}{'speedup':>9}")
+        for name, metrics, nodes, start, end in queries:
+            expected, pandas_s = timed(pandas_query, csv_path, metrics, nodes, start, end)
+            result, store_s = timed(store.query, metrics, nodes, start, end)
+            assert len(result) == len(expected)
+            print(f"{name:<30}{len(result):>8}{pandas_s:>12.3f}{store_s:>10.4f}{pandas_s / store_s:>8.0f}x")
+    finally:
+        shutil.rmtree(workdir)
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,84 @@
 # start_dashboard.py
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, abort, render_template, request, jsonify
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.io as pio
 import os
+import sys
 import json
 from threading import Thread
 import time
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from utils.ring_buffer import ColumnarRingBuffer
+from utils.downsampling import DOWNSAMPLING_METHODS, downsample_columns, target_points
+
 # Initialize Flask app
 app = Flask(__name__)
 
-# Global variable to store telemetry data
-telemetry_data = pd.DataFrame(columns=['timestamp', 'temperature', 'humidity'])
+COLLECTION_INTERVAL = 5  # seconds
+# One week of samples by default; memory stays fixed at this size (about 6 MB)
+BUFFER_CAPACITY = int(os.getenv('TELEMETRY_BUFFER_SIZE', 7 * 24 * 3600 // COLLECTION_INTERVAL))
+# Rows returned when a request does not ask for a window (one hour)
+DEFAULT_WINDOW = 3600 // COLLECTION_INTERVAL
+# Plot width in pixels assumed when a request does not send ``width``; it sets the point budget
+DEFAULT_PLOT_WIDTH = 1200
+
+# Fixed-size store of the most recent telemetry samples
+telemetry_data = ColumnarRingBuffer(BUFFER_CAPACITY, {
+    'timestamp': 'datetime64[ns]',
+    'temperature': np.float64,
+    'humidity': np.float64,
+})
 
 # Function to simulate telemetry data collection
 def collect_telemetry_data():
-    global telemetry_data
     while True:
         # Simulate data collection
-        new_data = {
-            'timestamp': pd.Timestamp.now(),
-            'temperature': np.random.normal(loc=20, scale=2),
-            'humidity': np.random.uniform(low=30, high=90)
-        }
-        telemetry_data = telemetry_data.append(new_data, ignore_index=True)
-        time.sleep(5)  # Collect data every 5 seconds
+        telemetry_data.append(
+            timestamp=np.datetime64(pd.Timestamp.now(), 'ns'),
+            temperature=np.random.normal(loc=20, scale=2),
+            humidity=np.random.uniform(low=30, high=90)
+        )
+        time.sleep(COLLECTION_INTERVAL)  # Collect data every 5 seconds
+
+def requested_window():
+    """
+    Telemetry rows selected by the ``since`` (ISO time) and ``last`` (row count) query parameters,
+    downsampled to what a plot ``width`` pixels wide can show (``width=0`` returns every row).
+    ``downsample`` picks the method: ``lttb`` (default) or ``minmax``.
+    """
+    last = request.args.get('last', type=int)
+    since = request.args.get('since')
+    if since:
+        window = telemetry_data.since('timestamp', np.datetime64(pd.Timestamp(since), 'ns'), last)
+    else:
+        window = telemetry_data.window(last or DEFAULT_WINDOW)
+    width = request.args.get('width', DEFAULT_PLOT_WIDTH, type=int)
+    method = request.args.get('downsample', 'lttb')
+    if method not in DOWNSAMPLING_METHODS:
+        abort(400, f"downsample must be one of {', '.join(DOWNSAMPLING_METHODS)}")
+    if width > 0:
+        window = downsample_columns(window, 'timestamp', target_points(width), method)
+    return window
 
 # Route for the dashboard home page
 @app.route('/')
 def index():
     return render_template('index.html')
 
-# Route to get telemetry data for visualization
+# Route to get telemetry data for visualization; only the requested, downsampled window is serialized
 @app.route('/telemetry', methods=['GET'])
 def get_telemetry():
-    return jsonify(telemetry_data.to_dict(orient='records'))
+    return jsonify(ColumnarRingBuffer.to_records(requested_window()))
 
 # Route to generate telemetry plot
 @app.route('/telemetry_plot', methods=['GET'])
 def telemetry_plot():
-    fig = px.line(telemetry_data, x='timestamp', y=['temperature', 'humidity'], title='Telemetry Data Over Time')
+    fig = px.line(pd.DataFrame(requested_window()), x='timestamp', y=['temperature', 'humidity'],
+                  title='Telemetry Data Over Time')
     graph_json = pio.to_json(fig)
     return graph_json
 
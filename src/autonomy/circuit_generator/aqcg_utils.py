@@ -6,6 +6,11 @@ import matplotlib.pyplot as plt
 from qiskit import QuantumCircuit
 from qiskit.visualization import plot_histogram, plot_state_qsphere
 from qiskit.quantum_info import Statevector
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.cache_memoize import cached
+else:
+    from utils.cache_memoize import cached
 
 def visualize_circuit(circuit: QuantumCircuit, filename=None):
     """
@@ -42,6 +47,14 @@ def plot_state_vector(state_vector: Statevector, title='Quantum State Vector'):
     plt.title(title)
     plt.show()
 
+def _circuit_key(circuit: QuantumCircuit):
+    """Reduce a circuit to the gates, parameters and qubit indices that define its unitary."""
+    return circuit.num_qubits, [
+        (inst.operation.name, inst.operation.params, [circuit.find_bit(q).index for q in inst.qubits])
+        for inst in circuit.data
+    ]
+
+@cached(namespace="aqcg.circuit_to_matrix", tiers=("memory",), key=_circuit_key)
 def circuit_to_matrix(circuit: QuantumCircuit):
     """
     Convert a quantum circuit to its matrix representation.
@@ -67,20 +80,32 @@ def matrix_to_circuit(matrix: np.ndarray):
     from qiskit.circuit.library import UnitaryGate
     return QuantumCircuit.from_gate(UnitaryGate(matrix))
 
-def random_unitary(n_qubits):
+def _qr_unitary(random_matrix):
+    # Generate a random unitary matrix using QR decomposition
+    q, r = np.linalg.qr(random_matrix)
+    return q @ np.diag(np.sign(np.diag(r)))
+
+@cached(namespace="aqcg.random_unitary", tiers=("memory",))
+def _seeded_random_unitary(n_qubits, seed):
+    rng = np.random.default_rng(seed)
+    dim = 2**n_qubits
+    return _qr_unitary(rng.random((dim, dim)) + 1j * rng.random((dim, dim)))
+
+def random_unitary(n_qubits, seed=None):
     """
     Generate a random unitary matrix of size 2^n_qubits x 2^n_qubits.
 
     Parameters:
     n_qubits (int): Number of qubits.
+    seed (int): Optional seed. Seeded unitaries are deterministic and memoized.
 
     Returns:
     np.ndarray: A random unitary matrix.
     """
-    # Generate a random unitary matrix using QR decomposition
+    if seed is not None:
+        return _seeded_random_unitary(n_qubits, seed)
     random_matrix = np.random.rand(2**n_qubits, 2**n_qubits) + 1j * np.random.rand(2**n_qubits, 2**n_qubits)
-    q, r = np.linalg.qr(random_matrix)
-    return q @ np.diag(np.sign(np.diag(r)))
+    return _qr_unitary(random_matrix)
 
 def fidelity(state1, state2):
     """
@@ -2,8 +2,7 @@ import numpy as np
 import logging
 import matplotlib.pyplot as plt
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class QuantumConsensus:
     def __init__(self, num_participants, threshold=0.5):
@@ -25,19 +24,19 @@ class QuantumConsensus:
         if vote not in [0, 1]:
             raise ValueError("Vote must be 0 or 1.")
         self.votes[participant_id] = vote
-        logging.info(f"Participant {participant_id} cast vote: {vote}")
+        logger.debug("Participant %d cast vote: %d", participant_id, vote)
 
     def tally_votes(self):
         """Tally the votes and return the weighted result."""
         total_votes = np.sum(self.votes * self.weights)
-        logging.info(f"Tallying votes: {total_votes} out of {np.sum(self.weights)}")
+        logger.debug("Tallying votes: %s out of %s", total_votes, self.weights.sum())
         return total_votes
 
     def consensus_reached(self):
         """Check if consensus is reached based on the configured threshold."""
         total_weighted_votes = self.tally_votes()
         required_votes = self.threshold * np.sum(self.weights)
-        logging.info(f"Consensus check: {total_weighted_votes} >= {required_votes}")
+        logger.info("Consensus check: %s >= %s", total_weighted_votes, required_votes)
         return total_weighted_votes >= required_votes
 
     def visualize_votes(self):
@@ -53,6 +52,7 @@ class QuantumConsensus:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     consensus = QuantumConsensus(num_participants=5, threshold=0.6)
     consensus.set_weights([1, 1, 1, 2, 1])  # Set weights for participants
     consensus.cast_vote(0, 1)
@@ -3,8 +3,7 @@ from quantum_consensus import QuantumConsensus
 import logging
 import matplotlib.pyplot as plt
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class EntanglementVotingProtocol:
     def __init__(self, num_participants, threshold=0.5):
@@ -15,7 +14,7 @@ class EntanglementVotingProtocol:
         """Simulate entanglement between participants."""
         # For simplicity, we randomly assign entangled states (0 or 1)
         self.entangled_states = np.random.choice([0, 1], size=self.consensus.num_participants)
-        logging.info(f"Participants are entangled with states: {self.entangled_states}")
+        logger.debug("Participants are entangled with states: %s", self.entangled_states)
 
     def cast_entangled_vote(self, participant_id, vote):
         """Cast a vote using entanglement."""
@@ -24,7 +23,7 @@ class EntanglementVotingProtocol:
         if self.entangled_states[participant_id] == 1:
             vote = 1  # If entangled state is 1, force vote to 1
         self.consensus.cast_vote(participant_id, vote)
-        logging.info(f"Participant {participant_id} cast entangled vote: {vote}")
+        logger.debug("Participant %d cast entangled vote: %d", participant_id, vote)
 
     def tally_votes(self):
         """Tally the votes from the consensus mechanism."""
@@ -46,6 +45,7 @@ class EntanglementVotingProtocol:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     voting_protocol = EntanglementVotingProtocol(num_participants=5, threshold=0.6)
     voting_protocol.consensus.set_weights([1, 1, 1, 2, 1])  # Set weights for participants
     voting_protocol.cast_entangled_vote(0, 1)
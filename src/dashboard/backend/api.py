@@ -1,24 +1,175 @@
 # src/dashboard/backend/api.py
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Optional
-from sqlalchemy import create_engine, Column, Float, String
+import asyncio
+import base64
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import create_engine, event, inspect, text, cast, func, tuple_, Column, DateTime, Float, Index, Integer, String
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 
 # Database setup
-DATABASE_URL = "sqlite:///./metrics.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./metrics.db")
+# Connections kept open by the pool; also the number of threads running async endpoint queries
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 8))
+# Sync endpoints run on the AnyIO thread pool (40 threads by default); overflow connections
+# cover them so they never wait on the pool
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 40))
+
+def engine_options(url):
+    # Rollup upserts (ON CONFLICT) and series bucketing (strftime('%s')) are written for SQLite
+    if not url.startswith("sqlite"):
+        raise ValueError(f"DATABASE_URL must be a SQLite URL (sqlite:///path/to/metrics.db), got {url!r}")
+    # sqlite3 keeps prepared statements per connection; pooled connections keep them warm
+    options = {"connect_args": {"check_same_thread": False, "timeout": 30, "cached_statements": 256}}
+    if url not in ("sqlite://", "sqlite:///:memory:"):
+        options.update(pool_size=POOL_SIZE, max_overflow=MAX_OVERFLOW, pool_timeout=30)
+    return options
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    # WAL lets readers run alongside the single writer; NORMAL sync is durable at checkpoints
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-16000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
+db_executor = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="metrics-db")
+
+EPOCH = datetime(1970, 1, 1)
+
+# How long raw rows and each rollup resolution are kept, and how often expired rows are pruned
+RAW_RETENTION = timedelta(days=float(os.getenv("METRICS_RAW_RETENTION_DAYS", 7)))
+ROLLUP_RETENTION = {60: timedelta(days=30), 3600: timedelta(days=365)}
+PRUNE_INTERVAL = 300.0
+
+# Largest number of metrics, and of body bytes, accepted by one /metrics/batch request
+MAX_BATCH_SIZE = 100_000
+MAX_BATCH_BYTES = int(os.getenv("METRICS_MAX_BATCH_BYTES", 32 * 2 ** 20))
+
+# Callables receiving each committed batch of metrics as a list of dicts (e.g. the live stream in server.py)
+metric_listeners = []
+
+class ResponseCache:
+    """
+    LRU cache of serialized query responses, tagged with the data version they were built from.
+    Every committed write bumps the version, which invalidates all entries at once. ETags
+    derive from the version and the query, so a client holding the current one gets a 304
+    without any database work.
+
+    The version lives in this process and only counts writes made through it, so the API
+    must run as a single process (one uvicorn worker, as server.py starts it). With several
+    workers, one could serve a stale body under an ETag that another worker issued.
+    """
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.version = 0
+        # Distinguishes ETags issued by this process from those of a previous run
+        self.instance = uuid.uuid4().hex[:8]
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def etag(self, key, version):
+        return f'"{self.instance}-{version:x}-{zlib.crc32(repr(key).encode()):08x}"'
+
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, version, value):
+        with self._lock:
+            if version != self.version:
+                return  # Built from data that has changed since
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+response_cache = ResponseCache()
+
+def notify_listeners(rows):
+    response_cache.invalidate()
+    if not metric_listeners:
+        return
+    metrics = [{"name": name, "value": value, "timestamp": timestamp.isoformat()} for name, timestamp, value in rows]
+    for listener in metric_listeners:
+        try:
+            listener(metrics)
+        except Exception:
+            logging.exception("Metric listener failed")
+
+def utc_now():
+    """Current time as a naive UTC datetime, the form timestamps are stored in."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def to_naive_utc(timestamp):
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+def bucket_start(timestamp, resolution):
+    """Start of the ``resolution``-second bucket holding ``timestamp``."""
+    seconds = (timestamp - EPOCH) // timedelta(seconds=1)
+    return EPOCH + timedelta(seconds=seconds - seconds % resolution)
 
 # Metric model for the database
 class MetricModel(Base):
     __tablename__ = "metrics"
-    id = Column(String, primary_key=True, index=True)
-    name = Column(String, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, nullable=False)
     value = Column(Float)
+    timestamp = Column(DateTime, nullable=False, default=utc_now, index=True)
+    # Serves per-metric time-range scans and aggregates without touching the table
+    __table_args__ = (Index("ix_metrics_name_timestamp", "name", "timestamp", "value"),)
+
+class RollupColumns:
+    """Count, sum, min and max of one metric over one time bucket."""
+    name = Column(String, primary_key=True)
+    bucket = Column(DateTime, primary_key=True)
+    count = Column(Integer, nullable=False)
+    total = Column(Float, nullable=False)
+    min_value = Column(Float, nullable=False)
+    max_value = Column(Float, nullable=False)
+
+class MinuteRollupModel(RollupColumns, Base):
+    __tablename__ = "metric_rollups_1m"
+    resolution = 60
+
+class HourRollupModel(RollupColumns, Base):
+    __tablename__ = "metric_rollups_1h"
+    resolution = 3600
+
+ROLLUP_MODELS = {model.resolution: model for model in (MinuteRollupModel, HourRollupModel)}
+# Finest first; each resolution divides the next
+ROLLUP_RESOLUTIONS = sorted(ROLLUP_MODELS)
 
 Base.metadata.create_all(bind=engine)
 
@@ -27,48 +178,415 @@ app = FastAPI()
 class Metric(BaseModel):
     name: str
     value: float
+    timestamp: Optional[datetime] = None
+    id: Optional[int] = None
+
+metric_list = TypeAdapter(List[Metric])
+
+class MetricBucket(BaseModel):
+    name: str
+    bucket: datetime
+    count: int
+    average: float
+    min: float
+    max: float
+
+bucket_list = TypeAdapter(List[MetricBucket])
+
+def record_rollups(db: Session, metrics: Iterable[Tuple[str, datetime, float]]):
+    """
+    Fold raw (name, timestamp, value) rows into every rollup table.
+    Rows are combined per bucket in Python first, then each bucket is upserted once,
+    so ingest cost grows with the number of touched buckets rather than rows.
+    """
+    # (count, total, min, max) per (name, bucket) for the finest resolution; coarser
+    # resolutions are folded from those buckets instead of from the raw rows
+    buckets: Dict[Tuple[str, datetime], list] = {}
+    for name, timestamp, value in metrics:
+        key = (name, bucket_start(timestamp, ROLLUP_RESOLUTIONS[0]))
+        current = buckets.get(key)
+        if current is None:
+            buckets[key] = [1, value, value, value]
+        else:
+            current[0] += 1
+            current[1] += value
+            if value < current[2]:
+                current[2] = value
+            if value > current[3]:
+                current[3] = value
+    for resolution in ROLLUP_RESOLUTIONS:
+        if resolution != ROLLUP_RESOLUTIONS[0]:
+            coarse: Dict[Tuple[str, datetime], list] = {}
+            for (name, bucket), (count, total, low, high) in buckets.items():
+                key = (name, bucket_start(bucket, resolution))
+                current = coarse.get(key)
+                if current is None:
+                    coarse[key] = [count, total, low, high]
+                else:
+                    current[0] += count
+                    current[1] += total
+                    current[2] = min(current[2], low)
+                    current[3] = max(current[3], high)
+            buckets = coarse
+        if not buckets:
+            return
+        model = ROLLUP_MODELS[resolution]
+        table = model.__table__
+        statement = sqlite_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.name, table.c.bucket],
+            set_={
+                "count": table.c.count + statement.excluded.count,
+                "total": table.c.total + statement.excluded.total,
+                # Two-argument MIN/MAX are SQLite's scalar functions
+                "min_value": func.min(table.c.min_value, statement.excluded.min_value),
+                "max_value": func.max(table.c.max_value, statement.excluded.max_value),
+            },
+        )
+        db.execute(statement, [
+            {"name": name, "bucket": bucket, "count": count, "total": total, "min_value": low, "max_value": high}
+            for (name, bucket), (count, total, low, high) in buckets.items()
+        ])
+
+def migrate_legacy_metrics(bind):
+    """
+    Upgrade a ``metrics`` table created before timestamps were stored (string ``id``, no
+    ``timestamp`` column). Its rows are copied into the current schema and rollups, stamped
+    with the migration time since their real times are unknown. The old table is renamed
+    to ``metrics_legacy`` first and dropped in the copy's transaction, so an interrupted
+    migration resumes on the next start.
+    """
+    inspector = inspect(bind)
+    if inspector.has_table("metrics"):
+        columns = {column["name"] for column in inspector.get_columns("metrics")}
+        if "timestamp" in columns:
+            if not inspector.has_table("metrics_legacy"):
+                return
+        else:
+            logging.warning("Migrating metrics table without timestamps to the current schema")
+            with bind.begin() as connection:
+                connection.execute(text("ALTER TABLE metrics RENAME TO metrics_legacy"))
+    elif not inspector.has_table("metrics_legacy"):
+        return
+    Base.metadata.create_all(bind=bind)
+    db = Session(bind=bind)
+    try:
+        now = utc_now()
+        rows = [(name, now, value) for name, value in db.execute(text(
+            "SELECT name, value FROM metrics_legacy WHERE name IS NOT NULL AND value IS NOT NULL"))]
+        if rows:
+            db.execute(MetricModel.__table__.insert(),
+                       [{"name": name, "timestamp": timestamp, "value": value} for name, timestamp, value in rows])
+            record_rollups(db, rows)
+        db.execute(text("DROP TABLE metrics_legacy"))
+        db.commit()
+    finally:
+        db.close()
+    logging.info("Migrated %d legacy metrics", len(rows))
+
+migrate_legacy_metrics(engine)
+
+def prune_metrics(db: Session, now: Optional[datetime] = None):
+    """Delete raw rows and rollup buckets older than their retention period."""
+    now = now or utc_now()
+    deleted = {"raw": db.query(MetricModel).filter(MetricModel.timestamp < now - RAW_RETENTION)
+               .delete(synchronize_session=False)}
+    for resolution, model in ROLLUP_MODELS.items():
+        deleted[f"{resolution}s"] = db.query(model).filter(model.bucket < now - ROLLUP_RETENTION[resolution]) \
+            .delete(synchronize_session=False)
+    db.commit()
+    if any(deleted.values()):
+        response_cache.invalidate()
+    return deleted
+
+_last_prune = time.monotonic()
+_prune_lock = threading.Lock()
+
+def log_prune_failure(future):
+    if future.exception() is not None:
+        logging.error("Metric retention pass failed: %s", future.exception())
+
+def maybe_prune():
+    """Start a retention pass on the database executor once per PRUNE_INTERVAL, without waiting for it."""
+    global _last_prune
+    with _prune_lock:
+        if time.monotonic() - _last_prune < PRUNE_INTERVAL:
+            return
+        _last_prune = time.monotonic()
+    db_executor.submit(call_with_session, prune_metrics).add_done_callback(log_prune_failure)
+
+def epoch_bucket(column, seconds):
+    """SQL expression for the start of the ``seconds``-wide bucket of a DateTime column, in epoch seconds."""
+    return cast(func.strftime("%s", column), Integer) // seconds * seconds
+
+def get_db():
+    """Request-scoped session for sync endpoints; closed, returning its connection to the pool, after the request."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def call_with_session(fn, *args):
+    db = SessionLocal()
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
+
+async def run_db(fn, *args):
+    """
+    Await ``fn(db, *args)`` on the database executor with a session scoped to the call.
+    The session is opened and closed inside the same job: closing it from a later job
+    could queue behind jobs waiting for the connection it still holds.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(db_executor, functools.partial(call_with_session, fn, *args))
 
 @app.post("/metrics/", response_model=Metric)
-def add_metric(metric: Metric):
-    db: Session = SessionLocal()
-    db_metric = MetricModel(name=metric.name, value=metric.value)
+def add_metric(metric: Metric, db: Session = Depends(get_db)):
+    timestamp = to_naive_utc(metric.timestamp) if metric.timestamp else utc_now()
+    db_metric = MetricModel(name=metric.name, value=metric.value, timestamp=timestamp)
     db.add(db_metric)
+    record_rollups(db, [(metric.name, timestamp, metric.value)])
     db.commit()
     db.refresh(db_metric)
-    db.close()
+    notify_listeners([(metric.name, timestamp, metric.value)])
+    maybe_prune()
     return db_metric
 
-@app.get("/metrics/", response_model=List[Metric])
-def get_metrics(skip: int = 0, limit: int = 10, sort_by: Optional[str] = None):
-    db: Session = SessionLocal()
-    query = db.query(MetricModel)
+def parse_metric_batch(body: bytes, content_type: str = "") -> List[Metric]:
+    """Parse a JSON array of metrics, or newline-delimited JSON with one metric per line."""
+    if "ndjson" in content_type or not body.lstrip().startswith(b"["):
+        return [Metric.model_validate_json(line) for line in body.splitlines() if line.strip()]
+    return metric_list.validate_json(body)
 
-    if sort_by:
-        if sort_by == "name":
-            query = query.order_by(MetricModel.name)
-        elif sort_by == "value":
-            query = query.order_by(MetricModel.value)
+def insert_metrics(db: Session, metrics: List[Metric]) -> list:
+    """
+    Write metrics and their rollups with one executemany per table, in the caller's transaction.
+    Returns the inserted (name, timestamp, value) rows.
+    """
+    now = utc_now()
+    rows = [(metric.name, to_naive_utc(metric.timestamp) if metric.timestamp else now, metric.value)
+            for metric in metrics]
+    db.execute(MetricModel.__table__.insert(),
+               [{"name": name, "timestamp": timestamp, "value": value} for name, timestamp, value in rows])
+    record_rollups(db, rows)
+    return rows
 
-    metrics = query.offset(skip).limit(limit).all()
-    db.close()
-    return metrics
+def write_metrics(db: Session, metrics: List[Metric]) -> int:
+    rows = insert_metrics(db, metrics)
+    db.commit()
+    notify_listeners(rows)
+    maybe_prune()
+    return len(rows)
 
-@app.get("/metrics/aggregate/", response_model=dict)
-def aggregate_metrics():
-    db: Session = SessionLocal()
-    metrics = db.query(MetricModel).all()
-    db.close()
+async def read_capped_body(request: Request, limit: int) -> bytes:
+    """Request body, answering 413 before more than ``limit`` bytes are buffered."""
+    too_large = HTTPException(status_code=413, detail=f"At most {limit} bytes per batch")
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > limit:
+        raise too_large
+    # Chunked bodies carry no length; count while reading
+    chunks, size = [], 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:
+            raise too_large
+        chunks.append(chunk)
+    return b"".join(chunks)
 
+@app.post("/metrics/batch", response_model=dict)
+async def add_metrics_batch(request: Request):
+    """
+    Bulk ingest: a JSON array of metrics, or NDJSON (``application/x-ndjson``) with one
+    metric per line. All rows are written in a single transaction.
+    """
+    body = await read_capped_body(request, MAX_BATCH_BYTES)
+    try:
+        metrics = parse_metric_batch(body, request.headers.get("content-type", ""))
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+    if len(metrics) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_SIZE} metrics per batch")
     if not metrics:
-        raise HTTPException(status_code=404, detail="No metrics found")
+        return {"inserted": 0}
+    return {"inserted": await run_db(write_metrics, metrics)}
+
+def encode_cursor(metric: Metric) -> str:
+    return base64.urlsafe_b64encode(f"{metric.timestamp.isoformat()}|{metric.id}".encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        timestamp, metric_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(timestamp), int(metric_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    values = [metric.value for metric in metrics]
+def query_metrics(db: Session, skip: int = 0, limit: int = 10, sort_by: Optional[str] = None,
+                  after: Optional[str] = None, name: Optional[str] = None) -> Tuple[List[Metric], Optional[str]]:
+    """
+    One page of metrics and the cursor of the next page (None on the last page).
+    Pages in (timestamp, id) order are found by keyset: each page seeks past the
+    previous page's last row through the index, so late pages cost the same as the
+    first. Sorting by name or value falls back to ``skip`` (offset) paging.
+    """
+    query = db.query(MetricModel)
+    if name is not None:
+        query = query.filter(MetricModel.name == name)
+
+    if sort_by in (None, "timestamp"):
+        if after is not None:
+            query = query.filter(tuple_(MetricModel.timestamp, MetricModel.id) > tuple_(*decode_cursor(after)))
+        query = query.order_by(MetricModel.timestamp, MetricModel.id)
+    elif sort_by == "name":
+        query = query.order_by(MetricModel.name)
+    elif sort_by == "value":
+        query = query.order_by(MetricModel.value)
+
+    metrics = [Metric(name=metric.name, value=metric.value, timestamp=metric.timestamp, id=metric.id)
+               for metric in query.offset(skip).limit(limit).all()]
+    keyset = sort_by in (None, "timestamp") and skip == 0
+    next_cursor = encode_cursor(metrics[-1]) if keyset and len(metrics) == limit else None
+    return metrics, next_cursor
+
+def query_aggregate(db: Session, name: Optional[str] = None, start: Optional[datetime] = None,
+                    end: Optional[datetime] = None) -> Optional[dict]:
+    """
+    Average, min, max and count of a metric (or of all metrics), or None without data.
+    Without a time range the hourly rollups are aggregated, which also covers data past
+    the raw retention period; with one, the raw rows in [start, end) are aggregated in SQL.
+    """
+    if start is None and end is None:
+        model = HourRollupModel
+        query = db.query(func.sum(model.total) / func.sum(model.count), func.min(model.min_value),
+                         func.max(model.max_value), func.sum(model.count))
+    else:
+        model = MetricModel
+        query = db.query(func.avg(model.value), func.min(model.value), func.max(model.value), func.count(model.id))
+        if start is not None:
+            query = query.filter(model.timestamp >= to_naive_utc(start))
+        if end is not None:
+            query = query.filter(model.timestamp < to_naive_utc(end))
+    if name is not None:
+        query = query.filter(model.name == name)
+    average, minimum, maximum, count = query.one()
+    if not count:
+        return None
     return {
-        "average": sum(values) / len(values),
-        "min": min(values),
-        "max": max(values),
+        "average": average,
+        "min": minimum,
+        "max": maximum,
+        "count": count,
     }
 
+def query_series(db: Session, name: Optional[str] = None, bucket: int = 60, start: Optional[datetime] = None,
+                 end: Optional[datetime] = None) -> List[MetricBucket]:
+    """
+    Per-bucket count/average/min/max, grouped in SQL by metric name and time bucket.
+    Widths that are whole hours or minutes are answered from the matching rollup table,
+    so the cost depends on the number of buckets, not on the number of raw rows.
+    """
+    resolution = 3600 if bucket % 3600 == 0 else 60 if bucket % 60 == 0 else None
+    if resolution is not None:
+        model = ROLLUP_MODELS[resolution]
+        time_column = model.bucket
+        key = epoch_bucket(time_column, bucket).label("epoch")
+        query = db.query(model.name, key, func.sum(model.count), func.sum(model.total) / func.sum(model.count),
+                         func.min(model.min_value), func.max(model.max_value))
+    else:
+        model = MetricModel
+        time_column = model.timestamp
+        key = epoch_bucket(time_column, bucket).label("epoch")
+        query = db.query(model.name, key, func.count(model.id), func.avg(model.value),
+                         func.min(model.value), func.max(model.value))
+    if name is not None:
+        query = query.filter(model.name == name)
+    if start is not None:
+        query = query.filter(time_column >= to_naive_utc(start))
+    if end is not None:
+        query = query.filter(time_column < to_naive_utc(end))
+    rows = query.group_by(model.name, key).order_by(model.name, key).all()
+    return [
+        MetricBucket(name=row_name, bucket=EPOCH + timedelta(seconds=epoch), count=count,
+                     average=average, min=minimum, max=maximum)
+        for row_name, epoch, count, average, minimum, maximum in rows
+    ]
+
+# Read endpoints are async: queries run on the database executor, so the number of threads
+# touching the database stays at POOL_SIZE however many requests are waiting
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """True if an If-None-Match header lists ``etag`` or is ``*``, comparing weakly (W/ ignored)."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+async def cached_response(request: Request, build):
+    """
+    Serve a read endpoint from the response cache.
+    ``build`` is an async callable returning (JSON body bytes, extra headers). It runs only
+    on a cache miss, and not at all when the client's If-None-Match holds the current ETag.
+    """
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+    version = response_cache.version
+    etag = response_cache.etag(key, version)
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    cached = response_cache.get(key, version)
+    if cached is None:
+        cached = await build()
+        response_cache.put(key, version, cached)
+    body, headers = cached
+    return Response(content=body, media_type="application/json", headers={"ETag": etag, **headers})
+
+@app.get("/metrics/", response_model=List[Metric])
+async def get_metrics(request: Request, skip: int = 0, limit: int = Query(10, ge=1, le=10000),
+                      sort_by: Optional[str] = None, after: Optional[str] = None, name: Optional[str] = None):
+    """
+    Metrics in (timestamp, id) order, paged by cursor: pass the X-Next-Cursor header of a
+    page as ``after`` to get the next one. ``sort_by=name|value`` pages with ``skip``.
+    """
+    async def build():
+        metrics, next_cursor = await run_db(query_metrics, skip, limit, sort_by, after, name)
+        return metric_list.dump_json(metrics), {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    return await cached_response(request, build)
+
+@app.get("/metrics/aggregate/", response_model=dict)
+async def aggregate_metrics(request: Request, name: Optional[str] = None, start: Optional[datetime] = None,
+                            end: Optional[datetime] = None):
+    """Average, min, max and count of a metric (or of all metrics), optionally in [start, end)."""
+    async def build():
+        result = await run_db(query_aggregate, name, start, end)
+        if result is None:
+            raise HTTPException(status_code=404, detail="No metrics found")
+        return json.dumps(result).encode(), {}
+    return await cached_response(request, build)
+
+@app.get("/metrics/series/", response_model=List[MetricBucket])
+async def metric_series(
+    request: Request,
+    name: Optional[str] = None,
+    bucket: int = Query(60, ge=1, description="Bucket width in seconds"),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+):
+    """Per-bucket count/average/min/max of metrics, ``bucket`` seconds wide."""
+    async def build():
+        return bucket_list.dump_json(await run_db(query_series, name, bucket, start, end)), {}
+    return await cached_response(request, build)
+
+@app.post("/metrics/prune/", response_model=dict)
+def prune_expired_metrics(db: Session = Depends(get_db)):
+    """Apply the retention periods now instead of waiting for the next ingest-time pass."""
+    return prune_metrics(db)
+
 # Example usage
 if __name__ == "__main__":
     import uvicorn
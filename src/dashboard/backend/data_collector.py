@@ -1,47 +1,100 @@
 # src/dashboard/backend/data_collector.py
 
 import random
+import threading
 import time
+from datetime import datetime, timezone
 import requests
 import logging
 import os
 import signal
 import sys
 
+# utils lives in src/; put it on the path when this file is run from its own directory
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+from utils.http_client import HTTPClient
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class MetricCollector:
-    def __init__(self, metric_name="network_latency", value_range=(10, 100), interval=5):
+    def __init__(self, metric_name="network_latency", value_range=(10, 100), interval=5,
+                 api_url="http://localhost:8000/api/v1", client=None, batch_size=500,
+                 flush_interval=30.0, max_buffer=100_000):
         self.metric_name = metric_name
         self.value_range = value_range
         self.interval = interval
         self.running = True
+        # Keep-alive session shared by every send, with timeouts and retries
+        self.client = client or HTTPClient(api_url, timeout=(3.05, 10.0), max_retries=3)
+        # Metrics are buffered and sent to /metrics/batch once batch_size are queued or
+        # flush_interval seconds have passed; max_buffer bounds memory while the API is down
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.buffer = []
+        self._buffer_lock = threading.Lock()
+        self._last_flush = time.monotonic()
 
     def collect_metric(self):
         """Simulate collecting a single metric."""
         value = random.uniform(*self.value_range)
-        return {"name": self.metric_name, "value": value}
+        return {"name": self.metric_name, "value": value,
+                "timestamp": datetime.now(timezone.utc).isoformat()}
 
     def send_metric(self, metric):
         """Send the collected metric to the API."""
         try:
-            response = requests.post("http://localhost:8000/api/v1/metrics/", json=metric)
-            response.raise_for_status()  # Raise an error for bad responses
+            response = self.client.post("metrics/", json=metric)
             logging.info(f"Collected Metric: {metric}, Response: {response.status_code}")
         except requests.exceptions.RequestException as e:
             logging.error(f"Failed to send metric: {e}")
 
+    def record(self, metric):
+        """Buffer a metric and flush when the batch is full or the flush interval has passed."""
+        with self._buffer_lock:
+            self.buffer.append(metric)
+            due = (len(self.buffer) >= self.batch_size
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Send all buffered metrics in one request. Returns the number of metrics sent."""
+        with self._buffer_lock:
+            batch, self.buffer = self.buffer, []
+            self._last_flush = time.monotonic()
+        if not batch:
+            return 0
+        try:
+            response = self.client.post("metrics/batch", json=batch)
+            logging.info(f"Sent {len(batch)} metrics, Response: {response.status_code}")
+            return len(batch)
+        except requests.exceptions.ReadTimeout as e:
+            # The server may have committed the batch before timing out; sending it again
+            # could insert every metric twice, so it is dropped instead
+            logging.error(f"Dropped {len(batch)} metrics after an unanswered send: {e}")
+            return 0
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Failed to send {len(batch)} metrics: {e}")
+            with self._buffer_lock:
+                # Keep the newest metrics for the next flush, oldest dropped first
+                self.buffer = (batch + self.buffer)[-self.max_buffer:]
+            return 0
+
     def run(self):
         """Run the metric collection loop."""
         while self.running:
-            metric = self.collect_metric()
-            self.send_metric(metric)
+            self.record(self.collect_metric())
             time.sleep(self.interval)
 
     def stop(self):
         """Stop the metric collection gracefully."""
         self.running = False
+        self.flush()
+        self.client.close()
         logging.info("Stopping metric collection.")
 
 def signal_handler(sig, frame):
@@ -54,8 +107,12 @@ if __name__ == "__main__":
     metric_name = os.getenv("METRIC_NAME", "network_latency")
     value_range = (float(os.getenv("VALUE_MIN", 10)), float(os.getenv("VALUE_MAX", 100)))
     interval = int(os.getenv("COLLECTION_INTERVAL", 5))
+    api_url = os.getenv("API_URL", "http://localhost:8000/api/v1")
+    batch_size = int(os.getenv("BATCH_SIZE", 500))
+    flush_interval = float(os.getenv("FLUSH_INTERVAL", 30))
 
-    collector = MetricCollector(metric_name, value_range, interval)
+    collector = MetricCollector(metric_name, value_range, interval, api_url,
+                                batch_size=batch_size, flush_interval=flush_interval)
 
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
@@ -0,0 +1,103 @@
+# src/dashboard/backend/metric_stream.py
+
+import asyncio
+import itertools
+import json
+import threading
+from collections import deque
+
+class MetricBroadcaster:
+    """
+    Fans new metrics out to live dashboard clients from one shared ring buffer.
+
+    Every published batch is serialized once and stored with a sequence number. Clients
+    keep only the sequence number they have read up to, so publishing costs the same
+    for one client or a hundred, and a slow client holds back nobody but itself. A
+    client that falls more than ``capacity`` batches behind is told how many it missed
+    and continues from the oldest batch still buffered.
+    """
+    def __init__(self, capacity=10_000):
+        self.capacity = capacity
+        self._events = deque(maxlen=capacity)
+        self._last_seq = 0
+        self._lock = threading.Lock()
+        self._loop = None
+        self._changed = None
+
+    @property
+    def last_seq(self):
+        """Sequence number of the newest batch (0 before the first one)."""
+        return self._last_seq
+
+    def publish(self, metrics):
+        """Append a batch of metrics (JSON-serializable dicts); safe to call from any thread."""
+        if not metrics:
+            return
+        payload = json.dumps(metrics, default=str)
+        with self._lock:
+            self._last_seq += 1
+            self._events.append((self._last_seq, payload))
+            loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self):
+        if self._changed is not None and not self._changed.done():
+            self._changed.set_result(None)
+        self._changed = None
+
+    def read(self, cursor, limit=1000):
+        """
+        Batches published after ``cursor``.
+
+        Returns:
+            tuple: (list of (seq, payload) pairs, number of batches missed because they
+            already left the buffer).
+        """
+        with self._lock:
+            if not self._events or cursor >= self._last_seq:
+                return [], 0
+            first_seq = self._events[0][0]
+            missed = max(first_seq - cursor - 1, 0)
+            start = max(cursor + 1 - first_seq, 0)
+            return list(itertools.islice(self._events, start, start + limit)), missed
+
+    async def wait(self, cursor, timeout=None):
+        """Wait until a batch newer than ``cursor`` is published; returns False on timeout."""
+        with self._lock:
+            if cursor < self._last_seq:
+                return True
+            self._loop = asyncio.get_running_loop()
+            if self._changed is None:
+                self._changed = self._loop.create_future()
+            changed = self._changed
+        try:
+            await asyncio.wait_for(asyncio.shield(changed), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def sse_events(self, cursor=None, is_disconnected=None, keepalive=15.0):
+        """
+        Server-Sent Events stream starting after ``cursor`` (the newest batch when None).
+        Every batch becomes a ``metrics`` event whose id is its sequence number, so
+        reconnecting ``EventSource`` clients resume through ``Last-Event-ID``. A cursor past
+        the newest batch comes from before a server restart, when numbering started over:
+        the client gets a ``reset`` event (``missed`` unknown) and resumes from the newest batch.
+        """
+        cursor = self.last_seq if cursor is None else cursor
+        yield "retry: 3000\n\n"
+        if cursor > self.last_seq:
+            cursor = self.last_seq
+            # The id replaces the client's stale Last-Event-ID for its next reconnect
+            yield f"id: {cursor}\nevent: reset\ndata: {json.dumps({'missed': None})}\n\n"
+        while is_disconnected is None or not await is_disconnected():
+            events, missed = self.read(cursor)
+            if events or missed:
+                chunk = [f"event: reset\ndata: {json.dumps({'missed': missed})}\n\n"] if missed else []
+                chunk.extend(f"id: {seq}\nevent: metrics\ndata: {payload}\n\n" for seq, payload in events)
+                cursor = events[-1][0] if events else cursor + missed
+                # Awaiting the send is the backpressure: a slow client only delays its own reads
+                yield "".join(chunk)
+            elif not await self.wait(cursor, keepalive):
+                yield ": keep-alive\n\n"
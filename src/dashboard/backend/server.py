@@ -1,11 +1,21 @@
 # src/dashboard/backend/server.py
 
 import os
+import sys
 import logging
-from fastapi import FastAPI
+import time
+from typing import Optional
+from fastapi import FastAPI, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from api import app as api_app
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from api import app as api_app, metric_listeners
+from metric_stream import MetricBroadcaster
+
+# utils lives in src/; put it on the path when this file is run from its own directory
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+from utils.metrics_registry import REGISTRY, counter, histogram
 import uvicorn
 
 # Configure logging
@@ -13,6 +23,14 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 
 app = FastAPI()
 
+# Every committed metric batch is published once; streaming clients read it from the shared buffer
+broadcaster = MetricBroadcaster(capacity=int(os.getenv("STREAM_BUFFER_SIZE", 10000)))
+metric_listeners.append(broadcaster.publish)
+
+_METRICS_INGESTED = counter("quantumnet_dashboard_metrics_ingested_total", "Metrics committed through the API.")
+metric_listeners.append(lambda metrics: _METRICS_INGESTED.inc(len(metrics)))
+_REQUEST_LATENCY = histogram("quantumnet_dashboard_request_seconds", "Dashboard HTTP time to response headers.")
+
 # Allow CORS for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -20,8 +38,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
+@app.middleware("http")
+async def time_requests(request: Request, call_next):
+    start_time = time.perf_counter()
+    response = await call_next(request)
+    _REQUEST_LATENCY.observe(time.perf_counter() - start_time)
+    return response
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to the Network Monitoring Dashboard"}
@@ -31,6 +57,28 @@ def health_check():
     """Health check endpoint."""
     return JSONResponse(content={"status": "healthy"}, status_code=200)
 
+@app.get("/stream/metrics")
+async def stream_metrics(request: Request, last_event_id: Optional[str] = Header(None)):
+    """
+    Server-Sent Events stream of newly ingested metrics. Clients load the current view
+    once from /api/v1/metrics/ and then apply the ``metrics`` events as deltas; a
+    ``reset`` event means some were missed and the view should be reloaded.
+    """
+    cursor = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+    return StreamingResponse(
+        broadcaster.sse_events(cursor, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def scrape_metrics():
+    """
+    Process-wide counters, gauges and histograms (cache, circuit execution, routing and
+    this server) in the Prometheus text format, for a scraper or a quick curl.
+    """
+    return PlainTextResponse(REGISTRY.render_text(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 # Include the API routes
 app.mount("/api/v1", api_app)  # Versioning the API
 
@@ -39,4 +87,5 @@ if __name__ == "__main__":
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", 8000))
     logging.info(f"Starting server at http://{host}:{port}")
+    # One process only: the response cache version and the live stream are per process
     uvicorn.run(app, host=host, port=port)
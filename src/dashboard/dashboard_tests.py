@@ -3,9 +3,20 @@
 import unittest
 from fastapi.testclient import TestClient
 from backend.api import app
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
 from backend.api import MetricModel, Base
+from backend import api
+from backend.data_collector import MetricCollector
+from backend.metric_stream import MetricBroadcaster
+from unittest.mock import MagicMock, patch
+import asyncio
+import json
+import os
+import threading
+import time
+import requests
+from datetime import datetime, timedelta
 
 # Database setup for testing
 DATABASE_URL = "sqlite:///./test_metrics.db"
@@ -64,5 +75,250 @@ class TestAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), [])  # Should return an empty list
 
+class TestAggregation(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(app)
+        db = api.SessionLocal()
+        for model in (MetricModel, *api.ROLLUP_MODELS.values()):
+            db.query(model).delete()
+        db.commit()
+        db.close()
+
+    def post(self, name, value, timestamp):
+        response = self.client.post("/metrics/", json={"name": name, "value": value, "timestamp": timestamp})
+        self.assertEqual(response.status_code, 200)
+
+    def test_series_from_rollups_and_raw_rows(self):
+        self.post("latency", 10.0, "2024-01-01T00:00:10")
+        self.post("latency", 30.0, "2024-01-01T00:00:50")
+        self.post("latency", 20.0, "2024-01-01T00:01:30")
+        self.post("loss", 1.0, "2024-01-01T00:00:20")
+
+        minutes = self.client.get("/metrics/series/", params={"name": "latency", "bucket": 60}).json()
+        self.assertEqual([(b["bucket"], b["count"], b["average"], b["min"], b["max"]) for b in minutes],
+                         [("2024-01-01T00:00:00", 2, 20.0, 10.0, 30.0), ("2024-01-01T00:01:00", 1, 20.0, 20.0, 20.0)])
+        # 45-second buckets are not a rollup resolution and are grouped from the raw rows
+        raw = self.client.get("/metrics/series/", params={"bucket": 45}).json()
+        self.assertEqual([(b["name"], b["bucket"], b["count"]) for b in raw],
+                         [("latency", "2024-01-01T00:00:00", 1), ("latency", "2024-01-01T00:00:45", 1),
+                          ("latency", "2024-01-01T00:01:30", 1), ("loss", "2024-01-01T00:00:00", 1)])
+
+        totals = self.client.get("/metrics/aggregate/", params={"name": "latency"}).json()
+        self.assertEqual((totals["average"], totals["min"], totals["max"], totals["count"]), (20.0, 10.0, 30.0, 3))
+        ranged = self.client.get("/metrics/aggregate/", params={"start": "2024-01-01T00:00:15",
+                                                                "end": "2024-01-01T00:01:00"}).json()
+        self.assertEqual((ranged["min"], ranged["max"], ranged["count"]), (1.0, 30.0, 2))
+
+    def test_retention_prunes_raw_rows_before_rollups(self):
+        self.post("latency", 10.0, "2024-01-01T00:00:10")
+        db = api.SessionLocal()
+        deleted = api.prune_metrics(db, now=datetime(2024, 1, 1) + api.RAW_RETENTION + timedelta(days=1))
+        db.close()
+        self.assertEqual(deleted, {"raw": 1, "60s": 0, "3600s": 0})
+        self.assertEqual(self.client.get("/metrics/aggregate/").json()["count"], 1)
+
+class TestBatchIngest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(app)
+        db = api.SessionLocal()
+        for model in (MetricModel, *api.ROLLUP_MODELS.values()):
+            db.query(model).delete()
+        db.commit()
+        db.close()
+
+    def test_json_array_and_ndjson_batches(self):
+        metrics = [{"name": "latency", "value": float(i), "timestamp": f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}"}
+                   for i in range(120)]
+        response = self.client.post("/metrics/batch", json=metrics[:100])
+        self.assertEqual(response.json(), {"inserted": 100})
+        ndjson = "\n".join(json.dumps(metric) for metric in metrics[100:]) + "\n"
+        response = self.client.post("/metrics/batch", content=ndjson, headers={"Content-Type": "application/x-ndjson"})
+        self.assertEqual(response.json(), {"inserted": 20})
+
+        series = self.client.get("/metrics/series/", params={"name": "latency", "bucket": 60}).json()
+        self.assertEqual([(b["count"], b["min"], b["max"]) for b in series], [(60, 0.0, 59.0), (60, 60.0, 119.0)])
+        hourly = self.client.get("/metrics/series/", params={"name": "latency", "bucket": 3600}).json()
+        self.assertEqual([(b["count"], b["average"]) for b in hourly], [(120, 59.5)])
+
+    def test_invalid_batch_is_rejected_whole(self):
+        response = self.client.post("/metrics/batch", json=[{"name": "latency", "value": 1.0}, {"name": "latency"}])
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(self.client.get("/metrics/aggregate/").status_code, 404)
+
+    def test_oversized_body_is_rejected_before_parsing(self):
+        body = json.dumps([{"name": "latency", "value": 1.0}] * 100)
+        original = api.MAX_BATCH_BYTES
+        api.MAX_BATCH_BYTES = len(body) - 1
+        try:
+            response = self.client.post("/metrics/batch", content=body)
+            chunked = self.client.post("/metrics/batch", content=iter([body[:500].encode(), body[500:].encode()]))
+        finally:
+            api.MAX_BATCH_BYTES = original
+        self.assertEqual((response.status_code, chunked.status_code), (413, 413))
+        self.assertEqual(self.client.get("/metrics/aggregate/").status_code, 404)
+
+    def test_retention_runs_off_the_ingest_request(self):
+        self.client.post("/metrics/", json={"name": "latency", "value": 1.0, "timestamp": "2000-01-01T00:00:00"})
+        threads, prune = [], api.prune_metrics
+
+        def recording_prune(db):
+            threads.append(threading.current_thread().name)
+            return prune(db)
+
+        api._last_prune -= api.PRUNE_INTERVAL
+        with patch.object(api, "prune_metrics", recording_prune):
+            # The sync endpoint runs on the request thread pool, not on the database executor
+            self.assertEqual(self.client.post("/metrics/", json={"name": "latency", "value": 2.0}).status_code, 200)
+            deadline = time.time() + 5
+            while self.client.get("/metrics/aggregate/").json()["count"] != 1 and time.time() < deadline:
+                time.sleep(0.01)
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("metrics-db"))
+
+class TestMetricCollectorBuffering(unittest.TestCase):
+
+    def test_flushes_by_size_and_requeues_on_failure(self):
+        client = MagicMock()
+        collector = MetricCollector(client=client, batch_size=3, flush_interval=3600)
+        for _ in range(2):
+            collector.record(collector.collect_metric())
+        client.post.assert_not_called()
+        collector.record(collector.collect_metric())
+        client.post.assert_called_once()
+        self.assertEqual(client.post.call_args[0][0], "metrics/batch")
+        self.assertEqual(len(client.post.call_args[1]["json"]), 3)
+
+        client.post.side_effect = requests.exceptions.ConnectionError("down")
+        collector.record(collector.collect_metric())
+        self.assertEqual(collector.flush(), 0)
+        self.assertEqual(len(collector.buffer), 1)
+
+class TestMetricBroadcaster(unittest.TestCase):
+
+    def test_reads_from_cursor_and_reports_missed_batches(self):
+        broadcaster = MetricBroadcaster(capacity=3)
+        for i in range(5):
+            broadcaster.publish([{"name": "latency", "value": float(i)}])
+        events, missed = broadcaster.read(0)
+        self.assertEqual(missed, 2)
+        self.assertEqual([seq for seq, _ in events], [3, 4, 5])
+        self.assertEqual(broadcaster.read(4)[0], [(5, json.dumps([{"name": "latency", "value": 4.0}]))])
+        self.assertEqual(broadcaster.read(5), ([], 0))
+
+    def test_stream_wakes_on_publish_from_another_thread(self):
+        broadcaster = MetricBroadcaster()
+
+        async def consume():
+            stream = broadcaster.sse_events()
+            self.assertEqual(await stream.__anext__(), "retry: 3000\n\n")
+            pending = asyncio.ensure_future(stream.__anext__())
+            await asyncio.sleep(0.05)
+            threading.Thread(target=broadcaster.publish, args=([{"name": "loss", "value": 1.0}],)).start()
+            return await asyncio.wait_for(pending, 5)
+
+        chunk = asyncio.run(consume())
+        self.assertEqual(chunk, 'id: 1\nevent: metrics\ndata: [{"name": "loss", "value": 1.0}]\n\n')
+
+    def test_cursor_from_before_restart_resets_client(self):
+        broadcaster = MetricBroadcaster()
+        broadcaster.publish([{"name": "loss", "value": 1.0}])
+
+        async def consume():
+            # Last-Event-ID 500 was issued by the previous server process
+            stream = broadcaster.sse_events(500)
+            await stream.__anext__()
+            reset = await stream.__anext__()
+            broadcaster.publish([{"name": "loss", "value": 2.0}])
+            return reset, await asyncio.wait_for(stream.__anext__(), 5)
+
+        reset, chunk = asyncio.run(consume())
+        self.assertEqual(reset, 'id: 1\nevent: reset\ndata: {"missed": null}\n\n')
+        self.assertEqual(chunk, 'id: 2\nevent: metrics\ndata: [{"name": "loss", "value": 2.0}]\n\n')
+
+class TestPaginationAndCaching(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(app)
+        db = api.SessionLocal()
+        for model in (MetricModel, *api.ROLLUP_MODELS.values()):
+            db.query(model).delete()
+        db.commit()
+        db.close()
+        api.response_cache.invalidate()
+        # Several rows share a timestamp, so the id breaks ties between pages
+        metrics = [{"name": "latency", "value": float(i), "timestamp": f"2024-01-01T00:00:{i // 3:02d}"}
+                   for i in range(25)]
+        self.client.post("/metrics/batch", json=metrics)
+
+    def test_cursor_pages_cover_every_row_once(self):
+        values, cursor, pages = [], None, 0
+        while True:
+            params = {"limit": 10, **({"after": cursor} if cursor else {})}
+            response = self.client.get("/metrics/", params=params)
+            values.extend(metric["value"] for metric in response.json())
+            pages += 1
+            cursor = response.headers.get("x-next-cursor")
+            if cursor is None:
+                break
+        self.assertEqual(values, [float(i) for i in range(25)])
+        self.assertEqual(pages, 3)
+        self.assertEqual(self.client.get("/metrics/", params={"after": "garbage"}).status_code, 400)
+
+    def test_etag_revalidation_and_invalidation_on_ingest(self):
+        first = self.client.get("/metrics/aggregate/")
+        etag = first.headers["etag"]
+        unchanged = self.client.get("/metrics/aggregate/", headers={"If-None-Match": etag})
+        self.assertEqual(unchanged.status_code, 304)
+
+        self.client.post("/metrics/", json={"name": "latency", "value": 100.0, "timestamp": "2024-01-01T00:10:00"})
+        changed = self.client.get("/metrics/aggregate/", headers={"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["etag"], etag)
+        self.assertEqual(changed.json()["count"], 26)
+
+    def test_if_none_match_compares_whole_entity_tags(self):
+        etag = self.client.get("/metrics/aggregate/").headers["etag"]
+        for header in (f'"other", W/{etag}', "*", f"{etag}, \"other\""):
+            self.assertEqual(self.client.get("/metrics/aggregate/", headers={"If-None-Match": header}).status_code, 304)
+        # A tag containing the current one is a different tag
+        for header in (f'"x{etag[1:]}', f'{etag[:-1]}x"', etag[1:-1]):
+            self.assertEqual(self.client.get("/metrics/aggregate/", headers={"If-None-Match": header}).status_code, 200)
+
+class TestEngineOptions(unittest.TestCase):
+
+    def test_non_sqlite_url_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "SQLite"):
+            api.engine_options("postgresql://localhost/metrics")
+        self.assertIn("pool_size", api.engine_options("sqlite:///./metrics.db"))
+
+class TestLegacySchemaMigration(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite:///./legacy_metrics.db")
+        with self.engine.begin() as connection:
+            # The metrics table as created before timestamps were stored
+            connection.execute(text("CREATE TABLE metrics (id VARCHAR NOT NULL, name VARCHAR, value FLOAT, PRIMARY KEY (id))"))
+            connection.execute(text("INSERT INTO metrics VALUES ('a', 'latency', 10.0), ('b', 'latency', 30.0)"))
+
+    def tearDown(self):
+        self.engine.dispose()
+        os.remove("legacy_metrics.db")
+
+    def test_rows_are_copied_into_current_schema(self):
+        api.migrate_legacy_metrics(self.engine)
+        inspector = inspect(self.engine)
+        self.assertFalse(inspector.has_table("metrics_legacy"))
+        self.assertIn("timestamp", {column["name"] for column in inspector.get_columns("metrics")})
+        db = sessionmaker(bind=self.engine)()
+        self.assertEqual(sorted(metric.value for metric in db.query(MetricModel)), [10.0, 30.0])
+        rollup = db.query(api.MinuteRollupModel).one()
+        self.assertEqual((rollup.name, rollup.count, rollup.min_value, rollup.max_value), ("latency", 2, 10.0, 30.0))
+        db.close()
+        # Running again on the migrated database is a no-op
+        api.migrate_legacy_metrics(self.engine)
+        self.assertEqual(sessionmaker(bind=self.engine)().query(MetricModel).count(), 2)
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,16 @@
 // src/dashboard/frontend/static/script.js
 
+const API_BASE = "http://localhost:8000";
+// Metrics kept on screen; live updates push out the oldest
+const MAX_METRICS = 100;
+
+function renderMetric(metric) {
+    const metricDiv = document.createElement("div");
+    metricDiv.className = "metric";
+    metricDiv.innerHTML = `<h2>${metric.name}</h2><p>Value: ${metric.value}</p>`;
+    return metricDiv;
+}
+
 async function fetchMetrics() {
     const metricsContainer = document.getElementById("metrics");
     metricsContainer.innerHTML = "";  // Clear previous metrics
@@ -10,7 +21,7 @@ async function fetchMetrics() {
     metricsContainer.appendChild(loadingSpinner);
 
     try {
-        const response = await fetch("http://localhost:8000/api/v1/metrics/");
+        const response = await fetch(`${API_BASE}/api/v1/metrics/?limit=${MAX_METRICS}`);
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
@@ -20,12 +31,8 @@ async function fetchMetrics() {
         metricsContainer.removeChild(loadingSpinner);
 
         // Update the DOM with new metrics
-        metrics.forEach(metric => {
-            const metricDiv = document.createElement("div");
-            metricDiv.className = "metric";
-            metricDiv.innerHTML = `<h2>${metric.name}</h2><p>Value: ${metric.value}</p>`;
-            metricsContainer.appendChild(metricDiv);
-        });
+        metrics.forEach(metric => metricsContainer.appendChild(renderMetric(metric)));
+        filterMetrics();
     } catch (error) {
         console.error("Failed to fetch metrics:", error);
         metricsContainer.innerHTML = `<p class="error">Error fetching metrics: ${error.message}</p>`;
@@ -50,8 +57,29 @@ function filterMetrics() {
 // Set up event listener for filtering
 document.getElementById("filterInput").addEventListener("input", filterMetrics);
 
-// Fetch metrics every 5 seconds
-setInterval(fetchMetrics, 5000);
+// Append metrics pushed by the server instead of re-fetching the whole list
+function applyDelta(metrics) {
+    const metricsContainer = document.getElementById("metrics");
+    metrics.forEach(metric => metricsContainer.appendChild(renderMetric(metric)));
+    while (metricsContainer.children.length > MAX_METRICS) {
+        metricsContainer.removeChild(metricsContainer.firstChild);
+    }
+    filterMetrics();
+}
+
+function subscribeMetrics() {
+    const source = new EventSource(`${API_BASE}/stream/metrics`);
+    source.addEventListener("metrics", event => applyDelta(JSON.parse(event.data)));
+    // The server dropped updates for this client; reload the full view once
+    source.addEventListener("reset", fetchMetrics);
+    // EventSource reconnects by itself and resumes from the last event id
+    source.onerror = error => console.error("Metric stream interrupted:", error);
+}
 
-// Initial fetch
+// Initial fetch, then live updates (polling every 5 seconds without EventSource support)
 fetchMetrics();
+if (window.EventSource) {
+    subscribeMetrics();
+} else {
+    setInterval(fetchMetrics, 5000);
+}
@@ -1,8 +1,11 @@
 # entanglement/__init__.py
 
-from .entangler import create_entangled_pair, measure_entanglement
 from .entanglement_utils import normalize_state
-from .entanglement_visualization import visualize_entanglement
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.lazy_import import lazy_exports
+else:
+    from utils.lazy_import import lazy_exports
 
 __all__ = [
     "create_entangled_pair",
@@ -10,3 +13,10 @@ __all__ = [
     "normalize_state",
     "visualize_entanglement"
 ]
+
+# The entangler needs scipy and the plots matplotlib; both load on first use
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "create_entangled_pair": ".entangler",
+    "measure_entanglement": ".entangler",
+    "visualize_entanglement": ".entanglement_visualization",
+})
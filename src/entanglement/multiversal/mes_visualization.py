@@ -6,6 +6,11 @@ entanglement, and measurement results in a multiversal context.
 
 import numpy as np
 import matplotlib.pyplot as plt
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.downsampling import plot_series
+else:
+    from utils.downsampling import plot_series
 from qiskit.visualization import plot_bloch_multivector, plot_histogram
 
 def visualize_state_on_bloch_sphere(state_vector: np.ndarray):
@@ -57,7 +62,7 @@ def visualize_entanglement_entropy(entropy_values: list):
     Args:
         entropy_values (list): A list of entanglement entropy values to visualize.
     """
-    plt.plot(entropy_values, marker='o')
+    plot_series(plt.gca(), None, entropy_values, marker='o')
     plt.title("Entanglement Entropy Over States")
     plt.xlabel("State Index")
     plt.ylabel("Entanglement Entropy")
@@ -3,6 +3,11 @@ Visualization Utilities for Quantum Temporal Entanglement Processor (QTEP).
 """
 import numpy as np
 import matplotlib.pyplot as plt
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.downsampling import plot_series
+else:
+    from utils.downsampling import plot_series
 import seaborn as sns
 
 class QTEPVisualization:
@@ -37,7 +42,7 @@ class QTEPVisualization:
         time_steps = states.shape[0]
         plt.figure(figsize=(12, 8))
         for i in range(states.shape[1]):
-            plt.plot(range(time_steps), np.abs(states[:, i])**2, label=f'Qubit {i+1}')
+            plot_series(plt.gca(), None, np.abs(states[:, i])**2, label=f'Qubit {i+1}')
         
         plt.title(title)
         plt.xlabel("Time Steps")
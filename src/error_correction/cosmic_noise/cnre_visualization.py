@@ -3,6 +3,11 @@ Visualization Tools for Analyzing Noise and Mitigation Strategies in CNRE
 """
 import numpy as np
 import matplotlib.pyplot as plt
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.downsampling import plot_series
+else:
+    from utils.downsampling import plot_series
 from qiskit.visualization import plot_histogram, plot_state_qsphere
 from qiskit.quantum_info import Statevector
 
@@ -68,7 +73,7 @@ def plot_fidelity_over_epochs(fidelity_values, title='Fidelity Over Epochs'):
     fidelity_values (list of float): List of fidelity values over epochs.
     title (str): Title for the plot.
     """
-    plt.plot(fidelity_values, marker='o')
+    plot_series(plt.gca(), None, fidelity_values, marker='o')
     plt.title(title)
     plt.xlabel('Epochs')
     plt.ylabel('Fidelity')
@@ -83,7 +88,7 @@ def plot_error_rates(error_rates, title='Error Rates Over Time'):
     error_rates (list of float): List of error rates.
     title (str): Title for the plot.
     """
-    plt.plot(error_rates, marker='x', color='red')
+    plot_series(plt.gca(), None, error_rates, marker='x', color='red')
     plt.title(title)
     plt.xlabel('Time / Epochs')
     plt.ylabel('Error Rate')
@@ -3,6 +3,11 @@ Quantum Entropy Estimation for Network Stability.
 """
 import qiskit.quantum_info as qi
 import numpy as np
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.cache_memoize import cached
+else:
+    from utils.cache_memoize import cached
 
 class EntropyEstimator:
     def __init__(self, n_qubits: int):
@@ -14,6 +19,7 @@ class EntropyEstimator:
         """
         self.n_qubits = n_qubits
 
+    @cached(namespace="entropy.von_neumann", tiers=("memory",), key=lambda self, density_matrix: density_matrix)
     def estimate_von_neumann(self, density_matrix: np.ndarray) -> float:
         """
         Estimate the Von Neumann entropy of a quantum state.
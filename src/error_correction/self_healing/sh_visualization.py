@@ -1,6 +1,11 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import logging
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.downsampling import plot_series
+else:
+    from utils.downsampling import plot_series
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -18,11 +23,11 @@ def visualize_error_correction_process(error_rates, correction_success_rates=Non
     plt.figure(figsize=(12, 6))
     
     # Plot error rates
-    plt.plot(time_steps, error_rates, label='Error Rate', color='red', marker='o', linestyle='-', alpha=0.7)
+    plot_series(plt.gca(), time_steps, error_rates, label='Error Rate', color='red', marker='o', linestyle='-', alpha=0.7)
     
     # Plot correction success rates if provided
     if correction_success_rates is not None:
-        plt.plot(time_steps, correction_success_rates, label='Correction Success Rate', color='green', marker='x', linestyle='--', alpha=0.7)
+        plot_series(plt.gca(), time_steps, correction_success_rates, label='Correction Success Rate', color='green', marker='x', linestyle='--', alpha=0.7)
 
     plt.title("Error Correction Process")
     plt.xlabel("Time Steps")
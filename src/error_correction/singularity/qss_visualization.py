@@ -6,6 +6,11 @@ and results from anomaly detection.
 
 import numpy as np
 import matplotlib.pyplot as plt
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.downsampling import plot_series
+else:
+    from utils.downsampling import plot_series
 
 def visualize_quantum_state(state: np.ndarray, title: str = "Quantum State Visualization"):
     """
@@ -51,7 +56,7 @@ def visualize_anomaly_detection_results(results: list, title: str = "Anomaly Det
         title (str): The title of the plot.
     """
     plt.figure(figsize=(10, 5))
-    plt.plot(results, marker='o', linestyle='-', color='blue')
+    plot_series(plt.gca(), None, np.asarray(results, dtype=float), method='minmax', marker='o', linestyle='-', color='blue')
     plt.title(title)
     plt.xlabel("Sample Index")
     plt.ylabel("Anomaly Detected (1 = Yes, 0 = No)")
@@ -2,16 +2,30 @@
 
 import requests
 
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.http_client import HTTPClient
+else:
+    from utils.http_client import HTTPClient
+
 class ExternalAPI:
     """Class for interacting with external APIs."""
     
-    def __init__(self, base_url):
+    def __init__(self, base_url, client=None, timeout=(3.05, 10.0), max_retries=3):
         """Initializes the ExternalAPI with a base URL.
         
         Args:
             base_url (str): The base URL for the external API.
+            client (HTTPClient): Optional shared client. A pooled client bound
+                to ``base_url`` is created when omitted.
+            timeout (float or tuple): Request timeout used by the default client.
+            max_retries (int): Retry count used by the default client.
         """
         self.base_url = base_url
+        self.client = client or HTTPClient(base_url, timeout=timeout, max_retries=max_retries)
+
+    def _url(self, endpoint):
+        return f"{self.base_url}/{endpoint}"
 
     def get_data(self, endpoint):
         """Retrieves data from the specified endpoint.
@@ -25,9 +39,7 @@ class ExternalAPI:
         Raises:
             requests.RequestException: If the request fails.
         """
-        response = requests.get(f"{self.base_url}/{endpoint}")
-        response.raise_for_status()  # Raise an error for bad responses
-        return response.json()
+        return self.client.get(self._url(endpoint)).json()
 
     def post_data(self, endpoint, data):
         """Sends data to the specified endpoint.
@@ -42,9 +54,41 @@ class ExternalAPI:
         Raises:
             requests.RequestException: If the request fails.
         """
-        response = requests.post(f"{self.base_url}/{endpoint}", json=data)
-        response.raise_for_status()  # Raise an error for bad responses
-        return response.json()
+        return self.client.post(self._url(endpoint), json=data).json()
+
+    def get_many(self, endpoints):
+        """Retrieves data from several endpoints concurrently.
+        
+        Args:
+            endpoints (list): The API endpoints to retrieve data from.
+        
+        Returns:
+            list: The JSON responses, in the same order as ``endpoints``.
+        
+        Raises:
+            requests.RequestException: If any request fails.
+        """
+        responses = self.client.get_many([self._url(endpoint) for endpoint in endpoints])
+        return [response.json() for response in responses]
+
+    def post_many(self, items):
+        """Sends several payloads concurrently.
+        
+        Args:
+            items (list): ``(endpoint, data)`` pairs to send.
+        
+        Returns:
+            list: The JSON responses, in the same order as ``items``.
+        
+        Raises:
+            requests.RequestException: If any request fails.
+        """
+        responses = self.client.post_many([(self._url(endpoint), data) for endpoint, data in items])
+        return [response.json() for response in responses]
+
+    def close(self):
+        """Releases pooled connections held by the client."""
+        self.client.close()
 
 # Example usage
 if __name__ == "__main__":
@@ -55,5 +99,10 @@ if __name__ == "__main__":
         
         response = api.post_data("data_endpoint", {"key": "value"})
         print("Response from POST:", response)
+
+        batch = api.get_many(["data_endpoint", "status"])
+        print("Batch results:", batch)
     except requests.RequestException as e:
         print("An error occurred:", e)
+    finally:
+        api.close()
@@ -1,7 +1,18 @@
 import logging
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.metrics_registry import counter, histogram
+else:
+    from utils.metrics_registry import counter, histogram
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+_PATHS_FOUND = counter("quantumnet_path_searches_total", "Path searches by protocol and result.",
+                       {"protocol": "routing", "result": "found"})
+_PATHS_MISSING = counter("quantumnet_path_searches_total", "Path searches by protocol and result.",
+                         {"protocol": "routing", "result": "none"})
+_PATH_LATENCY = histogram("quantumnet_path_search_seconds", "Time to find a path between two nodes.",
+                          {"protocol": "routing"})
 
 class EntanglementRouting:
     def __init__(self):
@@ -11,7 +22,7 @@ class EntanglementRouting:
     def add_node(self, node):
         """Add a node to the network."""
         self.nodes.add(node)
-        logging.info(f"Node {node} added to the network.")
+        logger.info("Node %s added to the network.", node)
 
     def remove_node(self, node):
         """Remove a node from the network and its associated routes."""
@@ -19,9 +30,9 @@ class EntanglementRouting:
             self.nodes.remove(node)
             # Remove all routes associated with this node
             self.routes = {k: v for k, v in self.routes.items() if node not in k}
-            logging.info(f"Node {node} removed from the network.")
+            logger.info("Node %s removed from the network.", node)
         else:
-            logging.warning(f"Node {node} does not exist in the network.")
+            logger.warning("Node %s does not exist in the network.", node)
 
     def establish_route(self, node_a, node_b):
         """Establish an entanglement route between two nodes."""
@@ -29,16 +40,16 @@ class EntanglementRouting:
             raise ValueError("Both nodes must be part of the network.")
         self.routes[(node_a, node_b)] = True
         self.routes[(node_b, node_a)] = True  # Ensure bidirectional route
-        logging.info(f"Entanglement route established between {node_a} and {node_b}.")
+        logger.info("Entanglement route established between %s and %s.", node_a, node_b)
 
     def remove_route(self, node_a, node_b):
         """Remove an entanglement route between two nodes."""
         if (node_a, node_b) in self.routes:
             del self.routes[(node_a, node_b)]
             del self.routes[(node_b, node_a)]  # Ensure bidirectional removal
-            logging.info(f"Entanglement route removed between {node_a} and {node_b}.")
+            logger.info("Entanglement route removed between %s and %s.", node_a, node_b)
         else:
-            logging.warning(f"No route exists between {node_a} and {node_b}.")
+            logger.warning("No route exists between %s and %s.", node_a, node_b)
 
     def is_route_established(self, node_a, node_b):
         """Check if an entanglement route is established."""
@@ -46,6 +57,12 @@ class EntanglementRouting:
 
     def find_path(self, start_node, end_node, path=[]):
         """Find a path between two nodes using Depth-First Search (DFS)."""
+        with _PATH_LATENCY.time():
+            found = self._find_path(start_node, end_node, path)
+        (_PATHS_FOUND if found else _PATHS_MISSING).inc()
+        return found
+
+    def _find_path(self, start_node, end_node, path):
         path = path + [start_node]
         if start_node == end_node:
             return path
@@ -55,13 +72,14 @@ class EntanglementRouting:
             if start_node in node:
                 next_node = node[1] if node[0] == start_node else node[0]
                 if next_node not in path:
-                    new_path = self.find_path(next_node, end_node, path)
+                    new_path = self._find_path(next_node, end_node, path)
                     if new_path:
                         return new_path
         return None
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     routing = EntanglementRouting()
     routing.add_node('NodeA')
     routing.add_node('NodeB')
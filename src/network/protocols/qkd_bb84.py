@@ -1,8 +1,7 @@
 import numpy as np
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class BB84Protocol:
     def __init__(self, num_bits=10):
@@ -14,13 +13,13 @@ class BB84Protocol:
     def generate_random_bits(self, n):
         """Generate random bits for the sender."""
         bits = np.random.randint(0, 2, n)
-        logging.info(f"Generated random bits: {bits}")
+        logger.debug("Generated %d random bits: %s", n, bits)
         return bits
 
     def choose_bases(self, n):
         """Randomly choose measurement bases."""
         bases = np.random.choice(self.basis_choices, n)
-        logging.info(f"Chosen bases: {bases}")
+        logger.debug("Chosen bases: %s", bases)
         return bases
 
     def encode_bits(self, bits, bases):
@@ -31,7 +30,7 @@ class BB84Protocol:
                 encoded.append(bit)  # 0 or 1
             else:
                 encoded.append(bit ^ 1)  # 0 -> 1, 1 -> 0 (X basis)
-        logging.info(f"Encoded bits: {encoded}")
+        logger.debug("Encoded bits: %s", encoded)
         return encoded
 
     def measure_bits(self, encoded_bits, bases):
@@ -42,7 +41,7 @@ class BB84Protocol:
                 measured.append(bit)
             else:
                 measured.append(bit ^ 1)
-        logging.info(f"Measured bits: {measured}")
+        logger.debug("Measured bits: %s", measured)
         return measured
 
     def detect_eavesdropping(self, original_bases, measured_bases):
@@ -50,22 +49,22 @@ class BB84Protocol:
         discrepancies = sum(o != m for o, m in zip(original_bases, measured_bases))
         if discrepancies > 0:
             self.eavesdropper_detected = True
-            logging.warning("Eavesdropping detected!")
+            logger.warning("Eavesdropping detected! (%d basis discrepancies)", discrepancies)
         else:
-            logging.info("No eavesdropping detected.")
+            logger.debug("No eavesdropping detected.")
 
     def error_correction(self, key_bits):
         """Perform a simple error correction (placeholder)."""
         # In a real implementation, this would involve more complex error correction codes
         corrected_bits = key_bits  # Placeholder for actual error correction logic
-        logging.info(f"Corrected bits: {corrected_bits}")
+        logger.debug("Corrected bits: %s", corrected_bits)
         return corrected_bits
 
     def privacy_amplification(self, key_bits):
         """Perform privacy amplification to reduce eavesdropping information."""
         # Placeholder for privacy amplification logic
         amplified_key = key_bits[:len(key_bits) // 2]  # Simple example: halve the key length
-        logging.info(f"Amplified key: {amplified_key}")
+        logger.debug("Amplified key length: %d", len(amplified_key))
         return amplified_key
 
     def generate_key(self):
@@ -84,10 +83,12 @@ class BB84Protocol:
         # Perform privacy amplification
         self.key_bits = self.privacy_amplification(self.key_bits)
 
+        logger.info("Generated BB84 key of %d bits from %d raw bits", len(self.key_bits), self.num_bits)
         return self.key_bits
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     bb84 = BB84Protocol(num_bits=10)
     secret_key = bb84.generate_key()
     print("Generated Secret Key:", secret_key)
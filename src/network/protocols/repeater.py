@@ -1,7 +1,20 @@
 import logging
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.metrics_registry import counter, histogram
+else:
+    from utils.metrics_registry import counter, histogram
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+_PATHS_FOUND = counter("quantumnet_path_searches_total", "Path searches by protocol and result.",
+                       {"protocol": "repeater", "result": "found"})
+_PATHS_MISSING = counter("quantumnet_path_searches_total", "Path searches by protocol and result.",
+                         {"protocol": "repeater", "result": "none"})
+_PATH_LATENCY = histogram("quantumnet_path_search_seconds", "Time to find a path between two nodes.",
+                          {"protocol": "repeater"})
+_RELAYS_OK = counter("quantumnet_repeater_relays_total", "Relay attempts by result.", {"result": "ok"})
+_RELAYS_FAILED = counter("quantumnet_repeater_relays_total", "Relay attempts by result.", {"result": "failed"})
 
 class QuantumRepeater:
     def __init__(self):
@@ -11,7 +24,7 @@ class QuantumRepeater:
     def add_node(self, node):
         """Add a node to the repeater network."""
         self.nodes.add(node)
-        logging.info(f"Node {node} added to the repeater network.")
+        logger.info("Node %s added to the repeater network.", node)
 
     def remove_node(self, node):
         """Remove a node from the network and its associated entangled pairs."""
@@ -19,9 +32,9 @@ class QuantumRepeater:
             self.nodes.remove(node)
             # Remove all entangled pairs associated with this node
             self.entangled_pairs = {k: v for k, v in self.entangled_pairs.items() if node not in k}
-            logging.info(f"Node {node} removed from the repeater network.")
+            logger.info("Node %s removed from the repeater network.", node)
         else:
-            logging.warning(f"Node {node} does not exist in the network.")
+            logger.warning("Node %s does not exist in the network.", node)
 
     def create_entangled_pair(self, node_a, node_b):
         """Create an entangled pair between two nodes."""
@@ -29,28 +42,36 @@ class QuantumRepeater:
             raise ValueError("Both nodes must be part of the network.")
         self.entangled_pairs[(node_a, node_b)] = True
         self.entangled_pairs[(node_b, node_a)] = True  # Ensure bidirectional entanglement
-        logging.info(f"Entangled pair created between {node_a} and {node_b}.")
+        logger.info("Entangled pair created between %s and %s.", node_a, node_b)
 
     def remove_entangled_pair(self, node_a, node_b):
         """Remove an entangled pair between two nodes."""
         if (node_a, node_b) in self.entangled_pairs:
             del self.entangled_pairs[(node_a, node_b)]
             del self.entangled_pairs[(node_b, node_a)]  # Ensure bidirectional removal
-            logging.info(f"Entangled pair removed between {node_a} and {node_b}.")
+            logger.info("Entangled pair removed between %s and %s.", node_a, node_b)
         else:
-            logging.warning(f"No entangled pair exists between {node_a} and {node_b}.")
+            logger.warning("No entangled pair exists between %s and %s.", node_a, node_b)
 
     def relay(self, node_a, node_b):
         """Relay quantum information between two nodes using entanglement."""
         if (node_a, node_b) in self.entangled_pairs:
-            logging.info(f"Relaying information from {node_a} to {node_b}.")
+            logger.debug("Relaying information from %s to %s.", node_a, node_b)
+            _RELAYS_OK.inc()
             return True  # Indicate successful relay
         else:
-            logging.warning(f"Failed to relay information from {node_a} to {node_b}. No entangled pair exists.")
+            logger.warning("Failed to relay information from %s to %s. No entangled pair exists.", node_a, node_b)
+            _RELAYS_FAILED.inc()
             return False  # Indicate failure to relay
 
     def find_path(self, start_node, end_node, path=[]):
         """Find a path between two nodes using Depth-First Search (DFS)."""
+        with _PATH_LATENCY.time():
+            found = self._find_path(start_node, end_node, path)
+        (_PATHS_FOUND if found else _PATHS_MISSING).inc()
+        return found
+
+    def _find_path(self, start_node, end_node, path):
         path = path + [start_node]
         if start_node == end_node:
             return path
@@ -60,13 +81,14 @@ class QuantumRepeater:
             if start_node in (node_a, node_b):
                 next_node = node_b if node_a == start_node else node_a
                 if next_node not in path:
-                    new_path = self.find_path(next_node, end_node, path)
+                    new_path = self._find_path(next_node, end_node, path)
                     if new_path:
                         return new_path
         return None
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     repeater = QuantumRepeater()
     repeater.add_node('NodeA')
     repeater.add_node('NodeB')
@@ -1,5 +1,10 @@
 import numpy as np
 import matplotlib.pyplot as plt
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.downsampling import plot_series
+else:
+    from utils.downsampling import plot_series
 from mpl_toolkits.mplot3d import Axes3D
 
 def plot_bloch_sphere(state_vector):
@@ -51,13 +56,13 @@ def plot_training_results(epochs, accuracy, loss):
     # Plot accuracy
     ax1.set_xlabel('Epochs')
     ax1.set_ylabel('Accuracy', color='tab:blue')
-    ax1.plot(epochs, accuracy, color='tab:blue', label='Accuracy')
+    plot_series(ax1, epochs, accuracy, color='tab:blue', label='Accuracy')
     ax1.tick_params(axis='y', labelcolor='tab:blue')
 
     # Create a second y-axis for loss
     ax2 = ax1.twinx()
     ax2.set_ylabel('Loss', color='tab:red')
-    ax2.plot(epochs, loss, color='tab:red', label='Loss')
+    plot_series(ax2, epochs, loss, color='tab:red', label='Loss')
     ax2.tick_params(axis='y', labelcolor='tab:red')
 
     plt.title('Training Results')
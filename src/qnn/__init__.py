@@ -1,5 +1,22 @@
 # src/qnn/__init__.py
 
-from .state_predictor import QuantumStatePredictor
-from .qnn_utils import preprocess_data, postprocess_results
-from .qnn_visualization import visualize_predictions
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.lazy_import import lazy_exports
+else:
+    from utils.lazy_import import lazy_exports
+
+__all__ = [
+    "QuantumStatePredictor",
+    "preprocess_data",
+    "postprocess_results",
+    "visualize_predictions"
+]
+
+# Everything here depends on qiskit or plotting libraries, so nothing is imported up front
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "QuantumStatePredictor": ".state_predictor",
+    "preprocess_data": ".qnn_utils",
+    "postprocess_results": ".qnn_utils",
+    "visualize_predictions": ".qnn_visualization",
+})
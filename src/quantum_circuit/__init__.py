@@ -2,7 +2,11 @@
 
 from .circuit import QuantumCircuit
 from .gate_operations import apply_gate, apply_circuit
-from .circuit_visualization import visualize_circuit
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.lazy_import import lazy_exports
+else:
+    from utils.lazy_import import lazy_exports
 
 __all__ = [
     "QuantumCircuit",
@@ -10,3 +14,8 @@ __all__ = [
     "apply_circuit",
     "visualize_circuit"
 ]
+
+# Circuit drawing needs matplotlib; import it on first use
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "visualize_circuit": ".circuit_visualization",
+})
@@ -1,6 +1,15 @@
 # quantum_circuit/circuit.py
 
 import numpy as np
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.metrics_registry import counter, histogram
+else:
+    from utils.metrics_registry import counter, histogram
+
+_CIRCUIT_RUNS = counter("quantumnet_circuit_executions_total", "Circuits applied to a state vector.")
+_CIRCUIT_GATES = counter("quantumnet_circuit_gates_total", "Gates applied during circuit execution.")
+_CIRCUIT_LATENCY = histogram("quantumnet_circuit_execution_seconds", "Time to apply a whole circuit.")
 
 class QuantumCircuit:
     """Class representing a quantum circuit."""
@@ -48,8 +57,11 @@ class QuantumCircuit:
         Returns:
             np.ndarray: The resulting state vector after applying the circuit.
         """
-        for gate, qubits in self.gates:
-            state = self.apply_gate(state, gate, qubits)
+        with _CIRCUIT_LATENCY.time():
+            for gate, qubits in self.gates:
+                state = self.apply_gate(state, gate, qubits)
+        _CIRCUIT_RUNS.inc()
+        _CIRCUIT_GATES.inc(len(self.gates))
         return state
 
     def apply_gate(self, state, gate, qubits):
@@ -2,10 +2,19 @@
 
 from .state_vector import StateVector
 from .density_matrix import DensityMatrix
-from .state_visualization import visualize_state
+# Packages imported as src.<package> (as their tests do) reach utils as src.utils
+if __name__.startswith("src."):
+    from src.utils.lazy_import import lazy_exports
+else:
+    from utils.lazy_import import lazy_exports
 
 __all__ = [
     "StateVector",
     "DensityMatrix",
     "visualize_state"
 ]
+
+# Plotting pulls in matplotlib, so it is only imported when first used
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "visualize_state": ".state_visualization",
+})
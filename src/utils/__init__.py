@@ -1,17 +1,26 @@
 # utils/__init__.py
 
-from .logger import setup_logger
+from .logger import setup_logger, configure_logging, throttle_logger
 from .config import ConfigManager
 from .math_utils import complex_to_polar, polar_to_complex
 from .file_utils import read_json, write_json
 from .performance_monitor import PerformanceMonitor
+from .lazy_import import lazy_exports
 
 __all__ = [
     "setup_logger",
+    "configure_logging",
+    "throttle_logger",
     "ConfigManager",
     "complex_to_polar",
     "polar_to_complex",
     "read_json",
     "write_json",
-    "PerformanceMonitor"
+    "PerformanceMonitor",
+    "HTTPClient"
 ]
+
+# HTTPClient needs requests, which most users of utils never touch
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "HTTPClient": ".http_client",
+})
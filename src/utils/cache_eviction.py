@@ -0,0 +1,433 @@
+# src/utils/cache_eviction.py
+"""
+Eviction policies for the in-memory tier of the QuantumNet-Core cache manager.
+Every policy tracks keys only and decides which ones leave the cache in O(1)
+or O(log n) amortized time. Includes a trace-replay harness for comparing hit rates.
+"""
+import heapq
+import itertools
+import random
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+
+class EvictionPolicy:
+    """
+    Base class for capacity-bounded eviction policies.
+    Subclasses implement ``_add``, ``_pop_victim``, ``access`` and ``remove``.
+    """
+    name = "base"
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the policy.
+
+        Args:
+            capacity (int): Maximum number of keys to retain.
+        """
+        if capacity < 1:
+            raise ValueError("Eviction policy capacity must be at least 1.")
+        self.capacity = capacity
+
+    def insert(self, key: Hashable, fidelity: float = 1.0) -> List[Hashable]:
+        """
+        Track a key, evicting others as needed to stay within capacity.
+
+        Args:
+            key (Hashable): Key being stored.
+            fidelity (float): Fidelity score of the stored value.
+
+        Returns:
+            List[Hashable]: Keys that must be dropped from the cache. May include
+            ``key`` itself when an admission policy rejects it.
+        """
+        if key in self:
+            self._update(key, fidelity)
+            return []
+        victims = []
+        while len(self) >= self.capacity:
+            victims.append(self._pop_victim())
+        self._add(key, fidelity)
+        return victims
+
+    def miss(self, key: Hashable) -> None:
+        """Record a lookup of a key that is not cached. No-op by default."""
+
+    def evict(self) -> Optional[Hashable]:
+        """
+        Drop the policy's current victim, e.g. to free space under a byte budget.
+
+        Returns:
+            Optional[Hashable]: Evicted key, or None if nothing is tracked.
+        """
+        if not len(self):
+            return None
+        return self._pop_victim()
+
+    def _update(self, key: Hashable, fidelity: float) -> None:
+        self.access(key)
+
+    def _add(self, key: Hashable, fidelity: float) -> None:
+        raise NotImplementedError
+
+    def _pop_victim(self) -> Hashable:
+        raise NotImplementedError
+
+    def access(self, key: Hashable) -> None:
+        """Record a cache hit on a tracked key."""
+        raise NotImplementedError
+
+    def remove(self, key: Hashable) -> None:
+        """Stop tracking a key. Unknown keys are ignored."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Forget every tracked key."""
+        raise NotImplementedError
+
+    def __contains__(self, key: Hashable) -> bool:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class LRUPolicy(EvictionPolicy):
+    """Least-recently-used eviction on an OrderedDict."""
+    name = "lru"
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._order = OrderedDict()
+
+    def _add(self, key, fidelity):
+        self._order[key] = None
+
+    def _pop_victim(self):
+        return self._order.popitem(last=False)[0]
+
+    def access(self, key):
+        self._order.move_to_end(key)
+
+    def remove(self, key):
+        self._order.pop(key, None)
+
+    def clear(self):
+        self._order.clear()
+
+    def __contains__(self, key):
+        return key in self._order
+
+    def __len__(self):
+        return len(self._order)
+
+
+class LFUPolicy(EvictionPolicy):
+    """
+    Least-frequently-used eviction with O(1) frequency buckets.
+    Ties within a frequency are broken by recency (oldest first).
+    """
+    name = "lfu"
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._freq: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, OrderedDict] = {}
+        self._min_freq = 0
+
+    def _add(self, key, fidelity):
+        self._freq[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+
+    def _unlink(self, key, freq):
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+
+    def _pop_victim(self):
+        # _min_freq can only go stale through remove(); recover from that rare case
+        if self._min_freq not in self._buckets:
+            self._min_freq = min(self._buckets)
+        bucket = self._buckets[self._min_freq]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min_freq]
+        del self._freq[key]
+        return key
+
+    def access(self, key):
+        freq = self._freq[key]
+        self._unlink(key, freq)
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def remove(self, key):
+        freq = self._freq.pop(key, None)
+        if freq is None:
+            return
+        self._unlink(key, freq)
+
+    def clear(self):
+        self._freq.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+    def __contains__(self, key):
+        return key in self._freq
+
+    def __len__(self):
+        return len(self._freq)
+
+
+class FidelityWeightedPolicy(EvictionPolicy):
+    """
+    Evicts the key with the lowest ``fidelity + access_weight * access_count``.
+    Scores live in a min-heap; updates push a new entry and stale ones are
+    discarded lazily when they surface, giving O(log n) amortized operations.
+    """
+    name = "fidelity"
+
+    def __init__(self, capacity: int, access_weight: float = 0.1):
+        super().__init__(capacity)
+        self.access_weight = access_weight
+        self._entries: Dict[Hashable, List] = {}  # key -> [fidelity, access_count, version]
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._versions = itertools.count()
+
+    def _push(self, key, entry):
+        entry[2] = next(self._versions)
+        heapq.heappush(self._heap, (entry[0] + self.access_weight * entry[1], entry[2], key))
+        # Compact once stale entries dominate so the heap stays O(n)
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(e[0] + self.access_weight * e[1], e[2], k) for k, e in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def _add(self, key, fidelity):
+        entry = [fidelity, 1, 0]
+        self._entries[key] = entry
+        self._push(key, entry)
+
+    def _update(self, key, fidelity):
+        entry = self._entries[key]
+        entry[0] = fidelity
+        entry[1] += 1
+        self._push(key, entry)
+
+    def _pop_victim(self):
+        while True:
+            _, version, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] == version:
+                del self._entries[key]
+                return key
+
+    def access(self, key):
+        entry = self._entries[key]
+        entry[1] += 1
+        self._push(key, entry)
+
+    def remove(self, key):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+        self._heap.clear()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CountMinSketch:
+    """
+    Compact frequency estimator with 4-bit saturating counters and periodic aging.
+    Counts are halved every ``sample_size`` increments so old popularity decays.
+    """
+    def __init__(self, capacity: int, depth: int = 4):
+        width = 1
+        while width < max(capacity, 16):
+            width <<= 1
+        self._mask = width - 1
+        self._rows = [bytearray(width) for _ in range(depth)]
+        self._seeds = [random.getrandbits(64) | 1 for _ in range(depth)]
+        self.sample_size = 10 * capacity
+        self._additions = 0
+
+    def _indexes(self, key):
+        h = hash(key)
+        return [((h ^ seed) * 0x9E3779B97F4A7C15 >> 17) & self._mask for seed in self._seeds]
+
+    def increment(self, key: Hashable) -> None:
+        for row, i in zip(self._rows, self._indexes(key)):
+            if row[i] < 15:
+                row[i] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._reset()
+
+    def estimate(self, key: Hashable) -> int:
+        return min(row[i] for row, i in zip(self._rows, self._indexes(key)))
+
+    def _reset(self):
+        for row in self._rows:
+            for i, count in enumerate(row):
+                if count:
+                    row[i] = count >> 1
+        self._additions //= 2
+
+
+class WTinyLFUPolicy(EvictionPolicy):
+    """
+    Window TinyLFU: a small LRU admission window in front of a segmented LRU
+    main cache. Keys leaving the window only enter the main cache if the
+    frequency sketch rates them above the main cache's eviction victim.
+    """
+    name = "tinylfu"
+
+    def __init__(self, capacity: int, window_ratio: float = 0.01, protected_ratio: float = 0.8):
+        super().__init__(capacity)
+        # The main cache always gets at least one slot; a one-entry policy has no window
+        self.window_capacity = min(max(1, int(capacity * window_ratio)), capacity - 1)
+        self.main_capacity = capacity - self.window_capacity
+        self.protected_capacity = int(self.main_capacity * protected_ratio)
+        self.sketch = CountMinSketch(capacity)
+        self._window = OrderedDict()
+        self._probation = OrderedDict()
+        self._protected = OrderedDict()
+        # Keys counted by miss() and not yet inserted, so a miss followed by its fill counts once
+        self._missed = OrderedDict()
+
+    def insert(self, key, fidelity=1.0):
+        if key in self:
+            self.access(key)
+            return []
+        if key in self._missed:
+            del self._missed[key]
+        else:
+            self.sketch.increment(key)
+        self._window[key] = None
+        if len(self._window) <= self.window_capacity:
+            return []
+
+        candidate, _ = self._window.popitem(last=False)
+        if len(self._probation) + len(self._protected) < self.main_capacity:
+            self._probation[candidate] = None
+            return []
+        main = self._probation if self._probation else self._protected
+        victim = next(iter(main))
+        if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+            del main[victim]
+            self._probation[candidate] = None
+            return [victim]
+        return [candidate]
+
+    def miss(self, key):
+        self.sketch.increment(key)
+        self._missed[key] = None
+        self._missed.move_to_end(key)
+        if len(self._missed) > self.capacity:
+            self._missed.popitem(last=False)
+
+    def evict(self):
+        for segment in (self._probation, self._protected, self._window):
+            if segment:
+                return segment.popitem(last=False)[0]
+        return None
+
+    def access(self, key):
+        self.sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self.protected_capacity:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+
+    def remove(self, key):
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                del segment[key]
+                return
+
+    def clear(self):
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self._missed.clear()
+
+    def __contains__(self, key):
+        return key in self._window or key in self._probation or key in self._protected
+
+    def __len__(self):
+        return len(self._window) + len(self._probation) + len(self._protected)
+
+
+EVICTION_POLICIES = {
+    policy.name: policy
+    for policy in (LRUPolicy, LFUPolicy, FidelityWeightedPolicy, WTinyLFUPolicy)
+}
+
+
+def make_eviction_policy(policy: Union[str, type, EvictionPolicy], capacity: int) -> EvictionPolicy:
+    """
+    Build an eviction policy by name or class, or pass through an existing instance.
+
+    Args:
+        policy (Union[str, type, EvictionPolicy]): Policy name ("lru", "lfu", "fidelity", "tinylfu"),
+            EvictionPolicy subclass or instance.
+        capacity (int): Maximum number of keys to retain.
+
+    Returns:
+        EvictionPolicy: Ready-to-use policy.
+    """
+    if isinstance(policy, EvictionPolicy):
+        return policy
+    if isinstance(policy, type) and issubclass(policy, EvictionPolicy):
+        return policy(capacity)
+    try:
+        return EVICTION_POLICIES[policy](capacity)
+    except KeyError:
+        raise ValueError(f"Unknown eviction policy {policy!r}. "
+                         f"Expected one of {sorted(EVICTION_POLICIES)}.") from None
+
+
+def simulate_hit_rates(
+    trace: Iterable[Union[Hashable, Tuple[Hashable, float]]],
+    capacity: int,
+    policies: Optional[Iterable[str]] = None
+) -> Dict[str, float]:
+    """
+    Replay a key trace against each policy and report the hit rate.
+
+    Args:
+        trace (Iterable): Keys, or (key, fidelity) pairs, in access order.
+        capacity (int): Cache capacity in entries.
+        policies (Optional[Iterable[str]]): Policy names to compare. Defaults to all.
+
+    Returns:
+        Dict[str, float]: Hit rate per policy name.
+    """
+    trace = [item if isinstance(item, tuple) else (item, 1.0) for item in trace]
+    results = {}
+    for name in policies or EVICTION_POLICIES:
+        policy = make_eviction_policy(name, capacity)
+        hits = 0
+        for key, fidelity in trace:
+            if key in policy:
+                policy.access(key)
+                hits += 1
+            else:
+                policy.miss(key)
+                policy.insert(key, fidelity)
+        results[name] = hits / max(len(trace), 1)
+    return results
@@ -0,0 +1,128 @@
+# src/utils/cache_filters.py
+"""
+Membership filters that let the QuantumNet-Core cache manager answer definite
+misses without touching Redis or SQLite: a Bloom filter over the keys stored on
+disk and a short-lived negative cache for keys recently found absent.
+"""
+import hashlib
+import math
+import threading
+import time
+from typing import Dict, Hashable, Iterable
+
+
+class BloomFilter:
+    """
+    Bit-array Bloom filter sized for a target false-positive rate.
+    ``add`` is serialized by a lock; ``__contains__`` is lock-free, so a key being
+    added concurrently may briefly test absent, but a completed add never does.
+    """
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        """
+        Initialize the BloomFilter.
+
+        Args:
+            capacity (int): Expected number of distinct keys.
+            error_rate (float): Target false-positive rate at ``capacity`` keys.
+        """
+        if capacity < 1:
+            raise ValueError("Bloom filter capacity must be at least 1.")
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error_rate must be between 0 and 1.")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+        self.count = 0  # Keys that set at least one new bit
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str) -> bool:
+        """
+        Insert a key.
+
+        Returns:
+            bool: False if the key was (probably) already present.
+        """
+        positions = self._positions(key)
+        added = False
+        with self._lock:
+            for pos in positions:
+                mask = 1 << (pos & 7)
+                if not self._bits[pos >> 3] & mask:
+                    self._bits[pos >> 3] |= mask
+                    added = True
+            if added:
+                self.count += 1
+        return added
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Insert several keys."""
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def estimated_fp_rate(self) -> float:
+        """Theoretical false-positive rate at the current fill: (1 - e^(-kn/m))^k."""
+        return (1.0 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+
+class NegativeCache:
+    """
+    Remembers recently missed keys for a short TTL, bounded to ``max_entries``
+    (oldest entries are dropped first). Lookups are lock-free dict reads.
+    """
+    def __init__(self, ttl: float = 1.0, max_entries: int = 100_000):
+        """
+        Initialize the NegativeCache.
+
+        Args:
+            ttl (float): Seconds a recorded miss stays valid.
+            max_entries (int): Maximum number of remembered misses.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def add(self, key: Hashable) -> None:
+        """Record a definite miss for ``key``."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = time.monotonic() + self.ttl
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+    def discard(self, key: Hashable) -> None:
+        """Forget a recorded miss, e.g. because the key was just written."""
+        if key in self._entries:
+            with self._lock:
+                self._entries.pop(key, None)
+
+    def __contains__(self, key: Hashable) -> bool:
+        expires = self._entries.get(key)
+        # Expired entries are left in place; the size bound or the next add() replaces them
+        if expires is None or expires <= time.monotonic():
+            return False
+        self.hits += 1
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -5,25 +5,223 @@ Provides persistent, distributed, and quantum-optimized caching for quantum stat
 circuit parameters, optimization results, and network metadata.
 Features thread-safe operations, adaptive eviction, quantum compression, and encryption.
 """
-import sqlite3
 import redis
 import numpy as np
-import pennylane as qml
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 import threading
-import pickle
 import json
 import time
 import logging
 import hashlib
+import base64
 import os
-from cryptography.fernet import Fernet
-from collections import OrderedDict
-
-# Configure logging for cache operations
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+import functools
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from .cache_storage import SQLiteStore
+from .cache_eviction import EvictionPolicy, make_eviction_policy
+from .single_flight import SingleFlight
+from .cache_serialization import CacheSerializer
+from .cache_filters import NegativeCache
+from .state_compression import COMPRESSION_MODES, CompressedState, compress_state
+from .metrics_registry import counter, histogram
+
+# Per-operation messages are DEBUG; the application configures handlers (see utils.logger)
 logger = logging.getLogger(__name__)
 
+# Version byte prefixed to AES-GCM ciphertexts; Fernet tokens always start with b"g"
+_AESGCM_VERSION = b"\x01"
+
+CACHE_TIERS = frozenset({"memory", "redis", "sqlite"})
+
+# Process-wide metrics, summed over all cache managers (see utils.metrics_registry)
+_CACHE_HITS = counter("quantumnet_cache_lookups_total", "Cache key lookups by result.", {"result": "hit"})
+_CACHE_MISSES = counter("quantumnet_cache_lookups_total", "Cache key lookups by result.", {"result": "miss"})
+_CACHE_OPERATIONS = counter("quantumnet_cache_operations_total", "Cache get/put calls, batched calls count once.")
+_CACHE_LATENCY = histogram("quantumnet_cache_operation_seconds", "Latency of cache get/put calls.")
+_CACHE_BYTES = {tier: counter("quantumnet_cache_bytes_written_total", "Serialized bytes written per storage tier.",
+                              {"tier": tier}) for tier in CACHE_TIERS}
+
+def _sweep_shards(shards: List["_CacheShard"]) -> None:
+    """Drop expired entries from every in-memory shard (run by the SQLite maintenance thread)."""
+    now = time.time()
+    for shard in shards:
+        shard.sweep_expired(now)
+
+class _MemoryBudget:
+    """
+    Byte budget shared by all shards of the in-memory tier.
+    A shard that goes over it evicts its own victims first; if that is not enough
+    (e.g. one large entry in a nearly empty shard), ``reclaim`` evicts from the
+    fullest other shards, taking one shard lock at a time.
+    """
+    __slots__ = ("limit", "used", "lock", "shards")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self.lock = threading.Lock()
+        self.shards: List["_CacheShard"] = []
+
+    def add(self, size: int) -> None:
+        with self.lock:
+            self.used += size
+
+    @property
+    def over(self) -> bool:
+        return self.used > self.limit
+
+    def reclaim(self, origin: "_CacheShard") -> None:
+        """Evict from shards other than ``origin``, fullest first, until the budget holds."""
+        while self.over:
+            others = sorted((shard for shard in self.shards if shard is not origin and shard.bytes),
+                            key=lambda shard: shard.bytes, reverse=True)
+            if not any(shard.evict_one() for shard in others[:1]):
+                break
+
+class _CacheShard:
+    """
+    One lock-striped partition of the in-memory tier.
+    Lookups read the dict without locking; only structural updates take the shard lock.
+    Entries are (value, fidelity, timestamp, access_count, size_bytes, expires_at) tuples.
+    """
+    __slots__ = ("lock", "entries", "policy", "evictions", "expirations", "bytes", "budget")
+
+    def __init__(self, policy: EvictionPolicy, budget: Optional[_MemoryBudget] = None):
+        self.lock = threading.Lock()
+        self.entries: Dict[str, tuple] = {}
+        self.policy = policy
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+        self.budget = budget
+
+    def lookup(self, cache_key: str) -> Optional[tuple]:
+        """Return the live entry for a key, recording the access if the shard is uncontended."""
+        entry = self.entries.get(cache_key)
+        expired = entry is not None and entry[5] is not None and entry[5] <= time.time()
+        # Recency/frequency bookkeeping is best-effort: skip it rather than wait for the lock
+        if self.lock.acquire(blocking=False):
+            try:
+                if entry is None or expired:
+                    if expired and self.entries.get(cache_key) is entry:
+                        self.policy.remove(cache_key)
+                        self._drop_locked(cache_key)
+                        self.expirations += 1
+                    self.policy.miss(cache_key)
+                elif self.entries.get(cache_key) is entry:
+                    # Only the entry read above is updated; a put since then must not be undone
+                    self.policy.access(cache_key)
+                    self.entries[cache_key] = entry[:3] + (entry[3] + 1,) + entry[4:]
+            finally:
+                self.lock.release()
+        return None if expired else entry
+
+    def admit(self, cache_key: str, entry: tuple, replace: bool = True) -> None:
+        """
+        Store an entry, dropping whatever the eviction policy selects.
+        With ``replace=False`` an entry already present is kept, so a promotion
+        from a slow tier never overwrites a newer put.
+        """
+        with self.lock:
+            self._admit_locked(cache_key, entry, replace)
+        if self.budget is not None and self.budget.over:
+            self.budget.reclaim(self)
+
+    def admit_many(self, items: Iterable[Tuple[str, tuple]], replace: bool = True) -> None:
+        """Store several entries under a single lock acquisition."""
+        with self.lock:
+            for cache_key, entry in items:
+                self._admit_locked(cache_key, entry, replace)
+        if self.budget is not None and self.budget.over:
+            self.budget.reclaim(self)
+
+    def evict_one(self) -> bool:
+        """Drop the policy's current victim to free bytes for another shard."""
+        with self.lock:
+            evict_key = self.policy.evict()
+            if evict_key is None:
+                return False
+            self._drop_locked(evict_key)
+            self.evictions += 1
+        logger.debug("Evicted %s from in-memory cache (shared byte budget)", evict_key)
+        return True
+
+    def fill(self, items: Iterable[Tuple[str, tuple]]) -> int:
+        """
+        Store entries only while there is free capacity, never evicting or replacing.
+        Used by warm-up so earlier (hotter) entries win over later ones.
+
+        Returns:
+            int: Number of entries stored.
+        """
+        stored = 0
+        with self.lock:
+            for cache_key, entry in items:
+                if cache_key in self.entries or len(self.policy) >= self.policy.capacity:
+                    continue
+                if self.budget is not None and self.budget.used + entry[4] > self.budget.limit:
+                    continue
+                self._admit_locked(cache_key, entry, replace=False)
+                stored += cache_key in self.entries
+        return stored
+
+    def _drop_locked(self, cache_key: str) -> None:
+        entry = self.entries.pop(cache_key, None)
+        if entry is not None:
+            self.bytes -= entry[4]
+            if self.budget is not None:
+                self.budget.add(-entry[4])
+
+    def _admit_locked(self, cache_key: str, entry: tuple, replace: bool) -> None:
+        if not replace and cache_key in self.entries:
+            return
+        if self.budget is not None and entry[4] > self.budget.limit:
+            # Too large to ever fit; make sure an older value is not served instead
+            self.policy.remove(cache_key)
+            self._drop_locked(cache_key)
+            return
+        for evict_key in self.policy.insert(cache_key, entry[1]):
+            self._drop_locked(evict_key)
+            self.evictions += 1
+            logger.debug("Evicted %s from in-memory cache", evict_key)
+        if cache_key not in self.policy:
+            return
+        self._drop_locked(cache_key)
+        self.entries[cache_key] = entry
+        self.bytes += entry[4]
+        if self.budget is None:
+            return
+        self.budget.add(entry[4])
+        # Own victims first, but never down to just the new entry; reclaim() covers the rest
+        while self.budget.over and len(self.entries) > (cache_key in self.entries):
+            evict_key = self.policy.evict()
+            if evict_key is None:
+                break
+            self._drop_locked(evict_key)
+            self.evictions += 1
+            logger.debug("Evicted %s from in-memory cache (byte budget)", evict_key)
+
+    def sweep_expired(self, now: float) -> int:
+        """Remove every entry whose TTL has passed and return how many were dropped."""
+        with self.lock:
+            expired = [key for key, entry in self.entries.items()
+                       if entry[5] is not None and entry[5] <= now]
+            for cache_key in expired:
+                self.policy.remove(cache_key)
+                self._drop_locked(cache_key)
+            self.expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.policy.clear()
+            if self.budget is not None:
+                self.budget.add(-self.bytes)
+            self.bytes = 0
+
 class QuantumCacheManager:
     """
     Advanced cache manager for QuantumNet-Core with quantum-specific optimizations.
@@ -33,113 +231,201 @@ class QuantumCacheManager:
     def __init__(
         self,
         db_path: str = "quantum_cache.db",
-        redis_host: str = "localhost",
+        redis_host: Optional[str] = "localhost",
         redis_port: int = 6379,
         cache_size_limit: int = 1000,
-        encryption_key: Optional[bytes] = None
+        encryption_key: Optional[bytes] = None,
+        durability: str = "write_behind",
+        flush_interval: float = 0.05,
+        eviction_policy: Union[str, EvictionPolicy] = "fidelity",
+        num_shards: int = 16,
+        compression: Optional[str] = "zlib",
+        compress_threshold: int = 4096,
+        memory_budget_bytes: Optional[int] = None,
+        disk_budget_bytes: Optional[int] = None,
+        default_ttl: Optional[float] = None,
+        namespace_ttls: Optional[Mapping[str, float]] = None,
+        redis_ttl: Optional[float] = 3600,
+        maintenance_interval: Optional[float] = 30.0,
+        bloom_filter: bool = True,
+        negative_cache_ttl: float = 1.0,
+        warm_up: bool = False,
+        warm_up_limit: Optional[int] = None,
+        state_compression: str = "auto",
+        target_fidelity: float = 0.99
     ):
         """
         Initialize the QuantumCacheManager.
 
         Args:
             db_path (str): Path to SQLite database for persistent storage.
-            redis_host (str): Host for Redis distributed cache.
+            redis_host (Optional[str]): Host for Redis distributed cache. None disables the Redis tier.
             redis_port (int): Port for Redis distributed cache.
             cache_size_limit (int): Maximum number of entries in in-memory cache.
-            encryption_key (Optional[bytes]): Key for AES-256 encryption. If None, generated automatically.
+            encryption_key (Optional[bytes]): Fernet-format key (urlsafe base64, 32 bytes) used for
+                AES-256-GCM encryption of SQLite rows. If None, a new key is generated for this
+                instance, and rows it writes cannot be read after a restart (they are discarded as
+                misses). Pass a stable key to reuse the SQLite tier across restarts.
+            durability (str): SQLite durability mode: "write_behind" (batched background flushes),
+                "write_through" (commit per put) or "full" (commit per put with synchronous=FULL).
+            flush_interval (float): Seconds between write-behind flushes.
+            eviction_policy (Union[str, EvictionPolicy]): In-memory eviction policy: "fidelity"
+                (lowest fidelity + 0.1 * access_count first), "lru", "lfu", "tinylfu", a policy class,
+                or an instance (only with num_shards=1).
+            num_shards (int): Number of lock-striped partitions of the in-memory cache.
+            compression (Optional[str]): Codec for large serialized values: "zlib", "lz4", "zstd" or None.
+            compress_threshold (int): Serialized size in bytes above which compression is attempted.
+            memory_budget_bytes (Optional[int]): Byte budget for in-memory values (ndarray ``nbytes``,
+                serialized size otherwise), shared by all shards, so any entry up to the whole budget
+                is kept. None means count-bounded only.
+            disk_budget_bytes (Optional[int]): Byte budget for SQLite values; the coldest rows are
+                deleted by the background maintenance job beyond it.
+            default_ttl (Optional[float]): Seconds an entry lives in every tier. None means no expiry.
+            namespace_ttls (Optional[Mapping[str, float]]): TTL per namespace, where the namespace is the
+                first element of a tuple key or the prefix before ":" in a string key.
+            redis_ttl (Optional[float]): Redis expiry in seconds for entries without a TTL.
+            maintenance_interval (Optional[float]): Seconds between expiry/budget passes. None disables them.
+            bloom_filter (bool): Skip Redis and SQLite for keys a Bloom filter over the SQLite keys rules
+                out. Disable when other instances write to the shared Redis but not to this SQLite file.
+            negative_cache_ttl (float): Seconds a definite miss is remembered; 0 disables the negative cache.
+            warm_up (bool): Load the hottest SQLite entries into memory in a background thread on startup.
+                Requests are served normally while warming; see ``wait_for_warm_up``. Requires a stable
+                ``encryption_key``: rows written under another key are skipped and deleted.
+            warm_up_limit (Optional[int]): Maximum entries to warm. Defaults to ``cache_size_limit``;
+                warming also stops at ``memory_budget_bytes``.
+            state_compression (str): Mode used by ``use_quantum_compression``: "sparse", "float16",
+                "schmidt" or "auto" (smallest that meets ``target_fidelity``).
+            target_fidelity (float): Minimum fidelity of a compressed state's reconstruction.
         """
-        # In-memory cache with LRU eviction
-        self.memory_cache = OrderedDict()
+        if state_compression != "auto" and state_compression not in COMPRESSION_MODES:
+            raise ValueError(f"Unknown state compression mode {state_compression!r}.")
+        if isinstance(eviction_policy, EvictionPolicy) and num_shards != 1:
+            raise ValueError("An eviction policy instance requires num_shards=1; pass a name or class instead.")
+        # In-memory cache, striped across shards; each shard's policy picks its own victims
         self.cache_size_limit = cache_size_limit
-        self.lock = threading.Lock()
-
-        # Persistent storage with SQLite
+        self.num_shards = num_shards
+        shard_capacity = max(1, -(-cache_size_limit // num_shards))
+        self.memory_budget_bytes = memory_budget_bytes
+        budget = None if memory_budget_bytes is None else _MemoryBudget(memory_budget_bytes)
+        self.shards = [
+            _CacheShard(make_eviction_policy(eviction_policy, shard_capacity), budget)
+            for _ in range(num_shards)
+        ]
+        if budget is not None:
+            budget.shards = self.shards
+        # Expiry: explicit ttl, then namespace TTL, then default_ttl
+        self.default_ttl = default_ttl
+        self.namespace_ttls = dict(namespace_ttls or {})
+        self.redis_ttl = redis_ttl
+        # Concurrent misses on the same key share one Redis/SQLite load
+        self._flight = SingleFlight()
+        self._stats_lock = threading.Lock()
+
+        # Persistent storage with SQLite (WAL mode, write-behind batching). Its maintenance
+        # thread also sweeps expired memory entries; the hook holds the shards, not self.
         self.db_path = db_path
-        self._initialize_sqlite()
+        self.store = SQLiteStore(
+            db_path,
+            durability=durability,
+            flush_interval=flush_interval,
+            disk_budget_bytes=disk_budget_bytes,
+            maintenance_interval=maintenance_interval,
+            maintenance_hook=functools.partial(_sweep_shards, self.shards),
+            key_filter=bloom_filter
+        )
+        # Recently confirmed misses, answered without any I/O
+        self.negative_cache = NegativeCache(ttl=negative_cache_ttl) if negative_cache_ttl > 0 else None
 
         # Distributed caching with Redis
-        try:
-            self.redis = redis.Redis(host=redis_host, port=redis_port, decode_responses=True)
-            self.redis.ping()  # Test Redis connection
-            logger.info("Connected to Redis at %s:%d", redis_host, redis_port)
-        except redis.ConnectionError:
-            logger.warning("Failed to connect to Redis. Distributed caching disabled.")
-            self.redis = None
-
-        # Encryption setup
+        self.redis = None
+        if redis_host is not None:
+            try:
+                self.redis = redis.Redis(host=redis_host, port=redis_port, decode_responses=False)
+                self.redis.ping()  # Test Redis connection
+                logger.info("Connected to Redis at %s:%d", redis_host, redis_port)
+            except redis.ConnectionError:
+                logger.warning("Failed to connect to Redis. Distributed caching disabled.")
+                self.redis = None
+
+        # Typed serialization: raw ndarray buffers, pickle fallback, size-aware compression
+        self.serializer = CacheSerializer(compression=compression, compress_threshold=compress_threshold)
+
+        # Encryption setup: AES-256-GCM for new rows, Fernet kept to read rows from older versions
         self.encryption_key = encryption_key or Fernet.generate_key()
         self.cipher = Fernet(self.encryption_key)
+        self.aead = AESGCM(base64.urlsafe_b64decode(self.encryption_key))
 
         # Performance metrics
         self.hits = 0
         self.misses = 0
         self.total_latency = 0.0
         self.request_count = 0
+        self.tier_stats = {
+            tier: {"bytes_written": 0, "serialize_time": 0.0, "deserialize_time": 0.0}
+            for tier in ("redis", "sqlite")
+        }
 
-        # Quantum autoencoder for state compression
-        self.qae = self._initialize_quantum_autoencoder()
-
-    def _initialize_sqlite(self) -> None:
-        """Initialize SQLite database for persistent caching."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS cache (
-                    key TEXT PRIMARY KEY,
-                    value BLOB,
-                    fidelity REAL,
-                    timestamp REAL,
-                    access_count INTEGER
-                )
-            """)
-            conn.commit()
-        logger.info("Initialized SQLite cache at %s", self.db_path)
-
-    def _initialize_quantum_autoencoder(self) -> Any:
-        """Initialize quantum autoencoder for state compression."""
-        n_qubits = 4  # Adjustable based on quantum state size
-        n_latent = 2  # Latent space size for compression
-        dev = qml.device("default.qubit", wires=n_qubits)
-
-        @qml.qnode(dev)
-        def qae_circuit(state, params):
-            """Quantum autoencoder circuit for compression."""
-            for i in range(n_qubits):
-                qml.RX(state[i], wires=i)
-            for i in range(n_latent):
-                qml.Rot(*params[i], wires=i)
-            return qml.state()
-
-        class QAE:
-            def __init__(self):
-                self.params = np.random.randn(n_latent, 3)
-                self.circuit = qae_circuit
-
-            def compress(self, state):
-                """Compress quantum state."""
-                return self.circuit(state, self.params)[:2**n_latent]
-
-            def decompress(self, compressed_state):
-                """Decompress quantum state (placeholder)."""
-                return np.pad(compressed_state, (0, 2**n_qubits - len(compressed_state)))
-
-        return QAE()
+        # Fidelity-bounded lossy compression for use_quantum_compression
+        self.state_compression = state_compression
+        self.target_fidelity = target_fidelity
+
+        # Background warm-up from SQLite access statistics
+        self.warmed_entries = 0
+        self._warm_stop = threading.Event()
+        self._warm_done = threading.Event()
+        self._warm_thread = None
+        if warm_up and encryption_key is None:
+            logger.warning("Cache warm-up without an encryption_key cannot read rows from earlier runs.")
+        if warm_up:
+            self._warm_thread = threading.Thread(
+                target=self._warm_up, args=(warm_up_limit or cache_size_limit,),
+                name="cache-warmup", daemon=True
+            )
+            self._warm_thread.start()
+        else:
+            self._warm_done.set()
 
     def _encrypt_data(self, data: bytes) -> bytes:
-        """Encrypt data using AES-256."""
-        return self.cipher.encrypt(data)
+        """Encrypt data using AES-256-GCM (29 bytes of overhead, no base64 inflation)."""
+        nonce = os.urandom(12)
+        return b"".join((_AESGCM_VERSION, nonce, self.aead.encrypt(nonce, data, None)))
 
     def _decrypt_data(self, encrypted_data: bytes) -> bytes:
-        """Decrypt data using AES-256."""
+        """Decrypt data written by ``_encrypt_data`` or by the older Fernet scheme."""
+        if encrypted_data[:1] == _AESGCM_VERSION:
+            return self.aead.decrypt(encrypted_data[1:13], encrypted_data[13:], None)
         return self.cipher.decrypt(encrypted_data)
 
+    def _decrypt_row(self, cache_key: str, encrypted_data: bytes) -> Optional[bytes]:
+        """
+        Decrypt a SQLite row, or delete it and return None when it cannot be decrypted, e.g.
+        because it was written under a different ``encryption_key`` before a restart.
+        """
+        try:
+            return self._decrypt_data(encrypted_data)
+        except (InvalidTag, InvalidToken, ValueError):
+            logger.warning("Discarding cached row %s that does not decrypt with the current key", cache_key)
+            self.store.discard_many([(cache_key, encrypted_data)])
+            return None
+
     def _serialize(self, data: Any) -> bytes:
-        """Serialize data for storage."""
-        return pickle.dumps(data)
+        """Serialize data for storage (raw buffer for ndarrays, pickle otherwise)."""
+        return self.serializer.dumps(data)
 
     def _deserialize(self, data: bytes) -> Any:
-        """Deserialize data from storage."""
-        return pickle.loads(data)
+        """Deserialize data from storage. Arrays may be read-only views of ``data``."""
+        return self.serializer.loads(data)
+
+    def _record_tier(self, tier: str, nbytes: int = 0, serialize_time: float = 0.0,
+                     deserialize_time: float = 0.0) -> None:
+        """Accumulate bytes written and (de)serialization time for a storage tier."""
+        if nbytes:
+            _CACHE_BYTES[tier].inc(nbytes)
+        with self._stats_lock:
+            stats = self.tier_stats[tier]
+            stats["bytes_written"] += nbytes
+            stats["serialize_time"] += serialize_time
+            stats["deserialize_time"] += deserialize_time
 
     def _generate_key(self, key: Union[str, tuple]) -> str:
         """Generate a unique cache key."""
@@ -147,12 +433,69 @@ class QuantumCacheManager:
             key = json.dumps(key, sort_keys=True)
         return hashlib.sha256(key.encode()).hexdigest()
 
+    @staticmethod
+    def _namespace(key: Union[str, tuple]) -> Optional[str]:
+        """Namespace of a key: first element of a tuple, or the prefix before ":" in a string."""
+        if isinstance(key, tuple):
+            return str(key[0]) if key else None
+        return key.split(":", 1)[0] if ":" in key else None
+
+    def _expires_at(self, key: Union[str, tuple], ttl: Optional[float], now: float) -> Optional[float]:
+        """Resolve the absolute expiry time of a key, or None if it never expires."""
+        if ttl is None:
+            ttl = self.namespace_ttls.get(self._namespace(key), self.default_ttl)
+        return None if ttl is None else now + ttl
+
+    def _redis_px(self, expires_at: Optional[float], now: float) -> Optional[int]:
+        """Redis expiry in milliseconds: the remaining TTL, or ``redis_ttl`` for non-expiring keys."""
+        if expires_at is not None:
+            return max(1, int((expires_at - now) * 1000))
+        return None if self.redis_ttl is None else int(self.redis_ttl * 1000)
+
+    @staticmethod
+    def _entry_size(value: Any, serialized_value: bytes) -> int:
+        """Bytes charged against the memory budget for a cached value."""
+        return value.nbytes if isinstance(value, np.ndarray) else len(serialized_value)
+
+    @staticmethod
+    def _pttl_expiry(pttl: int, now: float) -> Optional[float]:
+        """Convert a Redis PTTL reply into an absolute expiry time."""
+        return now + pttl / 1000 if pttl is not None and pttl >= 0 else None
+
+    def _shard(self, cache_key: str) -> _CacheShard:
+        """Select the shard owning a (hex digest) cache key."""
+        return self.shards[int(cache_key[:8], 16) % self.num_shards]
+
+    def _record(self, start_time: float, hits: int = 0, misses: int = 0, requests: int = 1) -> float:
+        """Update request counters and return the elapsed latency."""
+        latency = time.time() - start_time
+        with self._stats_lock:
+            self.hits += hits
+            self.misses += misses
+            self.total_latency += latency
+            self.request_count += requests
+        if hits:
+            _CACHE_HITS.inc(hits)
+        if misses:
+            _CACHE_MISSES.inc(misses)
+        _CACHE_OPERATIONS.inc()
+        _CACHE_LATENCY.observe(latency)
+        return latency
+
+    def _group_by_shard(self, items: Iterable[Tuple[str, tuple]]) -> Dict[int, List[Tuple[str, tuple]]]:
+        groups: Dict[int, List[Tuple[str, tuple]]] = {}
+        for cache_key, entry in items:
+            groups.setdefault(int(cache_key[:8], 16) % self.num_shards, []).append((cache_key, entry))
+        return groups
+
     def put(
         self,
         key: Union[str, tuple],
         value: Any,
         fidelity: float = 1.0,
-        use_quantum_compression: bool = False
+        use_quantum_compression: bool = False,
+        ttl: Optional[float] = None,
+        tiers: Optional[Iterable[str]] = None
     ) -> None:
         """
         Store data in the cache with optional quantum compression.
@@ -161,155 +504,385 @@ class QuantumCacheManager:
             key (Union[str, tuple]): Cache key.
             value (Any): Data to cache (e.g., quantum state, circuit params).
             fidelity (float): Fidelity score for eviction prioritization.
-            use_quantum_compression (bool): Whether to compress quantum states.
+            use_quantum_compression (bool): Store ndarray values as a ``CompressedState`` whose
+                ``fidelity`` attribute is the guaranteed reconstruction fidelity.
+            ttl (Optional[float]): Seconds until the entry expires in every tier. Defaults to the
+                namespace TTL or ``default_ttl``.
+            tiers (Optional[Iterable[str]]): Tiers to write, from "memory", "redis" and "sqlite".
+                Defaults to all of them.
         """
         start_time = time.time()
+        tiers = self._check_tiers(tiers)
         cache_key = self._generate_key(key)
-
-        with self.lock:
-            # Compress quantum state if requested
-            if use_quantum_compression and isinstance(value, np.ndarray):
-                value = self.qae.compress(value)
-
-            # Serialize and encrypt data
+        expires_at = self._expires_at(key, ttl, start_time)
+
+        # Compression, serialization and encryption run outside any lock
+        if use_quantum_compression and isinstance(value, np.ndarray):
+            value = compress_state(value, self.state_compression, self.target_fidelity)
+        serialized_value = None
+        if tiers != {"memory"} or not isinstance(value, np.ndarray):
+            encode_start = time.perf_counter()
             serialized_value = self._serialize(value)
-            encrypted_value = self._encrypt_data(serialized_value)
+            serialize_time = time.perf_counter() - encode_start
 
-            # In-memory cache
-            if len(self.memory_cache) >= self.cache_size_limit:
-                self._evict()
-            self.memory_cache[cache_key] = (value, fidelity, time.time(), 1)
-            self.memory_cache.move_to_end(cache_key)
-
-            # Persistent storage
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO cache (key, value, fidelity, timestamp, access_count)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (cache_key, encrypted_value, fidelity, time.time(), 1))
-                conn.commit()
-
-            # Distributed cache (Redis)
-            if self.redis:
-                try:
-                    self.redis.setex(cache_key, 3600, serialized_value)  # 1-hour TTL
-                except redis.RedisError:
-                    logger.warning("Failed to store %s in Redis.", cache_key)
+        # In-memory cache: the only step under the shard lock
+        now = time.time()
+        if "memory" in tiers:
+            size = self._entry_size(value, serialized_value)
+            self._shard(cache_key).admit(cache_key, (value, fidelity, now, 1, size, expires_at))
 
-            latency = time.time() - start_time
-            self.total_latency += latency
-            self.request_count += 1
-            logger.info("Cached %s (fidelity: %.4f, latency: %.4fs)", cache_key, fidelity, latency)
+        # Persistent storage (queued for the write-behind flusher)
+        if "sqlite" in tiers:
+            encrypted_value = self._encrypt_data(serialized_value)
+            self._record_tier("sqlite", len(encrypted_value), time.perf_counter() - encode_start)
+            self.store.put(cache_key, encrypted_value, fidelity, now, 1, expires_at)
+        elif "redis" in tiers:
+            # Keep the key filter a superset of keys held in the slow tiers
+            self.store.add_to_filter([cache_key])
+        if self.negative_cache is not None:
+            self.negative_cache.discard(cache_key)
+
+        # Distributed cache (Redis)
+        if self.redis and "redis" in tiers:
+            try:
+                self.redis.set(cache_key, serialized_value, px=self._redis_px(expires_at, now))
+                self._record_tier("redis", len(serialized_value), serialize_time)
+            except redis.RedisError:
+                logger.warning("Failed to store %s in Redis.", cache_key)
+
+        latency = self._record(start_time)
+        logger.debug("Cached %s (fidelity: %.4f, latency: %.4fs)", cache_key, fidelity, latency)
 
     def get(
         self,
         key: Union[str, tuple],
-        use_quantum_decompression: bool = False
+        use_quantum_decompression: bool = False,
+        tiers: Optional[Iterable[str]] = None
     ) -> Optional[Any]:
         """
         Retrieve data from the cache.
 
         Args:
             key (Union[str, tuple]): Cache key.
-            use_quantum_decompression (bool): Whether to decompress quantum states.
+            use_quantum_decompression (bool): Return compressed states as reconstructed arrays
+                instead of ``CompressedState`` objects.
+            tiers (Optional[Iterable[str]]): Tiers to read, from "memory", "redis" and "sqlite".
+                Defaults to all of them.
 
         Returns:
-            Optional[Any]: Cached data or None if not found.
+            Optional[Any]: Cached data or None if not found or expired.
         """
         start_time = time.time()
+        tiers = self._check_tiers(tiers)
         cache_key = self._generate_key(key)
 
-        with self.lock:
-            # Check in-memory cache
-            if cache_key in self.memory_cache:
-                value, fidelity, timestamp, access_count = self.memory_cache[cache_key]
-                self.memory_cache[cache_key] = (value, fidelity, timestamp, access_count + 1)
-                self.memory_cache.move_to_end(cache_key)
-                self.hits += 1
-                latency = time.time() - start_time
-                self.total_latency += latency
-                self.request_count += 1
-                logger.info("Cache hit for %s (latency: %.4fs)", cache_key, latency)
-                if use_quantum_decompression and isinstance(value, np.ndarray):
-                    return self.qae.decompress(value)
-                return value
-
-            # Check Redis
-            if self.redis:
+        # Check in-memory cache (lock-free read)
+        entry = self._shard(cache_key).lookup(cache_key) if "memory" in tiers else None
+        if entry is not None:
+            value, tier = entry[0], "Memory"
+        elif tiers == {"memory"} or self._known_missing(cache_key):
+            value, tier = None, None
+        elif tiers == CACHE_TIERS:
+            # Slow tiers are read outside any shard lock, once per key across threads
+            value, tier = self._flight.do(cache_key, self._load, cache_key)
+        else:
+            value, tier = self._flight.do((cache_key, tiers), self._load, cache_key, tiers)
+
+        if tier is None:
+            latency = self._record(start_time, misses=1)
+            logger.debug("Cache miss for %s (latency: %.4fs)", cache_key, latency)
+            return None
+
+        latency = self._record(start_time, hits=1)
+        logger.debug("%s cache hit for %s (latency: %.4fs)", tier, cache_key, latency)
+        if use_quantum_decompression and isinstance(value, CompressedState):
+            return value.decompress()
+        return value
+
+    def _check_tiers(self, tiers: Optional[Iterable[str]]) -> frozenset:
+        """Validate a tier selection; None selects every tier."""
+        if tiers is None:
+            return CACHE_TIERS
+        tiers = frozenset(tiers)
+        if not tiers <= CACHE_TIERS:
+            raise ValueError(f"Unknown cache tiers {sorted(tiers - CACHE_TIERS)}. "
+                             f"Expected a subset of {sorted(CACHE_TIERS)}.")
+        return CACHE_TIERS if tiers == CACHE_TIERS else tiers
+
+    def _load(self, cache_key: str, tiers: frozenset = CACHE_TIERS) -> tuple:
+        """
+        Load a key from Redis, then SQLite, promoting it to the faster selected tiers.
+        Promoted entries keep the expiry of the tier they were read from.
+
+        Returns:
+            tuple: (value, tier name), or (None, None) on a miss.
+        """
+        shard = self._shard(cache_key)
+
+        # Check Redis (value and remaining TTL in one round trip)
+        if self.redis and "redis" in tiers:
+            try:
+                serialized_value, pttl = self.redis.pipeline(transaction=False) \
+                    .get(cache_key).pttl(cache_key).execute()
+                if serialized_value:
+                    decode_start = time.perf_counter()
+                    value = self._deserialize(serialized_value)
+                    self._record_tier("redis", deserialize_time=time.perf_counter() - decode_start)
+                    now = time.time()
+                    size = self._entry_size(value, serialized_value)
+                    if "memory" in tiers:
+                        shard.admit(cache_key, (value, 1.0, now, 1, size, self._pttl_expiry(pttl, now)),
+                                    replace=False)
+                    return value, "Redis"
+            except redis.RedisError:
+                logger.warning("Failed to retrieve %s from Redis.", cache_key)
+
+        # Check SQLite (expired rows are never returned)
+        result = self.store.get(cache_key) if "sqlite" in tiers else None
+        decode_start = time.perf_counter()
+        serialized_value = self._decrypt_row(cache_key, result[0]) if result else None
+        if serialized_value is not None:
+            _, fidelity, access_count, expires_at = result
+            value = self._deserialize(serialized_value)
+            self._record_tier("sqlite", deserialize_time=time.perf_counter() - decode_start)
+            now = time.time()
+            self.store.touch(cache_key, now)
+            size = self._entry_size(value, serialized_value)
+            if "memory" in tiers:
+                shard.admit(cache_key, (value, fidelity, now, access_count + 1, size, expires_at), replace=False)
+            if self.redis and "redis" in tiers:
                 try:
-                    serialized_value = self.redis.get(cache_key)
-                    if serialized_value:
-                        value = self._deserialize(serialized_value)
-                        self.put(key, value, fidelity=1.0)  # Update in-memory and SQLite
-                        self.hits += 1
-                        latency = time.time() - start_time
-                        self.total_latency += latency
-                        self.request_count += 1
-                        logger.info("Redis cache hit for %s (latency: %.4fs)", cache_key, latency)
-                        if use_quantum_decompression and isinstance(value, np.ndarray):
-                            return self.qae.decompress(value)
-                        return value
+                    self.redis.set(cache_key, serialized_value, px=self._redis_px(expires_at, now))
+                    self._record_tier("redis", len(serialized_value))
                 except redis.RedisError:
-                    logger.warning("Failed to retrieve %s from Redis.", cache_key)
-
-            # Check SQLite
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT value, fidelity, access_count FROM cache WHERE key = ?", (cache_key,))
-                result = cursor.fetchone()
-                if result:
-                    encrypted_value, fidelity, access_count = result
-                    serialized_value = self._decrypt_data(encrypted_value)
+                    logger.warning("Failed to store %s in Redis.", cache_key)
+            return value, "SQLite"
+
+        # A miss only proves absence everywhere when every tier was searched
+        if self.negative_cache is not None and tiers == CACHE_TIERS:
+            self.negative_cache.add(cache_key)
+        return None, None
+
+    def _warm_up(self, limit: int) -> None:
+        """Admit the hottest SQLite rows into memory in batches, without evicting or overwriting entries."""
+        loaded_bytes = 0
+        try:
+            for rows in self.store.iter_hottest(limit):
+                if self._warm_stop.is_set():
+                    break
+                now = time.time()
+                promoted = []
+                for cache_key, encrypted_value, fidelity, access_count, expires_at in rows:
+                    serialized_value = self._decrypt_row(cache_key, encrypted_value)
+                    if serialized_value is None:
+                        continue
                     value = self._deserialize(serialized_value)
-                    cursor.execute(
-                        "UPDATE cache SET access_count = ?, timestamp = ? WHERE key = ?",
-                        (access_count + 1, time.time(), cache_key)
-                    )
-                    conn.commit()
-                    self.put(key, value, fidelity=fidelity)  # Update in-memory and Redis
-                    self.hits += 1
-                    latency = time.time() - start_time
-                    self.total_latency += latency
-                    self.request_count += 1
-                    logger.info("SQLite cache hit for %s (latency: %.4fs)", cache_key, latency)
-                    if use_quantum_decompression and isinstance(value, np.ndarray):
-                        return self.qae.decompress(value)
-                    return value
-
-            self.misses += 1
-            latency = time.time() - start_time
-            self.total_latency += latency
-            self.request_count += 1
-            logger.info("Cache miss for %s (latency: %.4fs)", cache_key, latency)
-            return None
+                    size = self._entry_size(value, serialized_value)
+                    if self.memory_budget_bytes is not None and loaded_bytes + size > self.memory_budget_bytes:
+                        self._warm_stop.set()
+                        break
+                    loaded_bytes += size
+                    promoted.append((cache_key, (value, fidelity, now, access_count, size, expires_at)))
+                for shard_index, shard_items in self._group_by_shard(promoted).items():
+                    self.warmed_entries += self.shards[shard_index].fill(shard_items)
+            logger.info("Cache warm-up loaded %d entries (%d bytes)", self.warmed_entries, loaded_bytes)
+        except Exception as e:
+            logger.error("Cache warm-up failed after %d entries: %s", self.warmed_entries, e)
+        finally:
+            self._warm_done.set()
 
-    def _evict(self) -> None:
-        """Evict least valuable entry based on fidelity and access count."""
-        if not self.memory_cache:
-            return
+    def wait_for_warm_up(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until background warm-up has finished.
 
-        # Prioritize low fidelity and low access count
-        candidates = [(k, v[1], v[3]) for k, v in self.memory_cache.items()]  # (key, fidelity, access_count)
-        candidates.sort(key=lambda x: x[1] + x[2] * 0.1)  # Weighted score
-        evict_key = candidates[0][0]
-        self.memory_cache.pop(evict_key)
-        logger.info("Evicted %s from in-memory cache", evict_key)
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait.
+
+        Returns:
+            bool: True if warm-up is complete (or was not requested).
+        """
+        return self._warm_done.wait(timeout)
+
+    def _known_missing(self, cache_key: str) -> bool:
+        """True if the negative cache or the key filter proves the key is absent from every tier."""
+        if self.negative_cache is not None and cache_key in self.negative_cache:
+            return True
+        return not self.store.might_contain(cache_key)
+
+    def put_many(
+        self,
+        items: Union[Mapping[Any, Any], Iterable[tuple]],
+        fidelity: float = 1.0,
+        use_quantum_compression: bool = False,
+        ttl: Optional[float] = None
+    ) -> None:
+        """
+        Store several entries with batched tier writes.
+
+        Args:
+            items (Union[Mapping, Iterable[tuple]]): Mapping of key to value, or (key, value)
+                / (key, value, fidelity) tuples.
+            fidelity (float): Fidelity for items that do not carry their own.
+            use_quantum_compression (bool): Store ndarray values as a ``CompressedState`` whose
+                ``fidelity`` attribute is the guaranteed reconstruction fidelity.
+            ttl (Optional[float]): Seconds until the entries expire. Defaults per key to the
+                namespace TTL or ``default_ttl``.
+        """
+        start_time = time.time()
+        items = items.items() if isinstance(items, Mapping) else items
+        now = time.time()
+        entries, rows, payloads = [], [], []
+        encode_start = time.perf_counter()
+        for item in items:
+            key, value = item[0], item[1]
+            item_fidelity = item[2] if len(item) > 2 else fidelity
+            if use_quantum_compression and isinstance(value, np.ndarray):
+                value = compress_state(value, self.state_compression, self.target_fidelity)
+            cache_key = self._generate_key(key)
+            expires_at = self._expires_at(key, ttl, now)
+            serialized_value = self._serialize(value)
+            encrypted_value = self._encrypt_data(serialized_value)
+            size = self._entry_size(value, serialized_value)
+            entries.append((cache_key, (value, item_fidelity, now, 1, size, expires_at)))
+            rows.append((cache_key, encrypted_value, item_fidelity, now, 1, expires_at))
+            payloads.append((cache_key, serialized_value, expires_at))
+        self._record_tier("sqlite", sum(len(row[1]) for row in rows), time.perf_counter() - encode_start)
+
+        for shard_index, shard_items in self._group_by_shard(entries).items():
+            self.shards[shard_index].admit_many(shard_items)
+        self.store.put_many(rows)
+        self._redis_set_many(payloads)
+        if self.negative_cache is not None:
+            for cache_key, _ in entries:
+                self.negative_cache.discard(cache_key)
+
+        latency = self._record(start_time, requests=len(entries))
+        logger.debug("Cached %d entries in bulk (latency: %.4fs)", len(entries), latency)
+
+    def get_many(
+        self,
+        keys: Iterable[Union[str, tuple]],
+        use_quantum_decompression: bool = False
+    ) -> List[Optional[Any]]:
+        """
+        Retrieve several entries, resolving each tier in one batched pass.
+        Memory is checked first, then Redis with a single pipelined GET/PTTL round trip,
+        then SQLite with batched IN queries; hits are promoted to faster tiers in bulk.
+
+        Args:
+            keys (Iterable[Union[str, tuple]]): Cache keys.
+            use_quantum_decompression (bool): Return compressed states as reconstructed arrays
+                instead of ``CompressedState`` objects.
+
+        Returns:
+            List[Optional[Any]]: Values in the order of ``keys``; None where not found or expired.
+        """
+        start_time = time.time()
+        cache_keys = [self._generate_key(key) for key in keys]
+        found: Dict[str, Any] = {}
+
+        # Memory tier
+        missing = []
+        for cache_key in dict.fromkeys(cache_keys):
+            entry = self._shard(cache_key).lookup(cache_key)
+            if entry is not None:
+                found[cache_key] = entry[0]
+            elif not self._known_missing(cache_key):
+                missing.append(cache_key)
+
+        # Redis tier: values and remaining TTLs in one pipelined round trip
+        if missing and self.redis:
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for cache_key in missing:
+                    pipe.get(cache_key)
+                    pipe.pttl(cache_key)
+                replies = pipe.execute()
+            except redis.RedisError:
+                logger.warning("Failed to retrieve %d keys from Redis.", len(missing))
+                replies = [None] * (2 * len(missing))
+            now = time.time()
+            decode_start = time.perf_counter()
+            promoted, still_missing = [], []
+            for cache_key, blob, pttl in zip(missing, replies[::2], replies[1::2]):
+                if blob:
+                    value = self._deserialize(blob)
+                    found[cache_key] = value
+                    size = self._entry_size(value, blob)
+                    promoted.append((cache_key, (value, 1.0, now, 1, size, self._pttl_expiry(pttl, now))))
+                else:
+                    still_missing.append(cache_key)
+            self._record_tier("redis", deserialize_time=time.perf_counter() - decode_start)
+            for shard_index, shard_items in self._group_by_shard(promoted).items():
+                self.shards[shard_index].admit_many(shard_items, replace=False)
+            missing = still_missing
+
+        # SQLite tier: batched IN queries
+        if missing:
+            rows = self.store.get_many(missing)
+            now = time.time()
+            decode_start = time.perf_counter()
+            promoted, payloads = [], []
+            for cache_key, (encrypted_value, fidelity, access_count, expires_at) in list(rows.items()):
+                serialized_value = self._decrypt_row(cache_key, encrypted_value)
+                if serialized_value is None:
+                    del rows[cache_key]
+                    continue
+                value = self._deserialize(serialized_value)
+                found[cache_key] = value
+                size = self._entry_size(value, serialized_value)
+                promoted.append((cache_key, (value, fidelity, now, access_count + 1, size, expires_at)))
+                payloads.append((cache_key, serialized_value, expires_at))
+            self._record_tier("sqlite", deserialize_time=time.perf_counter() - decode_start)
+            if rows:
+                self.store.touch_many(rows.keys(), now)
+                for shard_index, shard_items in self._group_by_shard(promoted).items():
+                    self.shards[shard_index].admit_many(shard_items, replace=False)
+                self._redis_set_many(payloads)
+            if self.negative_cache is not None:
+                for cache_key in missing:
+                    if cache_key not in rows:
+                        self.negative_cache.add(cache_key)
+
+        results = []
+        for cache_key in cache_keys:
+            value = found.get(cache_key)
+            if use_quantum_decompression and isinstance(value, CompressedState):
+                value = value.decompress()
+            results.append(value)
+
+        hits = sum(cache_key in found for cache_key in cache_keys)
+        latency = self._record(start_time, hits=hits, misses=len(cache_keys) - hits, requests=len(cache_keys))
+        logger.debug("Bulk lookup of %d keys: %d hits (latency: %.4fs)", len(cache_keys), hits, latency)
+        return results
+
+    def _redis_set_many(self, payloads: List[Tuple[str, bytes, Optional[float]]]) -> None:
+        """Write (key, serialized value, expires_at) triples to Redis in one pipelined round trip."""
+        if not self.redis or not payloads:
+            return
+        try:
+            now = time.time()
+            pipe = self.redis.pipeline(transaction=False)
+            for cache_key, serialized_value, expires_at in payloads:
+                pipe.set(cache_key, serialized_value, px=self._redis_px(expires_at, now))
+            pipe.execute()
+            self._record_tier("redis", sum(len(payload[1]) for payload in payloads))
+        except redis.RedisError:
+            logger.warning("Failed to store %d entries in Redis.", len(payloads))
 
     def clear(self) -> None:
         """Clear all caches."""
-        with self.lock:
-            self.memory_cache.clear()
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM cache")
-                conn.commit()
-            if self.redis:
-                try:
-                    self.redis.flushall()
-                except redis.RedisError:
-                    logger.warning("Failed to clear Redis cache.")
-            logger.info("All caches cleared.")
+        for shard in self.shards:
+            shard.clear()
+        self.store.clear()
+        if self.negative_cache is not None:
+            self.negative_cache.clear()
+        if self.redis:
+            try:
+                self.redis.flushall()
+            except redis.RedisError:
+                logger.warning("Failed to clear Redis cache.")
+        logger.info("All caches cleared.")
 
     def get_metrics(self) -> Dict[str, float]:
         """
@@ -325,16 +898,56 @@ class QuantumCacheManager:
             "misses": self.misses,
             "hit_rate": hit_rate,
             "average_latency": avg_latency,
-            "cache_size": len(self.memory_cache)
+            "cache_size": sum(len(shard.entries) for shard in self.shards),
+            "memory_bytes": sum(shard.bytes for shard in self.shards),
+            "evictions": sum(shard.evictions for shard in self.shards),
+            "memory_expired": sum(shard.expirations for shard in self.shards),
+            "single_flight_shared": self._flight.shared,
+            **{
+                f"{tier}_{name}": value
+                for tier, stats in self.tier_stats.items()
+                for name, value in stats.items()
+            },
+            "pending_writes": self.store.pending(),
+            "sqlite_flushes": self.store.flush_count,
+            "disk_bytes": self.store.disk_bytes,
+            "sqlite_rows_expired": self.store.rows_expired,
+            "sqlite_rows_evicted": self.store.rows_evicted,
+            "bloom_false_positive_rate": self.store.filter_fp_rate(),
+            "bloom_estimated_fp_rate": (self.store.key_filter.estimated_fp_rate()
+                                        if self.store.key_filter is not None else 0.0),
+            "bloom_negatives": self.store.filter_negatives,
+            "negative_cache_hits": self.negative_cache.hits if self.negative_cache is not None else 0,
+            "warm_up_entries": self.warmed_entries,
+            "warming": not self._warm_done.is_set()
         }
 
+    def flush(self) -> None:
+        """Write all queued SQLite writes to disk."""
+        self.store.flush()
+
+    def run_maintenance(self) -> Dict[str, int]:
+        """
+        Run one expiry/budget pass now instead of waiting for the background job.
+
+        Returns:
+            Dict[str, int]: SQLite rows expired and evicted, and stored bytes after the pass.
+        """
+        return self.store.run_maintenance()
+
+    def close(self) -> None:
+        """Flush pending writes and release SQLite and Redis connections."""
+        self._warm_stop.set()
+        if self._warm_thread is not None:
+            self._warm_thread.join()
+        self.store.close()
+        if self.redis:
+            self.redis.close()
+            self.redis = None
+
     def __del__(self):
         """Clean up resources."""
         try:
-            if os.path.exists(self.db_path):
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.close()
-            if self.redis:
-                self.redis.close()
+            self.close()
         except Exception as e:
             logger.error("Error during cleanup: %s", e)
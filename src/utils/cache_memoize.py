@@ -0,0 +1,156 @@
+# src/utils/cache_memoize.py
+"""
+Memoization of pure functions through the QuantumNet-Core cache manager.
+Arguments, including NumPy arrays, are reduced to a content hash so identical
+inputs share one cached result across calls, threads and (with the Redis or
+SQLite tiers) processes.
+"""
+import atexit
+import functools
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from typing import Any, Callable, Iterable, Optional
+
+import numpy as np
+
+from .single_flight import SingleFlight
+
+CACHE_TIERS = ("memory", "redis", "sqlite")
+
+_default_manager = None
+_default_manager_lock = threading.Lock()
+
+
+def set_default_cache_manager(manager: Any) -> None:
+    """Use ``manager`` for every ``@cached`` function that was not given one explicitly."""
+    global _default_manager
+    with _default_manager_lock:
+        _default_manager = manager
+
+
+def get_default_cache_manager() -> Any:
+    """
+    Return the shared cache manager, creating it on first use.
+    The lazily created manager has no Redis tier and keeps its SQLite file in a private
+    temp directory that is removed at exit. Its encryption key is generated per process,
+    so results are not shared between processes or runs; call ``set_default_cache_manager``
+    with a manager that has a fixed ``db_path`` and ``encryption_key`` for that.
+    """
+    global _default_manager
+    if _default_manager is None:
+        with _default_manager_lock:
+            if _default_manager is None:
+                from .cache_manager import QuantumCacheManager
+                directory = tempfile.mkdtemp(prefix="quantumnet_memo_")
+                manager = QuantumCacheManager(db_path=os.path.join(directory, "memo_cache.db"), redis_host=None)
+                atexit.register(_discard_manager, manager, directory)
+                _default_manager = manager
+    return _default_manager
+
+
+def _discard_manager(manager: Any, directory: str) -> None:
+    manager.close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def _update_hash(digest, value: Any) -> None:
+    """Feed a type-tagged encoding of ``value`` into ``digest``."""
+    if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+        array = value if value.flags.c_contiguous else np.ascontiguousarray(value)
+        digest.update(b"nd" + array.dtype.str.encode() + repr(array.shape).encode())
+        digest.update(array.reshape(-1).view(np.uint8).data)
+    elif value is None or isinstance(value, (bool, int, float, complex, str, bytes, np.generic)):
+        digest.update(type(value).__name__.encode() + b":" + repr(value).encode() + b";")
+    elif isinstance(value, (tuple, list)):
+        digest.update(b"(" if isinstance(value, tuple) else b"[")
+        for item in value:
+            _update_hash(digest, item)
+        digest.update(b")")
+    elif isinstance(value, dict):
+        digest.update(b"{")
+        for key in sorted(value, key=repr):
+            _update_hash(digest, key)
+            _update_hash(digest, value[key])
+        digest.update(b"}")
+    else:
+        # Anything else must pickle deterministically to produce stable keys
+        digest.update(b"pickle:" + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def hash_arguments(*args, **kwargs) -> str:
+    """
+    Content hash of call arguments. Arrays are hashed by dtype, shape and raw buffer.
+
+    Returns:
+        str: Hex digest identifying the arguments.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    _update_hash(digest, args)
+    _update_hash(digest, kwargs)
+    return digest.hexdigest()
+
+
+def cached(
+    namespace: Optional[str] = None,
+    ttl: Optional[float] = None,
+    tiers: Iterable[str] = CACHE_TIERS,
+    key: Optional[Callable[..., Any]] = None,
+    manager: Any = None,
+    copy: bool = True
+) -> Callable:
+    """
+    Decorator memoizing a pure function in a ``QuantumCacheManager``.
+    Concurrent calls with the same arguments share one evaluation. ``None`` results are not cached.
+
+    Args:
+        namespace (Optional[str]): Key prefix, also used to look up namespace TTLs.
+            Defaults to the function's module and qualified name.
+        ttl (Optional[float]): Seconds a result stays cached. Defaults to the manager's namespace/default TTL.
+        tiers (Iterable[str]): Cache tiers to use, from "memory", "redis" and "sqlite".
+        key (Optional[Callable]): Maps the call arguments to the value that is hashed, e.g. to
+            skip ``self`` or reduce an object to its defining data. Defaults to all arguments.
+        manager (Optional[QuantumCacheManager]): Cache to use. Defaults to ``get_default_cache_manager()``.
+        copy (bool): Return cached arrays as writable copies. With False, results are
+            shared read-only arrays.
+
+    Returns:
+        Callable: The decorator.
+    """
+    tiers = tuple(tiers)
+    unknown = set(tiers) - set(CACHE_TIERS)
+    if unknown:
+        raise ValueError(f"Unknown cache tiers {sorted(unknown)}. Expected a subset of {list(CACHE_TIERS)}.")
+
+    def decorator(fn: Callable) -> Callable:
+        prefix = namespace or f"{fn.__module__}.{fn.__qualname__}"
+        flight = SingleFlight()
+
+        def compute(cache, cache_key, args, kwargs):
+            result = fn(*args, **kwargs)
+            if result is not None:
+                if isinstance(result, np.ndarray):
+                    # The cached array is shared by every later caller
+                    result.flags.writeable = False
+                cache.put(cache_key, result, ttl=ttl, tiers=tiers)
+            return result
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache = manager if manager is not None else get_default_cache_manager()
+            key_args = key(*args, **kwargs) if key is not None else (args, kwargs)
+            cache_key = f"{prefix}:{hash_arguments(key_args)}"
+            result = cache.get(cache_key, tiers=tiers)
+            if result is None:
+                result = flight.do(cache_key, compute, cache, cache_key, args, kwargs)
+            if copy and isinstance(result, np.ndarray):
+                return result.copy()
+            return result
+
+        wrapper.cache_namespace = prefix
+        return wrapper
+
+    return decorator
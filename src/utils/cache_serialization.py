@@ -0,0 +1,165 @@
+# src/utils/cache_serialization.py
+"""
+Typed serialization for cached values in QuantumNet-Core.
+NumPy arrays are stored as a small header plus their raw buffer and decoded with
+``np.frombuffer`` without copying; everything else falls back to pickle. Payloads
+above a size threshold are compressed with zlib, lz4 or zstd when that shrinks them.
+"""
+import pickle
+import struct
+import zlib
+from typing import Any, Optional
+
+import numpy as np
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC = b"QNC1"
+KIND_PICKLE = 0
+KIND_NDARRAY = 1
+
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+CODEC_LZ4 = 2
+CODEC_ZSTD = 3
+
+CODEC_IDS = {None: CODEC_NONE, "zlib": CODEC_ZLIB, "lz4": CODEC_LZ4, "zstd": CODEC_ZSTD}
+
+_PREFIX = struct.Struct("<4sBB")  # magic, kind, codec
+
+
+def available_codecs() -> list:
+    """Names of the compression codecs usable in this environment."""
+    codecs = ["zlib"]
+    if lz4_frame is not None:
+        codecs.append("lz4")
+    if zstandard is not None:
+        codecs.append("zstd")
+    return codecs
+
+
+class CacheSerializer:
+    """
+    Encodes cache values to self-describing byte strings.
+    Blobs without the ``QNC1`` prefix are treated as plain pickles, so rows written
+    before this format existed remain readable.
+    """
+    def __init__(
+        self,
+        compression: Optional[str] = "zlib",
+        compress_threshold: int = 4096,
+        level: Optional[int] = None
+    ):
+        """
+        Initialize the CacheSerializer.
+
+        Args:
+            compression (Optional[str]): "zlib", "lz4", "zstd" or None to disable compression.
+            compress_threshold (int): Minimum payload size in bytes before compression is tried.
+            level (Optional[int]): Codec-specific compression level. Defaults favour speed.
+        """
+        if compression not in CODEC_IDS:
+            raise ValueError(f"Unknown compression codec {compression!r}. "
+                             f"Expected one of {sorted(c for c in CODEC_IDS if c)} or None.")
+        if compression not in (None, *available_codecs()):
+            raise ImportError(f"Compression codec {compression!r} requires an optional package "
+                              f"({'lz4' if compression == 'lz4' else 'zstandard'}).")
+        self.compression = compression
+        self.codec = CODEC_IDS[compression]
+        self.compress_threshold = compress_threshold
+        self.level = level
+        self._zstd_c = None
+        self._zstd_d = None
+        if compression == "zstd":
+            self._zstd_c = zstandard.ZstdCompressor(level=3 if level is None else level)
+            self._zstd_d = zstandard.ZstdDecompressor()
+
+    def _compress(self, data) -> bytes:
+        if self.codec == CODEC_ZLIB:
+            return zlib.compress(data, 1 if self.level is None else self.level)
+        if self.codec == CODEC_LZ4:
+            return lz4_frame.compress(data, compression_level=0 if self.level is None else self.level)
+        return self._zstd_c.compress(data)
+
+    def _decompress(self, codec: int, data) -> bytes:
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(data)
+        if codec == CODEC_LZ4:
+            if lz4_frame is None:
+                raise ImportError("Cached value is lz4-compressed but lz4 is not installed.")
+            return lz4_frame.decompress(data)
+        if codec == CODEC_ZSTD:
+            if zstandard is None:
+                raise ImportError("Cached value is zstd-compressed but zstandard is not installed.")
+            return (self._zstd_d or zstandard.ZstdDecompressor()).decompress(data)
+        raise ValueError(f"Unknown codec id {codec} in cached value.")
+
+    @staticmethod
+    def _is_plain_array(value: Any) -> bool:
+        return (type(value) is np.ndarray and not value.dtype.hasobject
+                and value.dtype.fields is None)
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Serialize a value.
+
+        Args:
+            value (Any): Value to encode.
+
+        Returns:
+            bytes: Prefix, optional array header, and (possibly compressed) body.
+        """
+        if self._is_plain_array(value):
+            # np.ascontiguousarray would promote 0-d arrays to 1-d, so only copy when needed
+            array = value if value.flags.c_contiguous else np.ascontiguousarray(value)
+            dtype = array.dtype.str.encode()
+            meta = (struct.pack("<B", len(dtype)) + dtype + struct.pack("<B", array.ndim)
+                    + struct.pack(f"<{array.ndim}Q", *array.shape))
+            kind, body = KIND_NDARRAY, array.reshape(-1).view(np.uint8).data
+        else:
+            kind, meta, body = KIND_PICKLE, b"", pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        codec = CODEC_NONE
+        if self.codec != CODEC_NONE and len(body) >= self.compress_threshold:
+            compressed = self._compress(body)
+            if len(compressed) < len(body):
+                codec, body = self.codec, compressed
+        return b"".join((_PREFIX.pack(MAGIC, kind, codec), meta, body))
+
+    def loads(self, blob: bytes) -> Any:
+        """
+        Deserialize a value produced by ``dumps`` (or a legacy pickle).
+        Uncompressed arrays are read-only views over ``blob``.
+
+        Args:
+            blob (bytes): Encoded value.
+
+        Returns:
+            Any: Decoded value.
+        """
+        if blob[:4] != MAGIC:
+            return pickle.loads(blob)
+        view = memoryview(blob)
+        _, kind, codec = _PREFIX.unpack_from(view)
+        offset = _PREFIX.size
+
+        if kind == KIND_NDARRAY:
+            dtype_len = view[offset]
+            dtype = np.dtype(bytes(view[offset + 1:offset + 1 + dtype_len]).decode())
+            offset += 1 + dtype_len
+            ndim = view[offset]
+            shape = struct.unpack_from(f"<{ndim}Q", view, offset + 1)
+            offset += 1 + 8 * ndim
+            body = view[offset:] if codec == CODEC_NONE else self._decompress(codec, view[offset:])
+            return np.frombuffer(body, dtype=dtype).reshape(shape)
+
+        body = view[offset:] if codec == CODEC_NONE else self._decompress(codec, view[offset:])
+        return pickle.loads(body)
@@ -0,0 +1,537 @@
+# src/utils/cache_storage.py
+"""
+Persistent SQLite tier for the QuantumNet-Core cache manager.
+Holds long-lived WAL-mode connections and batches writes through a write-behind
+queue that a background thread flushes with executemany transactions. The same
+thread periodically expires rows past their TTL and keeps the table within a
+disk byte budget. An optional Bloom filter over stored keys answers definite misses
+without a query.
+"""
+import sqlite3
+import threading
+import time
+import logging
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from .cache_filters import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+# Durability modes: (write-behind queue enabled, PRAGMA synchronous level)
+DURABILITY_MODES = {
+    "write_behind": (True, "NORMAL"),
+    "write_through": (False, "NORMAL"),
+    "full": (False, "FULL"),
+}
+
+# (key, value, fidelity, timestamp, access_count, expires_at)
+Row = Tuple[str, bytes, float, float, int, Optional[float]]
+
+# Stay under SQLITE_MAX_VARIABLE_NUMBER (999 on older SQLite builds)
+_IN_BATCH = 500
+
+_UPSERT = """
+    INSERT OR REPLACE INTO cache (key, value, fidelity, timestamp, access_count, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_TOUCH = "UPDATE cache SET access_count = access_count + ?, timestamp = ? WHERE key = ?"
+
+
+def _live(row: Row, now: float) -> bool:
+    return row[5] is None or row[5] > now
+
+
+class SQLiteStore:
+    """
+    SQLite-backed persistent cache tier.
+    Readers use one connection per thread, writes go through a single writer connection.
+    In ``write_behind`` mode puts are coalesced in memory and flushed in batches.
+    """
+    def __init__(
+        self,
+        db_path: str,
+        durability: str = "write_behind",
+        flush_interval: float = 0.05,
+        batch_size: int = 512,
+        disk_budget_bytes: Optional[int] = None,
+        maintenance_interval: Optional[float] = 30.0,
+        maintenance_hook: Optional[Callable[[], None]] = None,
+        key_filter: bool = True,
+        filter_capacity: int = 100_000,
+        filter_error_rate: float = 0.01
+    ):
+        """
+        Initialize the SQLiteStore.
+
+        Args:
+            db_path (str): Path to SQLite database file.
+            durability (str): One of ``write_behind``, ``write_through`` or ``full``.
+            flush_interval (float): Seconds between background flushes.
+            batch_size (int): Pending writes that trigger an early flush.
+            disk_budget_bytes (Optional[int]): Maximum total size of stored values. The
+                coldest rows (lowest access_count, then oldest timestamp) are deleted
+                beyond it. None means unbounded.
+            maintenance_interval (Optional[float]): Seconds between expiry/budget passes.
+                None disables background maintenance.
+            maintenance_hook (Optional[Callable]): Called after each maintenance pass, e.g.
+                to sweep expired entries from other tiers.
+            key_filter (bool): Keep a Bloom filter of stored keys, rebuilt from the table on
+                startup and after enough deletions.
+            filter_capacity (int): Initial number of keys the filter is sized for.
+            filter_error_rate (float): Target false-positive rate of the filter.
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability mode {durability!r}. "
+                             f"Expected one of {sorted(DURABILITY_MODES)}.")
+        self.db_path = db_path
+        self.durability = durability
+        self.write_behind, self._synchronous = DURABILITY_MODES[durability]
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.disk_budget_bytes = disk_budget_bytes
+        self.maintenance_interval = maintenance_interval
+        self.maintenance_hook = maintenance_hook
+
+        self._local = threading.local()
+        # (owning thread, connection); connections of exited threads are closed on the next open
+        self._readers: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self._readers_lock = threading.Lock()
+
+        # Writer connection shared by the flusher and write-through callers
+        self._write_lock = threading.Lock()
+        self._writer = self._connect()
+        self._create_schema()
+
+        # Write-behind state: latest row per key and accumulated access touches
+        self._pending_lock = threading.Lock()
+        self._pending_puts: Dict[str, Row] = {}
+        self._pending_touches: Dict[str, Tuple[int, float]] = {}
+        # Rows swapped out by a flush that has not committed yet
+        self._inflight_puts: Dict[str, Row] = {}
+        self.flush_count = 0
+        self.rows_flushed = 0
+
+        # Bloom filter over stored keys; deletions leave stale bits until the next rebuild
+        self.filter_capacity = filter_capacity
+        self.filter_error_rate = filter_error_rate
+        self.key_filter: Optional[BloomFilter] = None
+        self._next_filter: Optional[BloomFilter] = None
+        self._deleted_since_rebuild = 0
+        self.filter_negatives = 0
+        self.filter_false_positives = 0
+        if key_filter:
+            self._build_filter()
+
+        # Maintenance statistics
+        self.disk_bytes = self._measure_disk_bytes()
+        self.rows_expired = 0
+        self.rows_evicted = 0
+
+        self._closed = False
+        self._wakeup = threading.Event()
+        self._worker = None
+        if self.write_behind or self.maintenance_interval:
+            self._worker = threading.Thread(
+                target=self._background_loop, name="sqlite-cache-worker", daemon=True
+            )
+            self._worker.start()
+        logger.info("Initialized SQLite cache at %s (durability: %s)", db_path, durability)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection configured for WAL mode."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        # Only takes effect on a new database; lets maintenance return freed pages
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self._synchronous}")
+        return conn
+
+    def _create_schema(self) -> None:
+        with self._write_lock:
+            self._writer.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB,
+                    fidelity REAL,
+                    timestamp REAL,
+                    access_count INTEGER,
+                    expires_at REAL
+                )
+            """)
+            # Databases created before TTL support lack the expires_at column
+            columns = {row[1] for row in self._writer.execute("PRAGMA table_info(cache)")}
+            if "expires_at" not in columns:
+                self._writer.execute("ALTER TABLE cache ADD COLUMN expires_at REAL")
+            self._writer.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires_at ON cache (expires_at)")
+            self._writer.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_coldness ON cache (access_count, timestamp)"
+            )
+            self._writer.commit()
+
+    def _reader(self) -> sqlite3.Connection:
+        """Return this thread's read connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._readers_lock:
+                # Short-lived worker threads would otherwise leave one open connection each
+                alive = []
+                for thread, reader in self._readers:
+                    if thread.is_alive():
+                        alive.append((thread, reader))
+                    else:
+                        reader.close()
+                alive.append((threading.current_thread(), conn))
+                self._readers = alive
+        return conn
+
+    def put(
+        self,
+        key: str,
+        value: bytes,
+        fidelity: float,
+        timestamp: float,
+        access_count: int = 1,
+        expires_at: Optional[float] = None
+    ) -> None:
+        """Store a row, either queued for the flusher or written immediately."""
+        self.put_many([(key, value, fidelity, timestamp, access_count, expires_at)])
+
+    def put_many(self, rows: Iterable[Row]) -> None:
+        """Store several rows with one queue update or one transaction. expires_at may be omitted."""
+        rows = [row if len(row) == 6 else (*row, None) for row in rows]
+        if not self.write_behind:
+            with self._write_lock:
+                with self._writer:
+                    self._writer.executemany(_UPSERT, rows)
+            # Added after the commit so a concurrent filter rebuild either scans the row or sees the add
+            with self._pending_lock:
+                self._filter_add(row[0] for row in rows)
+            return
+
+        with self._pending_lock:
+            for row in rows:
+                self._pending_touches.pop(row[0], None)
+                self._pending_puts[row[0]] = row
+            self._filter_add(row[0] for row in rows)
+            pending = len(self._pending_puts)
+        if pending >= self.batch_size:
+            self._wakeup.set()
+
+    def _filter_add(self, keys: Iterable[str]) -> None:
+        """Add keys to the live filter and to one being rebuilt. Caller holds ``_pending_lock``."""
+        if self.key_filter is None:
+            return
+        for key in keys:
+            self.key_filter.add(key)
+            if self._next_filter is not None:
+                self._next_filter.add(key)
+
+    def add_to_filter(self, keys: Iterable[str]) -> None:
+        """Mark keys held in another tier as possibly present, without storing rows."""
+        with self._pending_lock:
+            self._filter_add(keys)
+
+    def might_contain(self, key: str) -> bool:
+        """
+        Check the key filter. False means the key is definitely not stored;
+        True means it may be (always True when the filter is disabled).
+        """
+        key_filter = self.key_filter
+        if key_filter is None or key in key_filter:
+            return True
+        self.filter_negatives += 1
+        return False
+
+    def filter_fp_rate(self) -> float:
+        """Observed share of absent keys that the filter failed to rule out."""
+        return self.filter_false_positives / max(self.filter_false_positives + self.filter_negatives, 1)
+
+    def _build_filter(self) -> None:
+        """
+        Size a filter for the current table, fill it with every stored key and install it.
+        Puts that race with the scan are added through ``_next_filter``.
+        """
+        with self._write_lock:
+            rows = self._writer.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        key_filter = BloomFilter(max(self.filter_capacity, 2 * rows), self.filter_error_rate)
+        with self._pending_lock:
+            # Unflushed rows are added now; anything put from here on goes to both filters
+            key_filter.update(self._pending_puts)
+            key_filter.update(self._inflight_puts)
+            self._next_filter = key_filter
+        with self._write_lock:
+            key_filter.update(key for (key,) in self._writer.execute("SELECT key FROM cache"))
+        with self._pending_lock:
+            self.key_filter = key_filter
+            self._next_filter = None
+            self._deleted_since_rebuild = 0
+
+    def rebuild_filter(self) -> None:
+        """Rebuild the key filter from the table, dropping bits left by deleted rows."""
+        if self.key_filter is not None:
+            self._build_filter()
+
+    def touch(self, key: str, timestamp: float) -> None:
+        """Record an access: bump access_count and refresh the timestamp."""
+        self.touch_many([key], timestamp)
+
+    def touch_many(self, keys: Iterable[str], timestamp: float) -> None:
+        """Record one access for each key."""
+        if not self.write_behind:
+            with self._write_lock:
+                with self._writer:
+                    self._writer.executemany(_TOUCH, [(1, timestamp, key) for key in keys])
+            return
+
+        with self._pending_lock:
+            for key in keys:
+                row = self._pending_puts.get(key)
+                if row is not None:
+                    self._pending_puts[key] = row[:3] + (timestamp, row[4] + 1) + row[5:]
+                else:
+                    count, _ = self._pending_touches.get(key, (0, timestamp))
+                    self._pending_touches[key] = (count + 1, timestamp)
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float, int, Optional[float]]]:
+        """
+        Look up a live row, including writes that have not been flushed yet.
+        access_count is approximate while a flush is committing concurrently.
+
+        Returns:
+            Optional[Tuple[bytes, float, int, Optional[float]]]:
+            (value, fidelity, access_count, expires_at) or None if absent or expired.
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Tuple[bytes, float, int, Optional[float]]]:
+        """
+        Look up several keys with batched ``WHERE key IN (...)`` queries.
+        Keys ruled out by the key filter are not queried.
+
+        Returns:
+            Dict[str, Tuple[bytes, float, int, Optional[float]]]:
+            (value, fidelity, access_count, expires_at) for each live key found.
+        """
+        now = time.time()
+        found = {}
+        touched = {}
+        remaining = []
+        with self._pending_lock:
+            for key in dict.fromkeys(keys):
+                row = self._pending_puts.get(key) or self._inflight_puts.get(key)
+                if row is not None:
+                    if _live(row, now):
+                        found[key] = (row[1], row[2], row[4], row[5])
+                elif self.might_contain(key):
+                    touched[key] = self._pending_touches.get(key, (0, 0.0))[0]
+                    remaining.append(key)
+
+        conn = self._reader()
+        for i in range(0, len(remaining), _IN_BATCH):
+            chunk = remaining[i:i + _IN_BATCH]
+            placeholders = ",".join("?" * len(chunk))
+            for key, value, fidelity, access_count, expires_at in conn.execute(
+                f"SELECT key, value, fidelity, access_count, expires_at FROM cache "
+                f"WHERE key IN ({placeholders}) AND (expires_at IS NULL OR expires_at > ?)",
+                (*chunk, now)
+            ):
+                found[key] = (value, fidelity, access_count + touched[key], expires_at)
+        if self.key_filter is not None:
+            self.filter_false_positives += sum(key not in found for key in remaining)
+        return found
+
+    def iter_hottest(
+        self,
+        limit: Optional[int] = None,
+        batch_size: int = 256
+    ) -> Iterator[List[Tuple[str, bytes, float, int, Optional[float]]]]:
+        """
+        Stream live rows hottest first (highest access_count, then most recent), e.g. to warm
+        the memory tier after a restart. Unflushed writes are not included.
+
+        Args:
+            limit (Optional[int]): Maximum number of rows. None streams the whole table.
+            batch_size (int): Rows per yielded batch.
+
+        Yields:
+            List[Tuple[str, bytes, float, int, Optional[float]]]:
+            (key, value, fidelity, access_count, expires_at) rows.
+        """
+        cursor = self._reader().execute(
+            "SELECT key, value, fidelity, access_count, expires_at FROM cache "
+            "WHERE expires_at IS NULL OR expires_at > ? "
+            "ORDER BY access_count DESC, timestamp DESC LIMIT ?",
+            (time.time(), -1 if limit is None else limit)
+        )
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield rows
+        finally:
+            cursor.close()
+
+    def flush(self) -> int:
+        """
+        Write all pending rows in one transaction.
+
+        Returns:
+            int: Number of rows written or updated.
+        """
+        with self._write_lock:
+            with self._pending_lock:
+                puts, self._pending_puts = self._pending_puts, {}
+                touches, self._pending_touches = self._pending_touches, {}
+                self._inflight_puts = puts
+            if not puts and not touches:
+                return 0
+            try:
+                with self._writer:
+                    if puts:
+                        self._writer.executemany(_UPSERT, puts.values())
+                    if touches:
+                        self._writer.executemany(
+                            _TOUCH, [(count, ts, key) for key, (count, ts) in touches.items()]
+                        )
+            finally:
+                with self._pending_lock:
+                    self._inflight_puts = {}
+            written = len(puts) + len(touches)
+            self.flush_count += 1
+            self.rows_flushed += written
+            return written
+
+    def _measure_disk_bytes(self) -> int:
+        with self._write_lock:
+            return self._writer.execute("SELECT COALESCE(SUM(length(value)), 0) FROM cache").fetchone()[0]
+
+    def run_maintenance(self) -> Dict[str, int]:
+        """
+        Delete expired rows, enforce the disk budget and release freed pages.
+        The key filter is rebuilt once deletions or growth have degraded it.
+
+        Returns:
+            Dict[str, int]: Rows expired and evicted in this pass, and stored bytes after it.
+        """
+        self.flush()
+        with self._write_lock:
+            with self._writer:
+                expired = self._writer.execute(
+                    "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+                ).rowcount
+            disk_bytes = self._writer.execute(
+                "SELECT COALESCE(SUM(length(value)), 0) FROM cache"
+            ).fetchone()[0]
+
+            evicted = 0
+            if self.disk_budget_bytes is not None and disk_bytes > self.disk_budget_bytes:
+                excess = disk_bytes - self.disk_budget_bytes
+                victims = []
+                for key, size in self._writer.execute(
+                    "SELECT key, length(value) FROM cache ORDER BY access_count, timestamp"
+                ):
+                    victims.append((key,))
+                    excess -= size or 0
+                    disk_bytes -= size or 0
+                    if excess <= 0:
+                        break
+                with self._writer:
+                    self._writer.executemany("DELETE FROM cache WHERE key = ?", victims)
+                evicted = len(victims)
+
+            if expired or evicted:
+                self._writer.execute("PRAGMA incremental_vacuum")
+            self.disk_bytes = disk_bytes
+            self.rows_expired += expired
+            self.rows_evicted += evicted
+            self._deleted_since_rebuild += expired + evicted
+
+        key_filter = self.key_filter
+        if key_filter is not None and (key_filter.count > key_filter.capacity
+                                       or self._deleted_since_rebuild > key_filter.count // 4):
+            self.rebuild_filter()
+
+        if self.maintenance_hook is not None:
+            self.maintenance_hook()
+        return {"expired": expired, "evicted": evicted, "disk_bytes": disk_bytes}
+
+    def _background_loop(self) -> None:
+        timeout = self.flush_interval if self.write_behind else self.maintenance_interval
+        next_maintenance = time.monotonic() + (self.maintenance_interval or 0)
+        while not self._closed:
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+            if self._closed:
+                break
+            try:
+                if self.write_behind:
+                    self.flush()
+                if self.maintenance_interval and time.monotonic() >= next_maintenance:
+                    # Scheduled first, so a failing pass is retried next interval, not every flush
+                    next_maintenance = time.monotonic() + self.maintenance_interval
+                    self.run_maintenance()
+            except Exception as e:
+                # Includes maintenance_hook errors; the thread must survive to keep flushing writes
+                logger.error("Background cache maintenance failed: %s", e)
+
+    def discard_many(self, rows: Iterable[Tuple[str, bytes]]) -> int:
+        """
+        Delete (key, value) rows whose stored value is still exactly ``value``, e.g. rows
+        that could not be decrypted. A key rewritten since it was read is left alone.
+
+        Returns:
+            int: Number of rows deleted, including unflushed writes.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        with self._write_lock:
+            dropped = 0
+            with self._pending_lock:
+                for key, value in rows:
+                    pending = self._pending_puts.get(key)
+                    if pending is not None and pending[1] == value:
+                        del self._pending_puts[key]
+                        dropped += 1
+            with self._writer:
+                deleted = self._writer.executemany("DELETE FROM cache WHERE key = ? AND value = ?", rows).rowcount
+            self._deleted_since_rebuild += deleted
+        return dropped + deleted
+
+    def pending(self) -> int:
+        """Number of writes waiting for the flusher."""
+        with self._pending_lock:
+            return len(self._pending_puts) + len(self._pending_touches)
+
+    def clear(self) -> None:
+        """Delete every row, discarding unflushed writes."""
+        with self._write_lock:
+            with self._pending_lock:
+                self._pending_puts.clear()
+                self._pending_touches.clear()
+                self._inflight_puts = {}
+            self._writer.execute("DELETE FROM cache")
+            self._writer.commit()
+            self.disk_bytes = 0
+            if self.key_filter is not None:
+                with self._pending_lock:
+                    self.key_filter = BloomFilter(self.filter_capacity, self.filter_error_rate)
+                    self._deleted_since_rebuild = 0
+
+    def close(self) -> None:
+        """Flush pending writes, stop the background worker and close all connections."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        if self._worker is not None:
+            self._worker.join()
+        self.flush()
+        with self._readers_lock:
+            for _, conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        with self._write_lock:
+            self._writer.close()
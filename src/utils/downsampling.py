@@ -0,0 +1,188 @@
+# src/utils/downsampling.py
+"""
+Downsampling of long time series for plotting.
+A line drawn with more points than its output has pixels looks no different,
+but it takes longer to render and to send. The plot helpers and the dashboard
+telemetry endpoints reduce series to a point budget taken from the output width:
+- ``lttb`` (Largest-Triangle-Three-Buckets) keeps the points that best preserve
+  the visual shape of the line.
+- ``minmax`` keeps the smallest and largest value of every bucket, so spikes and
+  the drawn envelope are exactly preserved.
+"""
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+DOWNSAMPLING_METHODS = ("lttb", "minmax")
+
+# Points per horizontal pixel: one bucket per pixel column still holds its min and max
+POINTS_PER_PIXEL = 2
+
+
+def target_points(width_px: float, points_per_pixel: int = POINTS_PER_PIXEL) -> int:
+    """Point budget for a plot ``width_px`` pixels wide."""
+    return max(3, int(width_px * points_per_pixel))
+
+
+def _numeric_x(x: Optional[Sequence], n: int) -> np.ndarray:
+    """x as float64 for the triangle areas; datetimes become nanoseconds, other types positions."""
+    if x is None:
+        return np.arange(n, dtype=np.float64)
+    values = np.asarray(x)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    if np.issubdtype(values.dtype, np.number):
+        return values.astype(np.float64)
+    return np.arange(n, dtype=np.float64)
+
+
+def lttb_indices(x: Optional[Sequence], y: Sequence, n_out: int) -> np.ndarray:
+    """
+    Indices of the ``n_out`` points chosen by Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The points in between are split into
+    ``n_out - 2`` buckets. From each bucket, the point kept is the one that forms the
+    largest triangle with the point kept from the previous bucket and the mean of the
+    next bucket.
+
+    Args:
+        x (Optional[Sequence]): Sample positions, numeric or datetime, non-decreasing;
+            None means equally spaced.
+        y (Sequence): Sample values.
+        n_out (int): Number of points to keep.
+
+    Returns:
+        np.ndarray: Increasing indices into ``y``; all of them when ``n_out >= len(y)``.
+    """
+    values = np.asarray(y, dtype=np.float64)
+    n = len(values)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1][:max(n_out, 1)])
+    positions = _numeric_x(x, n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    counts = np.diff(edges)
+    # Mean of every interior bucket, and the last point standing in for the bucket after the last
+    mean_x = np.append(np.add.reduceat(positions[1:n - 1], edges[:-1] - 1) / counts, positions[-1])
+    mean_y = np.append(np.add.reduceat(values[1:n - 1], edges[:-1] - 1) / counts, values[-1])
+
+    # The loop is inherently sequential; plain Python scalars keep its per-bucket overhead low
+    edges, mean_x, mean_y = edges.tolist(), mean_x.tolist(), mean_y.tolist()
+    selected = [0]
+    anchor = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        anchor_x, anchor_y = float(positions[anchor]), float(values[anchor])
+        # Twice the triangle area; the constant factor does not change the argmax
+        area = np.abs((anchor_x - mean_x[bucket + 1]) * (values[start:end] - anchor_y)
+                      - (anchor_x - positions[start:end]) * (mean_y[bucket + 1] - anchor_y))
+        best = int(area.argmax())
+        if area[best] != area[best]:
+            # argmax stops at the first NaN; pick the largest real area instead
+            best = int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        anchor = start + best
+        selected.append(anchor)
+    selected.append(n - 1)
+    return np.array(selected, dtype=np.intp)
+
+
+def minmax_indices(y: Sequence, n_out: int) -> np.ndarray:
+    """
+    Indices of the minimum and maximum of each of ``n_out // 2`` equal-count buckets,
+    plus the first and last point.
+
+    Args:
+        y (Sequence): Sample values.
+        n_out (int): Approximate number of points to keep.
+
+    Returns:
+        np.ndarray: Increasing indices into ``y``; all of them when ``n_out >= len(y)``.
+    """
+    values = np.asarray(y, dtype=np.float64)
+    n = len(values)
+    if n_out >= n:
+        return np.arange(n)
+    buckets = max(1, n_out // 2)
+    size = -(-n // buckets)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = values
+    padded = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    lows = offsets + np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1)
+    highs = offsets + np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1)
+    indices = np.concatenate(([0, n - 1], lows, highs))
+    return np.unique(np.minimum(indices, n - 1))
+
+
+def downsample_indices(x: Optional[Sequence], y: Sequence, n_out: int, method: str = "lttb") -> np.ndarray:
+    """
+    Indices of the points to keep from one series.
+
+    Raises:
+        ValueError: If ``method`` is not one of ``DOWNSAMPLING_METHODS``.
+    """
+    if method == "lttb":
+        return lttb_indices(x, y, n_out)
+    if method == "minmax":
+        return minmax_indices(y, n_out)
+    raise ValueError(f"Unknown downsampling method {method!r}; expected one of {DOWNSAMPLING_METHODS}.")
+
+
+def downsample(x: Optional[Sequence], y: Sequence, n_out: int,
+               method: str = "lttb") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce one series to about ``n_out`` points.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The kept x values (positions when ``x`` is None)
+        and y values.
+    """
+    values = np.asarray(y)
+    indices = downsample_indices(x, values, n_out, method)
+    positions = np.arange(len(values)) if x is None else np.asarray(x)
+    return positions[indices], values[indices]
+
+
+def downsample_columns(columns: Mapping[str, Any], x: str, n_out: int,
+                       method: str = "lttb") -> Dict[str, np.ndarray]:
+    """
+    Reduce several series sharing the x column ``x`` (a DataFrame or a dict of arrays,
+    such as a ring buffer window) to about ``n_out`` rows.
+
+    Each series gets an equal share of the budget. The rows kept are the union of the
+    shares, so every series keeps its own shape.
+    """
+    series = [name for name in columns if name != x]
+    first = np.asarray(columns[x])
+    if not series or n_out >= len(first):
+        return {name: np.asarray(columns[name]) for name in columns}
+    share = max(3, n_out // len(series))
+    indices = np.unique(np.concatenate([downsample_indices(first, columns[name], share, method)
+                                        for name in series]))
+    return {name: np.asarray(columns[name])[indices] for name in columns}
+
+
+def plot_series(ax, x: Optional[Sequence], y: Sequence, max_points: Optional[int] = None,
+                method: str = "lttb", **kwargs):
+    """
+    ``ax.plot(x, y, **kwargs)`` with the series first reduced to what the axes can show.
+
+    Args:
+        ax: Matplotlib axes to draw on (e.g. ``plt.gca()``).
+        x (Optional[Sequence]): Sample positions; None plots against the sample index.
+        y (Sequence): Sample values.
+        max_points (Optional[int]): Point budget. Defaults to ``POINTS_PER_PIXEL`` per
+            pixel of the axes width; 0 plots every point.
+        method (str): One of ``DOWNSAMPLING_METHODS``.
+
+    Returns:
+        The list of lines returned by ``ax.plot``.
+    """
+    if max_points is None:
+        max_points = target_points(ax.get_window_extent().width)
+    if max_points:
+        x, y = downsample(x, y, max_points, method)
+    elif x is None:
+        x = np.arange(len(y))
+    return ax.plot(x, y, **kwargs)
@@ -2,7 +2,7 @@
 
 import json
 
-defread_json(file_path):
+def read_json(file_path):
     """Reads a JSON file and returns its contents.
     
     Args:
@@ -0,0 +1,207 @@
+# utils/http_client.py
+
+import random
+import time
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Status codes that usually indicate a transient server-side condition
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Methods safe to send twice; others are only retried when the request never reached the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+
+class HTTPClient:
+    """Pooled HTTP client with timeouts, jittered retries and bulk requests.
+
+    A single keep-alive ``requests.Session`` is shared by every call, so
+    repeated requests to the same host reuse TCP/TLS connections instead of
+    paying a fresh handshake each time. The session is safe to use from the
+    worker threads backing ``get_many`` and ``post_many``.
+    """
+
+    def __init__(self, base_url=None, timeout=(3.05, 10.0), max_retries=3,
+                 backoff_factor=0.25, backoff_max=5.0, pool_connections=10,
+                 pool_maxsize=10, max_workers=8, retry_statuses=RETRY_STATUSES,
+                 retry_methods=IDEMPOTENT_METHODS):
+        """Initializes the HTTPClient.
+
+        Args:
+            base_url (str): Optional URL prefix for relative endpoints.
+            timeout (float or tuple): Connect/read timeout passed to requests.
+            max_retries (int): Number of retries after the first attempt.
+            backoff_factor (float): Base delay in seconds for exponential backoff.
+            backoff_max (float): Upper bound on a single backoff delay.
+            pool_connections (int): Number of per-host connection pools to cache.
+            pool_maxsize (int): Maximum connections kept alive per host.
+            max_workers (int): Thread pool size for the bulk APIs.
+            retry_statuses (Iterable[int]): Response codes that trigger a retry.
+            retry_methods (Iterable[str]): HTTP methods retried on timeouts and
+                ``retry_statuses``. Other methods (POST, PATCH by default) are only
+                retried when the connection could not be opened, since the server
+                may already have acted on a request that timed out. ``None``
+                retries every method.
+        """
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.max_workers = max_workers
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = (frozenset(m.upper() for m in retry_methods)
+                              if retry_methods is not None else None)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def _url(self, endpoint):
+        """Resolves an endpoint against the base URL."""
+        if self.base_url is None or endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _backoff(self, attempt):
+        """Returns a "full jitter" delay for the given retry attempt."""
+        cap = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    def _can_retry(self, method):
+        return self.retry_methods is None or method.upper() in self.retry_methods
+
+    @staticmethod
+    def _never_sent(error):
+        """Whether a request failed before the connection was established."""
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        # urllib3's NewConnectionError (refused, DNS failure) subclasses ConnectTimeoutError
+        return isinstance(reason, ConnectTimeoutError)
+
+    def request(self, method, endpoint, **kwargs):
+        """Sends a request, retrying transient failures with jittered backoff.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Endpoint relative to ``base_url`` or an absolute URL.
+            **kwargs: Extra arguments forwarded to ``requests.Session.request``.
+
+        Returns:
+            requests.Response: The successful response.
+
+        Raises:
+            requests.RequestException: If the request still fails after all retries.
+        """
+        url = self._url(endpoint)
+        kwargs.setdefault("timeout", self.timeout)
+        retryable = self._can_retry(method)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries or not (retryable or self._never_sent(e)):
+                    raise
+                logger.warning("%s %s failed (%s), retrying", method, url, e)
+            else:
+                if (response.status_code not in self.retry_statuses or not retryable
+                        or attempt >= self.max_retries):
+                    response.raise_for_status()
+                    return response
+                logger.warning("%s %s returned %d, retrying", method, url, response.status_code)
+                response.close()
+            time.sleep(self._backoff(attempt))
+
+    def get(self, endpoint, **kwargs):
+        """Sends a GET request and returns the response."""
+        return self.request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint, json=None, **kwargs):
+        """Sends a POST request with a JSON body and returns the response."""
+        return self.request("POST", endpoint, json=json, **kwargs)
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="http-client")
+            return self._executor
+
+    def _map(self, fn, items, return_exceptions):
+        futures = [self._get_executor().submit(fn, *item) for item in items]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except requests.RequestException as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    def get_many(self, endpoints, return_exceptions=False, **kwargs):
+        """Fetches several endpoints concurrently.
+
+        Args:
+            endpoints (Iterable[str]): Endpoints to GET.
+            return_exceptions (bool): Place failures in the result list instead
+                of raising the first one.
+            **kwargs: Extra arguments forwarded to each request.
+
+        Returns:
+            list: Responses in the same order as ``endpoints``.
+        """
+        return self._map(lambda endpoint: self.get(endpoint, **kwargs),
+                         [(endpoint,) for endpoint in endpoints], return_exceptions)
+
+    def post_many(self, items, return_exceptions=False, **kwargs):
+        """Posts several JSON payloads concurrently.
+
+        Args:
+            items (Iterable[tuple]): ``(endpoint, data)`` pairs to POST.
+            return_exceptions (bool): Place failures in the result list instead
+                of raising the first one.
+            **kwargs: Extra arguments forwarded to each request.
+
+        Returns:
+            list: Responses in the same order as ``items``.
+        """
+        return self._map(lambda endpoint, data: self.post(endpoint, json=data, **kwargs),
+                         [tuple(item) for item in items], return_exceptions)
+
+    def close(self):
+        """Shuts down the worker pool and releases pooled connections."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# Example usage
+if __name__ == "__main__":
+    with HTTPClient("https://api.example.com", timeout=5) as client:
+        try:
+            responses = client.get_many(["status", "data_endpoint"], return_exceptions=True)
+            print("Responses:", responses)
+        except requests.RequestException as e:
+            print("An error occurred:", e)
@@ -0,0 +1,43 @@
+# src/utils/lazy_import.py
+"""
+Lazy package exports for QuantumNet-Core.
+Packages whose submodules pull in heavy dependencies (matplotlib, qiskit, requests)
+list those names here instead of importing them in ``__init__``, so importing the
+package stays cheap and the dependency is loaded on first attribute access (PEP 562).
+"""
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def lazy_exports(package: str, attributes: Mapping[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module-level ``__getattr__`` and ``__dir__`` of a package with lazy exports.
+
+    Usage in a package ``__init__``::
+
+        __getattr__, __dir__ = lazy_exports(__name__, {"visualize_state": ".state_visualization"})
+
+    Args:
+        package (str): The package's ``__name__``.
+        attributes (Mapping[str, str]): Exported names mapped to the (relative) module defining them.
+
+    Returns:
+        Tuple[Callable, Callable]: ``__getattr__`` and ``__dir__`` for the package.
+    """
+    attributes = dict(attributes)
+    namespace = vars(sys.modules[package])
+
+    def __getattr__(name: str) -> Any:
+        module = attributes.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        # Cache on the package so later lookups never reach __getattr__
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
@@ -1,35 +1,220 @@
 # utils/logger.py
 
+import atexit
+import itertools
 import logging
+import logging.handlers
+import queue
+import threading
+import time
+
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Handlers installed by this module carry this attribute so repeated calls can find them
+_HANDLER_MARK = "_quantumnet_handler"
+
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def _owned_handler(logger):
+    for handler in logger.handlers:
+        if getattr(handler, _HANDLER_MARK, False):
+            return handler
+    return None
+
+
+def configure_logging(level=logging.INFO, handlers=None, fmt=DEFAULT_FORMAT):
+    """Routes all logging through a queue drained by a background thread.
+
+    The root logger gets a single ``QueueHandler``, so emitting a record only
+    formats the message and enqueues it; the handlers doing the actual I/O run
+    on the ``QueueListener`` thread. Handlers previously attached to the root
+    logger (e.g. by ``logging.basicConfig``) are replaced. Calling this again
+    reconfigures the pipeline instead of stacking handlers.
+
+    Args:
+        level (int): Root logging level (default is logging.INFO).
+        handlers (list): Handlers run by the listener thread. Defaults to a
+            console ``StreamHandler``.
+        fmt (str): Format applied to handlers that have no formatter yet.
+
+    Returns:
+        logging.handlers.QueueListener: The running listener.
+    """
+    global _listener
+    if handlers is None:
+        handlers = [logging.StreamHandler()]
+    formatter = logging.Formatter(fmt)
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(formatter)
+
+    with _listener_lock:
+        shutdown_logging()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        setattr(queue_handler, _HANDLER_MARK, True)
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """Stops the background listener after it has written all queued records."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if getattr(handler, _HANDLER_MARK, False):
+                root.removeHandler(handler)
+
+
+atexit.register(shutdown_logging)
+
 
 def setup_logger(name, level=logging.INFO):
     """Sets up a logger with the specified name and logging level.
-    
+
+    Calling it again for the same name only updates the level. When
+    ``configure_logging`` is active, no handler is added and records propagate
+    to the shared queue.
+
     Args:
         name (str): The name of the logger.
         level (int): The logging level (default is logging.INFO).
-    
+
     Returns:
         logging.Logger: Configured logger instance.
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
-    # Create console handler and set level
-    ch = logging.StreamHandler()
+
+    ch = _owned_handler(logger)
+    if ch is None and _listener is not None:
+        return logger
+    if ch is None:
+        # Create console handler with the shared format
+        ch = logging.StreamHandler()
+        ch.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+        setattr(ch, _HANDLER_MARK, True)
+        logger.addHandler(ch)
     ch.setLevel(level)
-    
-    # Create formatter
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    ch.setFormatter(formatter)
-    
-    # Add handler to logger
-    logger.addHandler(ch)
-    
+
+    return logger
+
+
+class SamplingFilter(logging.Filter):
+    """Passes one in every ``every`` records below ``min_level``.
+
+    Meant for high-frequency events where a representative trickle is enough;
+    records at or above ``min_level`` always pass.
+    """
+
+    def __init__(self, every=100, min_level=logging.WARNING):
+        """Initializes the SamplingFilter.
+
+        Args:
+            every (int): Keep one record out of this many.
+            min_level (int): Records at this level or above are never sampled.
+        """
+        super().__init__()
+        if every < 1:
+            raise ValueError("every must be at least 1.")
+        self.every = every
+        self.min_level = min_level
+        self._counter = itertools.count()
+        self.dropped = 0
+
+    def filter(self, record):
+        if record.levelno >= self.min_level or next(self._counter) % self.every == 0:
+            return True
+        self.dropped += 1
+        return False
+
+
+class RateLimitFilter(logging.Filter):
+    """Token-bucket limit on records per message template.
+
+    Each distinct ``record.msg`` (the unformatted %-style template) gets its own
+    bucket, so one noisy event cannot starve others. The next record let through
+    after a suppression carries the number of dropped records in
+    ``record.suppressed``.
+    """
+
+    def __init__(self, rate=10.0, burst=None, min_level=logging.ERROR):
+        """Initializes the RateLimitFilter.
+
+        Args:
+            rate (float): Sustained records per second allowed per template.
+            burst (int): Records allowed at once. Defaults to ``rate``.
+            min_level (int): Records at this level or above are never limited.
+        """
+        super().__init__()
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.burst = max(1.0, float(burst if burst is not None else rate))
+        self.min_level = min_level
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def filter(self, record):
+        if record.levelno >= self.min_level:
+            return True
+        now = time.monotonic()
+        key = (record.name, record.msg)
+        with self._lock:
+            tokens, last, suppressed = self._buckets.get(key, (self.burst, now, 0))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens < 1.0:
+                self._buckets[key] = (tokens, now, suppressed + 1)
+                self.dropped += 1
+                return False
+            self._buckets[key] = (tokens - 1.0, now, 0)
+        record.suppressed = suppressed
+        return True
+
+
+def throttle_logger(name, every=None, rate=None, burst=None):
+    """Attaches sampling and/or rate limiting to a logger, replacing earlier ones.
+
+    Args:
+        name (str): The name of the logger.
+        every (int): Keep one in ``every`` records (see ``SamplingFilter``).
+        rate (float): Records per second per message (see ``RateLimitFilter``).
+        burst (int): Burst size for the rate limit.
+
+    Returns:
+        logging.Logger: The logger.
+    """
+    logger = logging.getLogger(name)
+    for existing in list(logger.filters):
+        if isinstance(existing, (SamplingFilter, RateLimitFilter)):
+            logger.removeFilter(existing)
+    if every is not None:
+        logger.addFilter(SamplingFilter(every))
+    if rate is not None:
+        logger.addFilter(RateLimitFilter(rate, burst))
     return logger
 
+
 # Example usage
 if __name__ == "__main__":
+    configure_logging()
     logger = setup_logger("TestLogger")
     logger.info("This is an info message.")
     logger.error("This is an error message.")
+
+    throttle_logger("TestLogger.events", rate=5)
+    events = logging.getLogger("TestLogger.events")
+    for i in range(1000):
+        events.info("Event %d processed", i)  # Only the first few pass
@@ -0,0 +1,241 @@
+# src/utils/metrics_registry.py
+"""
+In-process metrics registry for QuantumNet-Core.
+Counters, gauges and fixed-bucket histograms that subsystems update on hot paths
+and the dashboard exposes in the Prometheus text format. Counters and histograms
+give every thread its own shard: an update is a thread-local lookup plus an
+increment, with no lock, and a scrape sums the shards.
+"""
+import bisect
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Latency buckets in seconds, from 10us to 10s
+DEFAULT_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _format_labels(labels: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Sharded:
+    """Base for metrics whose updates go to a per-thread shard (a plain list)."""
+    def __init__(self, shard_size: int):
+        self._shard_size = shard_size
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, list]] = []
+        # Totals of shards whose threads have exited
+        self._retired = [0] * shard_size
+        self._lock = threading.Lock()
+
+    def _shard(self) -> list:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = [0] * self._shard_size
+            with self._lock:
+                self._shards.append((threading.current_thread(), shard))
+            return shard
+
+    def _totals(self) -> list:
+        with self._lock:
+            totals = list(self._retired)
+            alive = []
+            for thread, shard in self._shards:
+                for i, value in enumerate(shard):
+                    totals[i] += value
+                if thread.is_alive():
+                    alive.append((thread, shard))
+                else:
+                    # Fold finished threads into the retired totals so shards do not pile up
+                    for i, value in enumerate(shard):
+                        self._retired[i] += value
+            self._shards = alive
+        return totals
+
+
+class Counter(_Sharded):
+    """Monotonically increasing count."""
+    def __init__(self):
+        super().__init__(1)
+
+    def inc(self, amount: float = 1) -> None:
+        self._shard()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._totals()[0]
+
+
+class Gauge:
+    """Value that can go up and down, or be computed at scrape time by a callback."""
+    def __init__(self):
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Report ``function()`` at every scrape instead of the stored value."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        return float(self._function()) if self._function is not None else self._value
+
+
+class Histogram(_Sharded):
+    """Counts of observations in fixed buckets, plus their sum and count."""
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        # Shard layout: one count per bucket, one for +Inf, then the sum
+        super().__init__(len(self.buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        shard = self._shard()
+        shard[bisect.bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def time(self) -> "_Timer":
+        """Context manager observing the elapsed seconds of its block."""
+        return _Timer(self)
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """(cumulative counts per bucket including +Inf, sum, count)."""
+        totals = self._totals()
+        cumulative, running = [], 0
+        for count in totals[:-1]:
+            running += count
+            cumulative.append(running)
+        return cumulative, totals[-1], running
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+class _Family:
+    """A named metric and its children, one per distinct label set."""
+    def __init__(self, name: str, kind: str, documentation: str, factory: Callable[[], object]):
+        self.name = name
+        self.kind = kind
+        self.documentation = documentation
+        self.factory = factory
+        self.children: Dict[LabelKey, object] = {}
+
+
+class MetricsRegistry:
+    """
+    Named counters, gauges and histograms, rendered together for a scrape.
+    Asking for an existing name and label set returns the same metric object, so modules
+    fetch their metrics once at import and update them directly afterwards.
+    """
+    def __init__(self):
+        self._families: Dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str, kind: str, documentation: str, labels: Optional[Dict[str, str]],
+             factory: Callable[[], object]):
+        key: LabelKey = tuple(sorted((str(k), str(v)) for k, v in (labels or {}).items()))
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = _Family(name, kind, documentation, factory)
+            elif family.kind != kind:
+                raise ValueError(f"Metric {name!r} is already registered as a {family.kind}.")
+            child = family.children.get(key)
+            if child is None:
+                child = family.children[key] = family.factory()
+            return child
+
+    def counter(self, name: str, documentation: str = "", labels: Optional[Dict[str, str]] = None) -> Counter:
+        """Get or create a counter. By convention counter names end in ``_total``."""
+        return self._get(name, "counter", documentation, labels, Counter)
+
+    def gauge(self, name: str, documentation: str = "", labels: Optional[Dict[str, str]] = None) -> Gauge:
+        """Get or create a gauge."""
+        return self._get(name, "gauge", documentation, labels, Gauge)
+
+    def histogram(self, name: str, documentation: str = "", labels: Optional[Dict[str, str]] = None,
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Get or create a histogram. All children of one name share the first caller's buckets."""
+        buckets = tuple(buckets)
+        return self._get(name, "histogram", documentation, labels, lambda: Histogram(buckets))
+
+    def render_text(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            families = [(family, list(family.children.items())) for family in self._families.values()]
+        lines = []
+        for family, children in sorted(families, key=lambda item: item[0].name):
+            if family.documentation:
+                lines.append(f"# HELP {family.name} {family.documentation}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for labels, metric in children:
+                if family.kind != "histogram":
+                    try:
+                        value = metric.value
+                    except Exception:
+                        continue  # A failing gauge callback must not break the scrape
+                    lines.append(f"{family.name}{_format_labels(labels)} {_format_value(value)}")
+                    continue
+                cumulative, total, count = metric.snapshot()
+                for bound, bucket_count in zip(metric.buckets + (math.inf,), cumulative):
+                    lines.append(f"{family.name}_bucket{_format_labels(labels, ('le', _format_value(bound)))} "
+                                 f"{bucket_count}")
+                lines.append(f"{family.name}_sum{_format_labels(labels)} {_format_value(total)}")
+                lines.append(f"{family.name}_count{_format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry used by the instrumented modules and the dashboard scrape endpoint
+REGISTRY = MetricsRegistry()
+
+
+def counter(name: str, documentation: str = "", labels: Optional[Dict[str, str]] = None) -> Counter:
+    """Counter in the process-wide registry."""
+    return REGISTRY.counter(name, documentation, labels)
+
+
+def gauge(name: str, documentation: str = "", labels: Optional[Dict[str, str]] = None) -> Gauge:
+    """Gauge in the process-wide registry."""
+    return REGISTRY.gauge(name, documentation, labels)
+
+
+def histogram(name: str, documentation: str = "", labels: Optional[Dict[str, str]] = None,
+              buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+    """Histogram in the process-wide registry."""
+    return REGISTRY.histogram(name, documentation, labels, buckets)
@@ -1,21 +1,176 @@
 # utils/performance_monitor.py
 
+import collections
+import contextvars
+import functools
+import inspect
+import math
+import threading
 import time
 
+
+class QuantileSketch:
+    """Streaming quantile estimator with bounded relative error.
+
+    Values are counted in logarithmic buckets (as in DDSketch), so any quantile
+    is reported within ``relative_accuracy`` of the true value while memory grows
+    only with the logarithm of the value range.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        """Initializes the QuantileSketch.
+
+        Args:
+            relative_accuracy (float): Maximum relative error of reported quantiles.
+        """
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets = {}
+        self._zeros = 0
+        self.count = 0
+
+    def add(self, value):
+        """Adds a non-negative value."""
+        self.count += 1
+        if value <= 0:
+            self._zeros += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def quantile(self, q):
+        """Returns the estimated value at quantile ``q`` (0 <= q <= 1)."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                return 2 * self._gamma ** index / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
+
+    def merge(self, other):
+        """Adds the counts of another sketch with the same accuracy."""
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self._zeros += other._zeros
+        self.count += other.count
+
+
+class SpanStats:
+    """Aggregated timings for every span recorded under one name."""
+
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "sketch")
+
+    def __init__(self, relative_accuracy=0.01):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, duration_ns):
+        self.count += 1
+        self.total_ns += duration_ns
+        self.min_ns = duration_ns if self.min_ns is None else min(self.min_ns, duration_ns)
+        self.max_ns = max(self.max_ns, duration_ns)
+        self.sketch.add(duration_ns)
+
+    def summary(self):
+        """Returns count, total and mean/min/max/p50/p95/p99 durations in seconds."""
+        to_s = 1e-9
+        return {
+            "count": self.count,
+            "total": self.total_ns * to_s,
+            "mean": self.total_ns / max(self.count, 1) * to_s,
+            "min": (self.min_ns or 0) * to_s,
+            "max": self.max_ns * to_s,
+            "p50": self.sketch.quantile(0.50) * to_s,
+            "p95": self.sketch.quantile(0.95) * to_s,
+            "p99": self.sketch.quantile(0.99) * to_s,
+        }
+
+
+class _NullSpan:
+    """Shared do-nothing span handed out while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("monitor", "name", "path", "start_ns", "child_ns", "token")
+
+    def __init__(self, monitor, name):
+        self.monitor = monitor
+        self.name = name
+
+    def __enter__(self):
+        stack = self.monitor._stack.get()
+        self.path = f"{stack[-1].path};{self.name}" if stack else self.name
+        self.child_ns = 0
+        self.token = self.monitor._stack.set(stack + (self,))
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter_ns() - self.start_ns
+        self.monitor._stack.reset(self.token)
+        stack = self.monitor._stack.get()
+        if stack:
+            stack[-1].child_ns += duration
+        self.monitor._record(self.name, self.path, duration, duration - self.child_ns)
+        return False
+
+
 class PerformanceMonitor:
-    """Class for monitoring performance metrics."""
-    
-    def __init__(self):
+    """Class for monitoring performance metrics.
+
+    Besides the original single ``start``/``stop`` timer, the monitor records
+    nestable spans (``span`` context managers and the ``profile`` decorator)
+    timed with ``perf_counter_ns``. Each thread and asyncio task keeps its own
+    span stack. Per-name statistics include streaming p50/p95/p99, and
+    self-times per call stack can be written as collapsed stacks for flamegraph
+    tools. While disabled, spans cost one attribute check.
+    """
+
+    def __init__(self, enabled=True, relative_accuracy=0.01):
+        """Initializes the PerformanceMonitor.
+
+        Args:
+            enabled (bool): Whether spans are recorded.
+            relative_accuracy (float): Relative error of reported percentiles.
+        """
         self.start_time = None
         self.end_time = None
+        self.enabled = enabled
+        self.relative_accuracy = relative_accuracy
+        self._stack = contextvars.ContextVar(f"performance_monitor_{id(self)}", default=())
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._self_ns = {}
+        # Finished spans are queued lock-free and aggregated in batches
+        self._finished = collections.deque()
 
     def start(self):
         """Starts the performance monitoring."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
 
     def stop(self):
         """Stops the performance monitoring and returns the elapsed time."""
-        self.end_time = time.time()
+        self.end_time = time.perf_counter()
         return self.elapsed_time()
 
     def elapsed_time(self):
@@ -24,6 +179,103 @@ class PerformanceMonitor:
             raise RuntimeError("Performance monitoring has not been started or stopped.")
         return self.end_time - self.start_time
 
+    def enable(self):
+        """Starts recording spans."""
+        self.enabled = True
+
+    def disable(self):
+        """Stops recording spans; open spans still finish normally."""
+        self.enabled = False
+
+    def span(self, name):
+        """Returns a context manager timing the enclosed block as ``name``.
+
+        Args:
+            name (str): Span name; nested spans form ``parent;child`` stacks.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def profile(self, name=None):
+        """Decorator timing every call of a function (sync or async) as a span.
+
+        Args:
+            name (str): Span name. Defaults to the function's qualified name.
+        """
+        def decorator(fn):
+            span_name = name or f"{fn.__module__}.{fn.__qualname__}"
+
+            if inspect.iscoroutinefunction(fn):
+                @functools.wraps(fn)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await fn(*args, **kwargs)
+                    with _Span(self, span_name):
+                        return await fn(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with _Span(self, span_name):
+                    return fn(*args, **kwargs)
+            return wrapper
+
+        return decorator
+
+    def _record(self, name, path, duration_ns, self_ns):
+        self._finished.append((name, path, duration_ns, self_ns))
+        if len(self._finished) >= 4096:
+            self._aggregate()
+
+    def _aggregate(self):
+        """Folds queued spans into the per-name and per-stack totals."""
+        with self._lock:
+            finished = self._finished
+            while True:
+                try:
+                    name, path, duration_ns, self_ns = finished.popleft()
+                except IndexError:
+                    break
+                stats = self._stats.get(name)
+                if stats is None:
+                    stats = self._stats[name] = SpanStats(self.relative_accuracy)
+                stats.add(duration_ns)
+                self._self_ns[path] = self._self_ns.get(path, 0) + self_ns
+
+    def stats(self):
+        """Returns per-span-name summaries (durations in seconds)."""
+        self._aggregate()
+        with self._lock:
+            return {name: stats.summary() for name, stats in self._stats.items()}
+
+    def collapsed_stacks(self):
+        """Returns ``stack;frames self_time_us`` lines in collapsed-stack format."""
+        self._aggregate()
+        with self._lock:
+            items = sorted(self._self_ns.items())
+        return [f"{path} {max(self_ns, 0) // 1000}" for path, self_ns in items]
+
+    def dump_collapsed(self, filename):
+        """Writes collapsed stacks (self time in microseconds) for flamegraph tools.
+
+        Args:
+            filename (str): Output path, e.g. ``profile.folded``.
+        """
+        with open(filename, "w") as f:
+            for line in self.collapsed_stacks():
+                f.write(line + "\n")
+
+    def reset(self):
+        """Discards all recorded spans."""
+        with self._lock:
+            self._finished.clear()
+            self._stats.clear()
+            self._self_ns.clear()
+
+
 # Example usage
 if __name__ == "__main__":
     monitor = PerformanceMonitor()
@@ -31,3 +283,13 @@ if __name__ == "__main__":
     time.sleep(1)  # Simulate a process
     elapsed = monitor.stop()
     print(f"Elapsed time: {elapsed:.2f} seconds")
+
+    @monitor.profile("step")
+    def step():
+        with monitor.span("inner"):
+            time.sleep(0.001)
+
+    for _ in range(100):
+        step()
+    print(monitor.stats())
+    print("\n".join(monitor.collapsed_stacks()))
@@ -0,0 +1,109 @@
+# src/utils/ring_buffer.py
+"""
+Fixed-size columnar ring buffer for live telemetry.
+Each field is a preallocated NumPy array, so appends take constant time and the
+memory used never changes however long the process runs. Every value is written
+twice, at ``i`` and ``i + capacity``. That keeps any window of up to ``capacity``
+recent rows contiguous, so window reads are views and never copies.
+"""
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class ColumnarRingBuffer:
+    """
+    Keeps the newest ``capacity`` rows of a fixed set of fields.
+    One writer thread and any number of reader threads may use a buffer at once.
+    """
+    def __init__(self, capacity: int, fields: Dict[str, Any]):
+        """
+        Allocate the buffer.
+
+        Args:
+            capacity (int): Rows kept; older rows are overwritten.
+            fields (Dict[str, Any]): Field names mapped to NumPy dtypes, e.g.
+                ``{"timestamp": "datetime64[ns]", "temperature": np.float64}``.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = capacity
+        self._columns = {name: np.zeros(2 * capacity, dtype=dtype) for name, dtype in fields.items()}
+        self._head = 0  # Total rows ever appended; the next row goes to head % capacity
+        self._lock = threading.Lock()
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column arrays, fixed at construction."""
+        return sum(column.nbytes for column in self._columns.values())
+
+    def __len__(self) -> int:
+        return min(self._head, self.capacity)
+
+    def append(self, **row) -> None:
+        """
+        Add one row in O(1). Fields missing from ``row`` are written as zero.
+
+        Raises:
+            KeyError: If ``row`` has a field the buffer does not know.
+        """
+        unknown = set(row) - set(self._columns)
+        if unknown:
+            raise KeyError(f"Unknown ring buffer fields {sorted(unknown)}.")
+        with self._lock:
+            position = self._head % self.capacity
+            for name, column in self._columns.items():
+                value = row.get(name, 0)
+                column[position] = value
+                column[position + self.capacity] = value
+            self._head += 1
+
+    def window(self, last: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        The newest ``last`` rows (all buffered rows when None), oldest first.
+
+        Returns:
+            Dict[str, np.ndarray]: Read-only views into the buffer. A view stays valid for
+            ``capacity - len(view)`` further appends; copy it to keep it longer.
+        """
+        with self._lock:
+            size = len(self) if last is None else max(0, min(last, len(self)))
+            end = self._head % self.capacity
+            if self._head >= self.capacity:
+                # The mirrored half holds rows head-capacity .. head-1 contiguously
+                end += self.capacity
+            start = end - size
+        views = {}
+        for name, column in self._columns.items():
+            view = column[start:end]
+            view.flags.writeable = False
+            views[name] = view
+        return views
+
+    def since(self, field: str, value, last: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Rows whose ``field`` is at least ``value``; ``field`` must be non-decreasing (e.g. time).
+        ``last`` caps the number of rows returned, keeping the newest.
+        """
+        window = self.window()
+        start = int(np.searchsorted(window[field], np.asarray(value, dtype=window[field].dtype), "left"))
+        if last is not None:
+            start = max(start, len(window[field]) - last)
+        return {name: view[start:] for name, view in window.items()}
+
+    @staticmethod
+    def to_records(window: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+        """Convert a window to JSON-serializable row dicts; datetimes become ISO strings."""
+        columns = {}
+        for name, values in window.items():
+            if np.issubdtype(values.dtype, np.datetime64):
+                columns[name] = np.datetime_as_string(values, unit="ms").tolist()
+            else:
+                columns[name] = values.tolist()
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
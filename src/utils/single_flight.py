@@ -0,0 +1,65 @@
+# src/utils/single_flight.py
+"""
+Per-key call deduplication for QuantumNet-Core.
+Concurrent callers asking for the same key share one execution of the loader
+instead of stampeding a slow backend.
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Runs at most one loader per key at a time.
+    Callers that arrive while a load is in flight block until it finishes and
+    receive the same result, or the same exception.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.shared = 0  # Calls answered by another caller's load
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Execute ``fn(*args, **kwargs)`` once for all concurrent callers of ``key``.
+
+        Args:
+            key (Hashable): Deduplication key.
+            fn (Callable): Loader to run if no call for ``key`` is in flight.
+
+        Returns:
+            Any: The loader's return value.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
@@ -0,0 +1,182 @@
+# src/utils/state_compression.py
+"""
+Fidelity-bounded lossy compression of quantum state vectors for QuantumNet-Core.
+Supports top-k amplitude sparsification, float16 quantization and Schmidt (SVD)
+truncation across a qubit bipartition. Every compressed state records the
+fidelity |<psi|psi'>|^2 between the original and the reconstructed state.
+"""
+import math
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+COMPRESSION_MODES = ("sparse", "float16", "schmidt")
+
+
+def state_fidelity(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Fidelity |<a|b>|^2 / (<a|a><b|b>) between two (unnormalized) pure states.
+
+    Args:
+        a (np.ndarray): First state vector.
+        b (np.ndarray): Second state vector of the same size.
+
+    Returns:
+        float: Fidelity in [0, 1].
+    """
+    a, b = np.ravel(a), np.ravel(b)
+    norms = np.vdot(a, a).real * np.vdot(b, b).real
+    if norms == 0:
+        return 1.0 if not a.any() and not b.any() else 0.0
+    return float(min(1.0, abs(np.vdot(a, b)) ** 2 / norms))
+
+
+def _index_dtype(size: int) -> np.dtype:
+    for dtype in (np.uint16, np.uint32):
+        if size <= np.iinfo(dtype).max + 1:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+def _keep_count(weights: np.ndarray, target_fidelity: float) -> Tuple[int, float]:
+    """Smallest k such that the k largest (already sorted) weights reach the target share."""
+    cumulative = np.cumsum(weights)
+    total = cumulative[-1]
+    k = min(int(np.searchsorted(cumulative, target_fidelity * total * (1 - 1e-12))) + 1, len(weights))
+    return k, float(cumulative[k - 1] / total)
+
+
+class CompressedState:
+    """
+    A compressed state vector and the fidelity its reconstruction is guaranteed to have.
+    ``data`` holds the mode-specific arrays; ``decompress`` restores the original shape,
+    dtype and norm.
+    """
+    __slots__ = ("mode", "shape", "dtype", "fidelity", "data")
+
+    def __init__(self, mode: str, shape: tuple, dtype: np.dtype, fidelity: float, data: Dict[str, np.ndarray]):
+        self.mode = mode
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.fidelity = fidelity
+        self.data = data
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the compressed arrays."""
+        return sum(array.nbytes for array in self.data.values())
+
+    @property
+    def original_nbytes(self) -> int:
+        return int(np.prod(self.shape)) * self.dtype.itemsize
+
+    @property
+    def ratio(self) -> float:
+        """Original size divided by compressed size."""
+        return self.original_nbytes / max(self.nbytes, 1)
+
+    def decompress(self) -> np.ndarray:
+        """
+        Reconstruct the state vector.
+
+        Returns:
+            np.ndarray: Array with the original shape and dtype.
+        """
+        data = self.data
+        if self.mode == "raw":
+            return data["state"]
+        if self.mode == "sparse":
+            state = np.zeros(int(np.prod(self.shape)), dtype=self.dtype)
+            state[data["indices"]] = data["values"]
+        elif self.mode == "float16":
+            parts = data["parts"].astype(np.float64) * float(data["scale"])
+            state = parts[0] + 1j * parts[1] if len(parts) == 2 else parts[0]
+        elif self.mode == "schmidt":
+            state = data["left"] @ data["right"]
+        else:
+            raise ValueError(f"Unknown compression mode {self.mode!r}.")
+        return np.asarray(state, dtype=self.dtype).reshape(self.shape)
+
+    def __repr__(self) -> str:
+        return (f"CompressedState(mode={self.mode!r}, shape={self.shape}, "
+                f"fidelity={self.fidelity:.6f}, ratio={self.ratio:.2f})")
+
+
+def _sparse(flat: np.ndarray, target_fidelity: float) -> Tuple[Dict[str, np.ndarray], float]:
+    weights = np.abs(flat) ** 2
+    order = np.argsort(weights)[::-1]
+    k, fidelity = _keep_count(weights[order], target_fidelity)
+    indices = np.sort(order[:k])
+    # Rescale the kept amplitudes so the reconstruction keeps the original norm
+    values = flat[indices] * math.sqrt(1.0 / fidelity)
+    return {"indices": indices.astype(_index_dtype(flat.size)), "values": values}, fidelity
+
+
+def _float16(flat: np.ndarray) -> Tuple[Dict[str, np.ndarray], float]:
+    parts = np.stack([flat.real, flat.imag]) if np.iscomplexobj(flat) else flat.real[np.newaxis]
+    # Scale into [-1, 1] so large amplitudes cannot overflow float16
+    scale = float(np.abs(parts).max())
+    data = {"parts": (parts / scale).astype(np.float16), "scale": np.float64(scale)}
+    restored = data["parts"].astype(np.float64) * scale
+    restored = restored[0] + 1j * restored[1] if len(restored) == 2 else restored[0]
+    return data, state_fidelity(flat, restored)
+
+
+def _schmidt(flat: np.ndarray, target_fidelity: float, split: Optional[int]) -> Tuple[Dict[str, np.ndarray], float]:
+    n_qubits = flat.size.bit_length() - 1
+    split = n_qubits // 2 if split is None else split
+    matrix = flat.reshape(2 ** split, -1)
+    u, s, vh = np.linalg.svd(matrix, full_matrices=False)
+    rank, fidelity = _keep_count(s ** 2, target_fidelity)
+    left = u[:, :rank] * (s[:rank] * math.sqrt(1.0 / fidelity))
+    return {"left": left, "right": vh[:rank]}, fidelity
+
+
+def compress_state(
+    state: np.ndarray,
+    mode: str = "auto",
+    target_fidelity: float = 0.99,
+    split: Optional[int] = None
+) -> CompressedState:
+    """
+    Compress a state vector while keeping its fidelity at or above a target.
+
+    Args:
+        state (np.ndarray): State vector (any shape; flattened for compression).
+        mode (str): "sparse" (top-k amplitudes), "float16" (half-precision quantization),
+            "schmidt" (SVD truncation across a bipartition, power-of-two sizes only) or
+            "auto" (smallest of the modes that meet the target).
+        target_fidelity (float): Minimum fidelity of the reconstruction, in (0, 1].
+        split (Optional[int]): Qubits on the left side of the Schmidt bipartition. Defaults to half.
+
+    Returns:
+        CompressedState: Compressed state. Falls back to mode "raw" (fidelity 1) when no
+        candidate meets the target or saves space.
+    """
+    if mode != "auto" and mode not in COMPRESSION_MODES:
+        raise ValueError(f"Unknown compression mode {mode!r}. "
+                         f"Expected 'auto' or one of {list(COMPRESSION_MODES)}.")
+    if not 0 < target_fidelity <= 1:
+        raise ValueError("target_fidelity must be in (0, 1].")
+    state = np.asarray(state)
+    flat = state.ravel()
+    raw = CompressedState("raw", state.shape, state.dtype, 1.0, {"state": state})
+    if flat.size == 0 or not np.any(flat):
+        return raw
+
+    power_of_two = flat.size >= 4 and flat.size & (flat.size - 1) == 0
+    modes = COMPRESSION_MODES if mode == "auto" else (mode,)
+    best = raw
+    for candidate_mode in modes:
+        if candidate_mode == "sparse":
+            data, fidelity = _sparse(flat, target_fidelity)
+        elif candidate_mode == "float16":
+            data, fidelity = _float16(flat)
+        elif power_of_two:
+            data, fidelity = _schmidt(flat, target_fidelity, split)
+        else:
+            continue
+        candidate = CompressedState(candidate_mode, state.shape, state.dtype, fidelity, data)
+        if fidelity >= target_fidelity and candidate.nbytes < best.nbytes:
+            best = candidate
+    return best
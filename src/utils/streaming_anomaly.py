@@ -0,0 +1,401 @@
+# src/utils/streaming_anomaly.py
+"""
+Online anomaly detection for QuantumNet-Core node telemetry.
+Every sample is scored in constant time against an isolation forest fitted on a
+sliding window. The forest is refitted periodically on a background thread and
+swapped in atomically, so the model follows drifting telemetry while scoring stays
+in the microsecond range. Until the first forest is ready, samples are judged by a
+robust EWMA z-score.
+"""
+import logging
+import math
+import multiprocessing
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_EULER_GAMMA = 0.5772156649015329
+
+
+def average_path_length(n: np.ndarray) -> np.ndarray:
+    """Average unsuccessful-search path length c(n) of a binary search tree with n points."""
+    n = np.asarray(n, dtype=np.float64)
+    result = np.zeros_like(n)
+    result[n == 2] = 1.0
+    large = n > 2
+    result[large] = 2.0 * (np.log(n[large] - 1.0) + _EULER_GAMMA) - 2.0 * (n[large] - 1.0) / n[large]
+    return result
+
+
+class EWMAZScore:
+    """
+    Robust per-feature z-score against an exponentially weighted mean and mean absolute
+    deviation. Constant time and memory per sample; the first ``warmup`` samples score 0.
+    """
+    def __init__(self, alpha: float = 0.01, warmup: int = 30):
+        """
+        Initialize the EWMAZScore.
+
+        Args:
+            alpha (float): Smoothing factor; lower values adapt more slowly.
+            warmup (int): Samples seen before scores are reported.
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1].")
+        self.alpha = alpha
+        self.warmup = warmup
+        self.count = 0
+        self.mean: Optional[np.ndarray] = None
+        self.deviation: Optional[np.ndarray] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.count > self.warmup
+
+    def update(self, x: np.ndarray) -> float:
+        """
+        Score ``x`` against the current estimates, then fold it in.
+
+        Returns:
+            float: Largest absolute z-score over the features (0 during warm-up).
+        """
+        if self.mean is None:
+            self.mean = x.astype(np.float64)
+            self.deviation = np.zeros_like(self.mean)
+            self.count = 1
+            return 0.0
+        diff = x - self.mean
+        abs_diff = np.abs(diff)
+        # 1.2533 * mean absolute deviation estimates the standard deviation of normal data
+        scale = 1.2533 * self.deviation + 1e-12 * (1.0 + np.abs(self.mean))
+        z = float((abs_diff / scale).max()) if self.ready else 0.0
+        self.count += 1
+        # Plain averaging until 1/count drops below alpha removes the start-up bias
+        weight = max(self.alpha, 1.0 / self.count)
+        self.mean += weight * diff
+        self.deviation += weight * (abs_diff - self.deviation)
+        return z
+
+
+class CompiledIsolationForest:
+    """
+    A fitted scikit-learn ``IsolationForest`` flattened into node arrays.
+    Nodes are renumbered breadth-first so the two children of a node are adjacent,
+    and all trees are walked together with one vectorized step per tree level. This
+    makes scoring a single sample far cheaper than ``IsolationForest.score_samples``.
+    Scores follow the original paper: in (0, 1], higher is more anomalous.
+    """
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, left: np.ndarray,
+                 leaf_path: np.ndarray, roots: np.ndarray, max_depth: int, normalizer: float,
+                 decision_threshold: float):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.leaf_path = leaf_path
+        self.roots = roots
+        self.max_depth = max_depth
+        self.normalizer = normalizer
+        self.decision_threshold = decision_threshold
+
+    @classmethod
+    def from_sklearn(cls, model: Any) -> "CompiledIsolationForest":
+        """
+        Compile a fitted ``sklearn.ensemble.IsolationForest``.
+
+        Returns:
+            CompiledIsolationForest: Scores equal ``-model.score_samples(X)``; samples scoring
+            above ``decision_threshold`` are the ones ``model.predict`` labels -1.
+        """
+        total = sum(estimator.tree_.node_count for estimator in model.estimators_)
+        feature = np.zeros(total, dtype=np.intp)
+        threshold = np.full(total, np.inf)
+        left = np.zeros(total, dtype=np.intp)
+        leaf_path = np.zeros(total)
+        roots = []
+        max_depth = 0
+        next_id = 0
+        for estimator, features in zip(model.estimators_, model.estimators_features_):
+            tree = estimator.tree_
+            path_length = average_path_length(tree.n_node_samples)
+            roots.append(next_id)
+            # (sklearn node, compiled id, depth); children get consecutive ids
+            queue = [(0, next_id, 0)]
+            next_id += 1
+            for node, new_id, depth in queue:
+                child = tree.children_left[node]
+                if child == -1:
+                    # Leaves point at themselves and never go right (threshold +inf)
+                    left[new_id] = new_id
+                    leaf_path[new_id] = depth + path_length[node]
+                    max_depth = max(max_depth, depth)
+                    continue
+                feature[new_id] = features[tree.feature[node]]
+                threshold[new_id] = tree.threshold[node]
+                left[new_id] = next_id
+                queue.append((child, next_id, depth + 1))
+                queue.append((tree.children_right[node], next_id + 1, depth + 1))
+                next_id += 2
+        normalizer = len(model.estimators_) * float(average_path_length([model.max_samples_])[0])
+        return cls(feature, threshold, left, leaf_path, np.array(roots, dtype=np.intp),
+                   max_depth, normalizer, -float(model.offset_))
+
+    def score_samples(self, X: np.ndarray) -> np.ndarray:
+        """Anomaly scores of the rows of ``X``."""
+        # The trees split float32 data, so compare with the same precision
+        X = np.atleast_2d(np.asarray(X, dtype=np.float32))
+        rows = np.arange(len(X))[:, None]
+        nodes = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.max_depth):
+            nodes = self.left[nodes] + (X[rows, self.feature[nodes]] > self.threshold[nodes])
+        return np.exp2(-self.leaf_path[nodes].sum(axis=1) / self.normalizer)
+
+    def score_one(self, x: np.ndarray) -> float:
+        """Anomaly score of a single sample."""
+        x = np.asarray(x, dtype=np.float32)
+        feature, threshold, left = self.feature, self.threshold, self.left
+        nodes = self.roots
+        for _ in range(self.max_depth):
+            nodes = left.take(nodes) + (x.take(feature.take(nodes)) > threshold.take(nodes))
+        return math.pow(2.0, -self.leaf_path.take(nodes).sum() / self.normalizer)
+
+
+def _lower_priority() -> None:
+    # Refits are throughput work; scoring keeps the CPU when cores are scarce
+    if hasattr(os, "nice"):
+        os.nice(10)
+
+
+def fit_compiled_forest(data: np.ndarray, n_estimators: int, max_samples: int,
+                        contamination: float, random_state: Optional[int]) -> CompiledIsolationForest:
+    """Fit an ``IsolationForest`` on ``data`` and compile it (runs on the refit thread or worker process)."""
+    from sklearn.ensemble import IsolationForest
+
+    forest = IsolationForest(n_estimators=n_estimators, max_samples=max_samples,
+                             contamination=contamination, random_state=random_state).fit(data)
+    return CompiledIsolationForest.from_sklearn(forest)
+
+
+class StreamingAnomalyDetector:
+    """
+    Scores a telemetry stream sample by sample while an isolation forest is refitted on
+    the most recent ``window`` samples in the background every ``refit_every`` samples.
+    The active model is replaced by a single reference assignment, so scoring never
+    blocks on a refit. With ``fit_in_subprocess`` the fit runs in a spawned worker
+    process, so it does not compete with scoring for the GIL. Use the detector as a
+    context manager, or call ``close``, to stop the refit thread and worker.
+    """
+    def __init__(
+        self,
+        n_features: int,
+        window: int = 2048,
+        refit_every: int = 1024,
+        n_estimators: int = 100,
+        max_samples: int = 256,
+        contamination: float = 0.01,
+        z_threshold: float = 6.0,
+        ewma_alpha: float = 0.01,
+        background: bool = True,
+        fit_in_subprocess: bool = False,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+        random_state: Optional[int] = None
+    ):
+        """
+        Initialize the StreamingAnomalyDetector.
+
+        Args:
+            n_features (int): Features per sample.
+            window (int): Sliding window of recent samples the forest is fitted on.
+            refit_every (int): Samples between refits once a model exists.
+            n_estimators (int): Trees per forest.
+            max_samples (int): Samples per tree; also the samples needed before the first fit.
+            contamination (float): Expected share of anomalies, which sets the decision threshold.
+            z_threshold (float): EWMA z-score that flags an anomaly before the first forest is ready.
+            ewma_alpha (float): Smoothing factor of the EWMA z-score.
+            background (bool): Refit on a background thread. With False, refits run inline.
+            fit_in_subprocess (bool): Fit forests in a worker process instead of the refit thread.
+                Worth it when scoring latency matters and a core is free for the fit.
+            mp_context (Optional[BaseContext]): Multiprocessing context of the worker. Defaults to
+                "spawn", which is safe to start from a multi-threaded process, unlike fork.
+            random_state (Optional[int]): Seed for reproducible forests.
+        """
+        if window < max_samples:
+            raise ValueError("window must hold at least max_samples samples.")
+        self.n_features = n_features
+        self.window = window
+        self.refit_every = refit_every
+        self.n_estimators = n_estimators
+        self.max_samples = max_samples
+        self.contamination = contamination
+        self.z_threshold = z_threshold
+        self.background = background
+        self.fit_in_subprocess = fit_in_subprocess
+        self.mp_context = mp_context
+        self.random_state = random_state
+        self.ewma = EWMAZScore(ewma_alpha)
+        self.model: Optional[CompiledIsolationForest] = None
+        self.model_version = 0
+        self.samples = 0
+        self.anomalies = 0
+        self.last_score = float("nan")
+        self.last_zscore = 0.0
+        self._window = np.zeros((window, n_features))
+        self._since_fit = 0
+        self._fit_lock = threading.Lock()
+        self._refit_requested = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_finalizer: Optional[weakref.finalize] = None
+
+    # ---- model maintenance ----------------------------------------------
+
+    def _snapshot(self) -> np.ndarray:
+        filled = min(self.samples, self.window)
+        return self._window[:filled].copy()
+
+    def refit(self) -> bool:
+        """
+        Fit a forest on the current window and swap it in.
+
+        Returns:
+            bool: False if the window holds fewer than ``max_samples`` samples.
+        """
+        data = self._snapshot()
+        if len(data) < self.max_samples:
+            return False
+        with self._fit_lock:
+            seed = None if self.random_state is None else self.random_state + self.model_version
+            args = (data, self.n_estimators, self.max_samples, self.contamination, seed)
+            if self.fit_in_subprocess:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=1, initializer=_lower_priority,
+                        mp_context=self.mp_context or multiprocessing.get_context("spawn")
+                    )
+                    # Stops the worker if the detector is collected or the interpreter exits unclosed
+                    self._executor_finalizer = weakref.finalize(self, self._executor.shutdown, wait=False)
+                compiled = self._executor.submit(fit_compiled_forest, *args).result()
+            else:
+                compiled = fit_compiled_forest(*args)
+            # Atomic swap: scorers read ``self.model`` once per sample
+            self.model = compiled
+            self.model_version += 1
+        logger.debug("Refitted streaming anomaly model v%d on %d samples", self.model_version, len(data))
+        return True
+
+    def _refit_loop(self) -> None:
+        while True:
+            self._refit_requested.wait()
+            self._refit_requested.clear()
+            if self._closed:
+                return
+            try:
+                self.refit()
+            except Exception as e:
+                logger.error("Streaming anomaly refit failed: %s", e)
+
+    def _request_refit(self) -> None:
+        if not self.background:
+            self.refit()
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._refit_loop, name="anomaly-refit-worker", daemon=True)
+            self._thread.start()
+        self._refit_requested.set()
+
+    def close(self) -> None:
+        """Stop the background refit thread and worker process."""
+        self._closed = True
+        self._refit_requested.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor_finalizer.detach()
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "StreamingAnomalyDetector":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ---- scoring ----------------------------------------------------------
+
+    def score(self, x: np.ndarray) -> float:
+        """
+        Anomaly score of ``x`` without learning from it.
+
+        Returns:
+            float: Isolation score in (0, 1], or NaN before the first model is fitted.
+        """
+        model = self.model
+        return float("nan") if model is None else model.score_one(x)
+
+    def update(self, x: np.ndarray) -> bool:
+        """
+        Score one sample, then add it to the window.
+
+        Args:
+            x (np.ndarray): Feature vector of length ``n_features``.
+
+        Returns:
+            bool: True if the sample is anomalous.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        self.last_zscore = self.ewma.update(x)
+        model = self.model
+        if model is not None:
+            self.last_score = model.score_one(x)
+            anomalous = self.last_score > model.decision_threshold
+        else:
+            anomalous = self.last_zscore > self.z_threshold
+        self._window[self.samples % self.window] = x
+        self.samples += 1
+        self.anomalies += anomalous
+        self._since_fit += 1
+        if self._since_fit >= (self.refit_every if model is not None else self.max_samples):
+            self._since_fit = 0
+            self._request_refit()
+        return anomalous
+
+    def update_many(self, X: np.ndarray) -> np.ndarray:
+        """
+        Score a block of samples with one vectorized pass, then add them to the window.
+        The whole block is judged by the model that was active when it arrived.
+
+        Returns:
+            np.ndarray: Boolean mask of anomalous rows.
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        zscores = np.array([self.ewma.update(x) for x in X])
+        model = self.model
+        if model is not None:
+            scores = model.score_samples(X)
+            anomalous = scores > model.decision_threshold
+            self.last_score = float(scores[-1]) if len(scores) else self.last_score
+        else:
+            anomalous = zscores > self.z_threshold
+        if len(zscores):
+            self.last_zscore = float(zscores[-1])
+        for x in X[-self.window:]:
+            self._window[self.samples % self.window] = x
+            self.samples += 1
+        self.samples += max(len(X) - self.window, 0)
+        self.anomalies += int(anomalous.sum())
+        self._since_fit += len(X)
+        if self._since_fit >= (self.refit_every if model is not None else self.max_samples):
+            self._since_fit = 0
+            self._request_refit()
+        return anomalous
+
+    def stats(self) -> Dict[str, Any]:
+        """Samples seen, anomalies flagged and model refits."""
+        return {"samples": self.samples, "anomalies": self.anomalies, "model_version": self.model_version}
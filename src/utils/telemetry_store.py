@@ -0,0 +1,413 @@
+# src/utils/telemetry_store.py
+"""
+Columnar, time-partitioned storage for QuantumNet-Core node telemetry.
+Rows are written to one partition per day and node. Each partition holds immutable
+segments with one file per column (``.npy`` files read through memory maps, or
+Parquet when pyarrow is installed). A small JSON index of segment time ranges per
+node lets queries open only the partitions and columns they need. Bulk imports and
+``compact`` merge the segments of a partition into one.
+"""
+import bisect
+import json
+import os
+import shutil
+import threading
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+STORE_FORMATS = ("npy", "parquet")
+INDEX_FILE = "index.json"
+NS_PER_DAY = 86_400 * 10 ** 9
+
+
+def _to_ns(value) -> Optional[int]:
+    """Nanoseconds since the epoch for anything ``pd.Timestamp`` accepts (tz-aware values in UTC)."""
+    if value is None:
+        return None
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return timestamp.value
+
+
+def _is_metric(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+class TelemetryStore:
+    """
+    Day/node partitioned column store for telemetry with a node and time-range index.
+    Timestamps are kept as int64 nanoseconds (naive UTC); metric columns as float64.
+    Appends add new segments and never rewrite old ones; ``compact`` replaces the
+    segments of a partition with a single merged one. One writer per store directory
+    is assumed, while any number of threads may query.
+    """
+    def __init__(self, root: str, format: str = "auto"):
+        """
+        Open or create a store.
+
+        Args:
+            root (str): Store directory.
+            format (str): "npy" (memory-mapped NumPy files), "parquet" (requires pyarrow) or
+                "auto" (Parquet when pyarrow is installed). An existing store keeps its format.
+        """
+        if format != "auto" and format not in STORE_FORMATS:
+            raise ValueError(f"Unknown telemetry store format {format!r}. "
+                             f"Expected 'auto' or one of {list(STORE_FORMATS)}.")
+        self.root = root
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        index = self._read_index()
+        if index is None:
+            self.format = ("parquet" if pyarrow is not None else "npy") if format == "auto" else format
+            self._segments: List[dict] = []
+        else:
+            if format != "auto" and format != index["format"]:
+                raise ValueError(f"Store at {root} uses format {index['format']!r}, not {format!r}.")
+            self.format = index["format"]
+            self._segments = index["segments"]
+        if self.format == "parquet" and pyarrow is None:
+            raise ImportError("pyarrow is required for the parquet telemetry store format.")
+        self._next_id = max((segment["id"] for segment in self._segments), default=0) + 1
+        self._by_node: Dict[str, List[dict]] = {}
+        self._starts: Dict[str, List[int]] = {}
+        self._index_segments(self._segments)
+
+    # ---- index ----------------------------------------------------------
+
+    def _read_index(self) -> Optional[dict]:
+        path = os.path.join(self.root, INDEX_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def _write_index(self) -> None:
+        path = os.path.join(self.root, INDEX_FILE)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"version": 1, "format": self.format, "segments": self._segments}, f)
+        # Readers of the directory see either the old or the new index, never a partial one
+        os.replace(path + ".tmp", path)
+
+    def _index_segments(self, added: List[dict], removed: Iterable[dict] = ()) -> None:
+        """
+        Update the node index for added and removed segments.
+        Only the lists of affected nodes are rebuilt, and they are replaced rather than
+        mutated, so readers holding the previous lists are unaffected.
+        """
+        removed_ids = {segment["id"] for segment in removed}
+        changed: Dict[str, List[dict]] = {}
+        for segment in list(removed) + added:
+            node = segment["node_id"]
+            if node not in changed:
+                changed[node] = [old for old in self._by_node.get(node, []) if old["id"] not in removed_ids]
+        for segment in added:
+            changed[segment["node_id"]].append(segment)
+        by_node, starts = dict(self._by_node), dict(self._starts)
+        for node, segments in changed.items():
+            segments.sort(key=lambda segment: segment["start"])
+            if segments:
+                by_node[node] = segments
+                starts[node] = [segment["start"] for segment in segments]
+            else:
+                by_node.pop(node, None)
+                starts.pop(node, None)
+        self._by_node, self._starts = by_node, starts
+
+    @property
+    def nodes(self) -> List[str]:
+        """Node ids with stored telemetry."""
+        return sorted(self._by_node)
+
+    @property
+    def columns(self) -> List[str]:
+        """Metric columns stored for at least one node."""
+        return sorted({column for segment in self._segments for column in segment["columns"]})
+
+    def time_range(self) -> Optional[tuple]:
+        """(first, last) timestamp in the store, or None when it is empty."""
+        if not self._segments:
+            return None
+        return (pd.Timestamp(min(segment["start"] for segment in self._segments)),
+                pd.Timestamp(max(segment["end"] for segment in self._segments)))
+
+    def __len__(self) -> int:
+        return sum(segment["rows"] for segment in self._segments)
+
+    def segments(self, nodes: Optional[Iterable[str]] = None, start: Optional[int] = None,
+                 end: Optional[int] = None) -> List[dict]:
+        """
+        Index entries of the segments that may hold rows for ``nodes`` in [start, end).
+
+        Args:
+            nodes (Optional[Iterable[str]]): Node ids (a single id may be passed as a string).
+                Defaults to all nodes.
+            start (Optional[int]): Inclusive lower bound in epoch nanoseconds.
+            end (Optional[int]): Exclusive upper bound in epoch nanoseconds.
+
+        Returns:
+            List[dict]: Segment entries ordered by node and start time.
+        """
+        if isinstance(nodes, str):
+            nodes = [nodes]
+        with self._lock:
+            by_node, starts = self._by_node, self._starts
+        selected = []
+        for node in (sorted(by_node) if nodes is None else nodes):
+            node_segments = by_node.get(node, [])
+            # Segments are sorted by start, so everything past ``end`` is skipped by bisection
+            stop = len(node_segments) if end is None else bisect.bisect_left(starts[node], end)
+            selected.extend(segment for segment in node_segments[:stop]
+                            if start is None or segment["end"] >= start)
+        return selected
+
+    # ---- writing --------------------------------------------------------
+
+    def _write_segment(self, day: int, node: str, columns: Dict[str, np.ndarray]) -> dict:
+        segment_id = self._next_id
+        self._next_id += 1
+        day_label = str(np.datetime64(day, "D"))
+        relative = os.path.join(day_label, quote(node, safe=""), f"seg-{segment_id:08d}")
+        path = os.path.join(self.root, relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if self.format == "parquet":
+            relative += ".parquet"
+            pd.DataFrame(columns).to_parquet(path + ".parquet", index=False)
+        else:
+            os.makedirs(path)
+            for name, values in columns.items():
+                np.save(os.path.join(path, quote(name, safe="") + ".npy"), values)
+        timestamps = columns["timestamp"]
+        return {
+            "id": segment_id,
+            "path": relative,
+            "day": day_label,
+            "node_id": node,
+            "start": int(timestamps[0]),
+            "end": int(timestamps[-1]),
+            "rows": len(timestamps),
+            "columns": [name for name in columns if name != "timestamp"],
+        }
+
+    def _delete_segment_files(self, segment: dict) -> None:
+        path = os.path.join(self.root, segment["path"])
+        if self.format == "parquet":
+            os.remove(path)
+        else:
+            shutil.rmtree(path)
+
+    def _commit_segments(self, added: List[dict], removed: List[dict] = ()) -> None:
+        """Publish segment changes: one index write, then the node index (lock held)."""
+        removed_ids = {segment["id"] for segment in removed}
+        self._segments = [segment for segment in self._segments if segment["id"] not in removed_ids] + added
+        self._write_index()
+        self._index_segments(added, removed)
+
+    def _merge_partition(self, segments: List[dict]) -> dict:
+        """Write the rows of one partition's segments as a single time-sorted segment."""
+        names = sorted({column for segment in segments for column in segment["columns"]})
+        parts = []
+        for segment in segments:
+            columns = self._load_columns(segment, ["timestamp"] + segment["columns"])
+            rows = len(columns["timestamp"])
+            parts.append({name: np.asarray(columns[name]) if name in columns else np.full(rows, np.nan)
+                          for name in ["timestamp"] + names})
+        merged = {name: np.concatenate([part[name] for part in parts]) for name in ["timestamp"] + names}
+        order = np.argsort(merged["timestamp"], kind="stable")
+        first = segments[0]
+        return self._write_segment(first["start"] // NS_PER_DAY, first["node_id"],
+                                   {name: values[order] for name, values in merged.items()})
+
+    def _compact_segments(self, segments: List[dict]) -> tuple:
+        """
+        Merge segments sharing a (day, node) partition.
+
+        Returns:
+            tuple: (merged segments written, segments they replace).
+        """
+        partitions: Dict[tuple, List[dict]] = {}
+        for segment in segments:
+            partitions.setdefault((segment["day"], segment["node_id"]), []).append(segment)
+        merged, replaced = [], []
+        for partition in partitions.values():
+            if len(partition) > 1:
+                merged.append(self._merge_partition(sorted(partition, key=lambda segment: segment["id"])))
+                replaced.extend(partition)
+        return merged, replaced
+
+    def _write_partitions(self, frame: pd.DataFrame, timestamp_column: str, node_column: str) -> List[dict]:
+        """Write one segment per day/node partition of ``frame`` without publishing them."""
+        timestamps = pd.to_datetime(frame[timestamp_column])
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_convert("UTC").dt.tz_localize(None)
+        timestamps = timestamps.to_numpy("datetime64[ns]").astype(np.int64)
+        metrics = {
+            column: frame[column].to_numpy(np.float64)
+            for column in frame.columns
+            if column not in (timestamp_column, node_column) and _is_metric(frame[column])
+        }
+        keys = pd.DataFrame({"day": timestamps // NS_PER_DAY, "node": frame[node_column].astype(str).to_numpy()})
+
+        new_segments = []
+        for (day, node), rows in keys.groupby(["day", "node"], sort=True).indices.items():
+            rows = rows[np.argsort(timestamps[rows], kind="stable")]
+            columns = {"timestamp": timestamps[rows]}
+            columns.update((name, values[rows]) for name, values in metrics.items())
+            new_segments.append(self._write_segment(int(day), node, columns))
+        return new_segments
+
+    def append(self, frame: pd.DataFrame, timestamp_column: str = "timestamp",
+               node_column: str = "node_id") -> int:
+        """
+        Write telemetry rows, split into day/node partitions.
+
+        Args:
+            frame (pd.DataFrame): Rows with a timestamp column, a node column and metric columns.
+                Non-numeric metric columns are not stored.
+            timestamp_column (str): Name of the timestamp column.
+            node_column (str): Name of the node id column.
+
+        Returns:
+            int: Number of rows written.
+        """
+        if frame.empty:
+            return 0
+        with self._lock:
+            self._commit_segments(self._write_partitions(frame, timestamp_column, node_column))
+        return len(frame)
+
+    def import_csv(self, csv_path: str, chunksize: int = 500_000, dtypes: Optional[dict] = None,
+                   timestamp_column: str = "timestamp", node_column: str = "node_id") -> int:
+        """
+        Stream a telemetry CSV (e.g. ``data/telemetry/node_telemetry.csv``) into the store.
+
+        Args:
+            csv_path (str): CSV file with timestamp, node id and metric columns.
+            chunksize (int): Rows read per chunk. The segments of each day and node are merged
+                into one, and the index is written once, when the import finishes.
+            dtypes (Optional[dict]): Column dtypes passed to ``pd.read_csv``.
+            timestamp_column (str): Name of the timestamp column.
+            node_column (str): Name of the node id column.
+
+        Returns:
+            int: Number of rows imported.
+        """
+        rows = 0
+        with self._lock:
+            new_segments = []
+            with pd.read_csv(csv_path, chunksize=chunksize, dtype=dtypes) as reader:
+                for chunk in reader:
+                    if not chunk.empty:
+                        new_segments.extend(self._write_partitions(chunk, timestamp_column, node_column))
+                        rows += len(chunk)
+            # Not yet in the index, so the per-chunk segments can be replaced before anyone reads them
+            merged, replaced = self._compact_segments(new_segments)
+            replaced_ids = {segment["id"] for segment in replaced}
+            for segment in replaced:
+                self._delete_segment_files(segment)
+            self._commit_segments([segment for segment in new_segments if segment["id"] not in replaced_ids]
+                                  + merged)
+        return rows
+
+    def compact(self) -> int:
+        """
+        Merge the segments of every day/node partition that has more than one, e.g. after
+        many small appends. Replaced files are deleted once the new index is written;
+        queries that had already selected them retry with the new index.
+
+        Returns:
+            int: Number of segments replaced.
+        """
+        with self._lock:
+            merged, replaced = self._compact_segments(self._segments)
+            if merged:
+                self._commit_segments(merged, replaced)
+                for segment in replaced:
+                    self._delete_segment_files(segment)
+        return len(replaced)
+
+    # ---- reading --------------------------------------------------------
+
+    def _load_columns(self, segment: dict, names: List[str]) -> Dict[str, np.ndarray]:
+        path = os.path.join(self.root, segment["path"])
+        if self.format == "parquet":
+            table = pd.read_parquet(path, columns=names)
+            return {name: table[name].to_numpy() for name in names}
+        # Memory maps: slicing reads only the pages holding the requested rows
+        return {name: np.load(os.path.join(path, quote(name, safe="") + ".npy"), mmap_mode="r")
+                for name in names}
+
+    def _read_segments(self, metrics: List[str], nodes: Optional[Iterable[str]], start_ns: Optional[int],
+                       end_ns: Optional[int]) -> tuple:
+        """Timestamps, node ids and metric values of the selected segments, as lists of arrays."""
+        timestamps, node_ids, values = [], [], {metric: [] for metric in metrics}
+        for segment in self.segments(nodes, start_ns, end_ns):
+            present = [metric for metric in metrics if metric in segment["columns"]]
+            columns = self._load_columns(segment, ["timestamp"] + present)
+            segment_times = columns["timestamp"]
+            lo = 0 if start_ns is None else int(np.searchsorted(segment_times, start_ns, "left"))
+            hi = len(segment_times) if end_ns is None else int(np.searchsorted(segment_times, end_ns, "left"))
+            if lo >= hi:
+                continue
+            timestamps.append(np.asarray(segment_times[lo:hi]))
+            node_ids.append(np.full(hi - lo, segment["node_id"], dtype=object))
+            for metric in metrics:
+                values[metric].append(np.asarray(columns[metric][lo:hi]) if metric in columns
+                                      else np.full(hi - lo, np.nan))
+        return timestamps, node_ids, values
+
+    def query(
+        self,
+        metrics: Optional[Iterable[str]] = None,
+        nodes: Optional[Iterable[str]] = None,
+        start=None,
+        end=None
+    ) -> pd.DataFrame:
+        """
+        Metrics X for nodes Y between ``start`` and ``end``.
+        Only segments overlapping the time range of the requested nodes are opened, and
+        only the requested columns are read.
+
+        Args:
+            metrics (Optional[Iterable[str]]): Metric columns. Defaults to all columns.
+            nodes (Optional[Iterable[str]]): Node ids (a single id may be passed as a string).
+                Defaults to all nodes.
+            start: Inclusive start time (anything ``pd.Timestamp`` accepts). None for no bound.
+            end: Exclusive end time. None for no bound.
+
+        Returns:
+            pd.DataFrame: Columns ``timestamp``, ``node_id`` and the metrics, sorted by node and time.
+                Metrics missing from a partition are NaN.
+        """
+        metrics = self.columns if metrics is None else list(metrics)
+        unknown = set(metrics) - set(self.columns)
+        if unknown:
+            raise KeyError(f"Unknown telemetry columns {sorted(unknown)}.")
+        start_ns, end_ns = _to_ns(start), _to_ns(end)
+        try:
+            timestamps, node_ids, values = self._read_segments(metrics, nodes, start_ns, end_ns)
+        except FileNotFoundError:
+            # A concurrent compact() replaced a selected segment; the new index covers the same rows
+            timestamps, node_ids, values = self._read_segments(metrics, nodes, start_ns, end_ns)
+
+        if not timestamps:
+            frame = pd.DataFrame({"timestamp": pd.Series(dtype="datetime64[ns]"),
+                                  "node_id": pd.Series(dtype=object)})
+            for metric in metrics:
+                frame[metric] = pd.Series(dtype=np.float64)
+            return frame
+        frame = pd.DataFrame({
+            "timestamp": np.concatenate(timestamps).view("datetime64[ns]"),
+            "node_id": np.concatenate(node_ids),
+            **{metric: np.concatenate(parts) for metric, parts in values.items()},
+        })
+        # Segments from separate appends may overlap in time within one partition
+        return frame.sort_values(["node_id", "timestamp"], kind="stable", ignore_index=True)
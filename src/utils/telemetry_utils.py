@@ -2,23 +2,117 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
 from datetime import datetime
 import json
 import os
+from .downsampling import plot_series
+
+class RunningStatistics:
+    """
+    Per-column running count, mean, variance, min and max over a stream of chunks.
+    Chunks are merged with the parallel form of Welford's algorithm, so memory does
+    not grow with the number of rows. Missing values are skipped.
+    """
+    def __init__(self, columns):
+        """
+        :param columns: Names of the numeric columns to track.
+        """
+        self.columns = list(columns)
+        width = len(self.columns)
+        self.rows = 0
+        self.count = np.zeros(width, dtype=np.int64)
+        self._mean = np.zeros(width)
+        self._m2 = np.zeros(width)
+        self.min = np.full(width, np.inf)
+        self.max = np.full(width, -np.inf)
+
+    def update(self, chunk):
+        """
+        Adds the rows of a chunk.
+
+        :param chunk: DataFrame containing at least the tracked columns.
+        """
+        values = chunk[self.columns].to_numpy(dtype=np.float64)
+        if len(values) == 0:
+            return
+        self.rows += len(values)
+        present = ~np.isnan(values)
+        chunk_count = present.sum(axis=0)
+        chunk_mean = np.where(present, values, 0.0).sum(axis=0) / np.maximum(chunk_count, 1)
+        chunk_m2 = (np.where(present, values - chunk_mean, 0.0) ** 2).sum(axis=0)
+
+        total = self.count + chunk_count
+        delta = chunk_mean - self._mean
+        weight = chunk_count / np.maximum(total, 1)
+        self._mean = self._mean + delta * weight
+        self._m2 = self._m2 + chunk_m2 + delta ** 2 * self.count * weight
+        self.count = total
+        self.min = np.minimum(self.min, np.where(present, values, np.inf).min(axis=0))
+        self.max = np.maximum(self.max, np.where(present, values, -np.inf).max(axis=0))
+
+    @property
+    def mean(self):
+        """Column means (NaN for columns without any value)."""
+        return np.where(self.count > 0, self._mean, np.nan)
+
+    def variance(self, ddof=1):
+        """Column variances with ``ddof`` delta degrees of freedom."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > ddof, self._m2 / (self.count - ddof), np.nan)
+
+    def fill_scale(self):
+        """
+        Standard deviation of each column after its missing values are filled with the mean,
+        as StandardScaler would compute it (population variance; 1 for constant columns).
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.sqrt(self._m2 / self.rows) if self.rows else np.zeros(len(self.columns))
+        return np.where(std > 0, std, 1.0)
+
+    def summary(self):
+        """
+        :return: Dictionary with the same layout as TelemetryDataProcessor.generate_summary_statistics.
+        """
+        def by_column(values, cast=float):
+            return {column: cast(value) for column, value in zip(self.columns, values)}
+        present = self.count > 0
+        return {
+            'mean': by_column(self.mean),
+            'std_dev': by_column(np.sqrt(self.variance())),
+            'min': by_column(np.where(present, self.min, np.nan)),
+            'max': by_column(np.where(present, self.max, np.nan)),
+            'count': by_column(self.count, int)
+        }
 
 class TelemetryDataProcessor:
-    def __init__(self, data_path):
+    def __init__(self, data_path, streaming=False, chunksize=100_000, dtypes=None):
         """
         Initializes the TelemetryDataProcessor with the path to the telemetry data.
 
         :param data_path: Path to the telemetry data file (CSV or JSON).
+        :param streaming: Read the file in chunks instead of loading it into ``self.data``.
+            Preprocessing, saving and summary statistics then run with bounded memory.
+        :param chunksize: Rows per chunk in streaming mode.
+        :param dtypes: Column dtypes for streaming reads. Inferred from the first rows when
+            omitted, with numeric columns read as float64.
         """
         self.data_path = data_path
-        self.data = self.load_data()
-        self.scaler = StandardScaler()
+        self.streaming = streaming
+        self.chunksize = chunksize
+        self.dtypes = dtypes
+        self.statistics = None
+        self.data = None if streaming else self.load_data()
+        self._scaler = None
+
+    @property
+    def scaler(self):
+        """
+        StandardScaler used by preprocess_data, created on first use so sklearn is only imported when needed.
+        """
+        if self._scaler is None:
+            from sklearn.preprocessing import StandardScaler
+            self._scaler = StandardScaler()
+        return self._scaler
 
     def load_data(self):
         """
@@ -33,10 +127,94 @@ class TelemetryDataProcessor:
         else:
             raise ValueError("Unsupported file format. Please provide a CSV or JSON file.")
 
+    def _infer_dtypes(self):
+        sample = pd.read_csv(self.data_path, nrows=1000)
+        # Integer columns become float64 so chunks with and without missing values agree
+        return {
+            column: np.float64 if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+            else dtype
+            for column, dtype in sample.dtypes.items()
+        }
+
+    def iter_chunks(self):
+        """
+        Reads the telemetry file in chunks of ``chunksize`` rows.
+        JSON input must be in JSON lines format, as written by save_processed_data.
+
+        :return: Generator of DataFrames.
+        """
+        if self.data_path.endswith('.csv'):
+            if self.dtypes is None:
+                self.dtypes = self._infer_dtypes()
+            reader = pd.read_csv(self.data_path, dtype=self.dtypes, chunksize=self.chunksize)
+        elif self.data_path.endswith('.json'):
+            reader = pd.read_json(self.data_path, lines=True, dtype=self.dtypes or True, chunksize=self.chunksize)
+        else:
+            raise ValueError("Unsupported file format. Please provide a CSV or JSON file.")
+        with reader:
+            for chunk in reader:
+                yield chunk
+
+    @staticmethod
+    def _numeric_columns(chunk):
+        return [column for column, dtype in chunk.dtypes.items()
+                if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)]
+
+    def compute_statistics(self):
+        """
+        Computes running statistics of every numeric column in one pass over the file.
+
+        :return: RunningStatistics for the whole file.
+        """
+        statistics = None
+        for chunk in self.iter_chunks():
+            if statistics is None:
+                statistics = RunningStatistics(self._numeric_columns(chunk))
+            statistics.update(chunk)
+        if statistics is None:
+            raise ValueError(f"No telemetry rows found in {self.data_path}.")
+        self.statistics = statistics
+        return statistics
+
+    def _transform_chunk(self, chunk, statistics):
+        columns = statistics.columns
+        values = chunk[columns].to_numpy(dtype=np.float64)
+        values = np.where(np.isnan(values), statistics.mean, values)
+        chunk = chunk.copy()
+        chunk[columns] = (values - statistics.mean) / statistics.fill_scale()
+        return chunk
+
+    def stream_preprocessed_data(self, online=False):
+        """
+        Yields preprocessed chunks: missing values filled with column means and numeric
+        columns standardized, as preprocess_data does for the whole table.
+
+        :param online: Update the statistics with each chunk and scale it with the statistics
+            seen so far, in a single pass. By default the statistics of the whole file are
+            computed first (reusing earlier ones), so the output matches preprocess_data.
+        :return: Generator of DataFrames.
+        """
+        if online:
+            self.statistics = None
+        elif self.statistics is None:
+            self.compute_statistics()
+        for chunk in self.iter_chunks():
+            if online:
+                if self.statistics is None:
+                    self.statistics = RunningStatistics(self._numeric_columns(chunk))
+                self.statistics.update(chunk)
+            yield self._transform_chunk(chunk, self.statistics)
+
     def preprocess_data(self):
         """
         Preprocesses the telemetry data by handling missing values and scaling features.
+        In streaming mode this only computes the statistics; the transformed chunks are
+        produced by stream_preprocessed_data and save_processed_data.
         """
+        if self.streaming:
+            self.compute_statistics()
+            return
+
         # Fill missing values with the mean of each column
         self.data.fillna(self.data.mean(), inplace=True)
 
@@ -50,6 +228,8 @@ class TelemetryDataProcessor:
         :param contamination: Proportion of outliers in the data set.
         :return: DataFrame with an additional column indicating anomalies.
         """
+        from sklearn.ensemble import IsolationForest
+
         model = IsolationForest(contamination=contamination)
         self.data['anomaly'] = model.fit_predict(self.data)
 
@@ -57,14 +237,53 @@ class TelemetryDataProcessor:
         self.data['anomaly'] = self.data['anomaly'] == -1
         return self.data[self.data['anomaly']]
 
-    def visualize_telemetry(self):
+    def stream_anomalies(self, detector=None):
+        """
+        Scores rows with a StreamingAnomalyDetector while the file is read, instead of
+        refitting an IsolationForest over the whole table. Missing values are filled with
+        the running column means, and the detector's model is refitted in the background
+        as the telemetry drifts.
+
+        :param detector: StreamingAnomalyDetector over the numeric columns. Created when omitted.
+        :return: Generator of DataFrames holding the anomalous rows of each block.
+        """
+        from .streaming_anomaly import StreamingAnomalyDetector
+
+        statistics = None
+        owned = detector is None
+        try:
+            for chunk in self.iter_chunks():
+                if statistics is None:
+                    statistics = RunningStatistics(self._numeric_columns(chunk))
+                    if detector is None:
+                        detector = StreamingAnomalyDetector(len(statistics.columns))
+                statistics.update(chunk)
+                values = chunk[statistics.columns].to_numpy(dtype=np.float64)
+                values = np.where(np.isnan(values), statistics.mean, values)
+                # Blocks of refit_every rows let a refreshed model take over within a chunk
+                for start in range(0, len(chunk), detector.refit_every):
+                    flags = detector.update_many(values[start:start + detector.refit_every])
+                    if flags.any():
+                        yield chunk.iloc[start:start + detector.refit_every][flags]
+        finally:
+            # A detector created here is not reachable by the caller, so stop its refit thread
+            if owned and detector is not None:
+                detector.close()
+
+    def visualize_telemetry(self, max_points=None, downsample='lttb'):
         """
         Visualizes telemetry data trends over time.
+
+        :param max_points: Points drawn per series at most; defaults to two per pixel of plot width, 0 draws all.
+        :param downsample: Downsampling method, 'lttb' or 'minmax' (see utils.downsampling).
         """
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(12, 6))
         for column in self.data.columns:
             if column != 'timestamp' and column != 'anomaly':
-                plt.plot(self.data['timestamp'], self.data[column], label=column)
+                plot_series(plt.gca(), self.data['timestamp'], self.data[column], max_points, downsample,
+                            label=column)
         
         plt.title('Telemetry Data Trends')
         plt.xlabel('Timestamp')
@@ -80,19 +299,36 @@ class TelemetryDataProcessor:
 
         :param output_path: Path to save the processed data (CSV or JSON).
         """
-        if output_path.endswith('.csv'):
+        if self.streaming:
+            self._save_streamed_data(output_path)
+        elif output_path.endswith('.csv'):
             self.data.to_csv(output_path, index=False)
         elif output_path.endswith('.json'):
             self.data.to_json(output_path, orient='records', lines=True)
         else:
             raise ValueError("Unsupported file format. Please provide a CSV or JSON file.")
 
+    def _save_streamed_data(self, output_path):
+        if not output_path.endswith(('.csv', '.json')):
+            raise ValueError("Unsupported file format. Please provide a CSV or JSON file.")
+        with open(output_path, 'w', newline='') as output_file:
+            for index, chunk in enumerate(self.stream_preprocessed_data()):
+                if output_path.endswith('.csv'):
+                    chunk.to_csv(output_file, index=False, header=index == 0)
+                else:
+                    text = chunk.to_json(orient='records', lines=True)
+                    output_file.write(text if text.endswith('\n') else text + '\n')
+
     def generate_summary_statistics(self):
         """
         Generates summary statistics of the telemetry data.
+        In streaming mode they describe the numeric columns of the raw file and are
+        computed in one pass (or reused from an earlier pass).
 
         :return: Dictionary containing summary statistics.
         """
+        if self.streaming:
+            return (self.statistics or self.compute_statistics()).summary()
         summary = {
             'mean': self.data.mean().to_dict(),
             'std_dev': self.data.std().to_dict(),
@@ -1,12 +1,11 @@
 # visualization_utils.py
 
-import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from matplotlib.ticker import MaxNLocator
+from .downsampling import plot_series
+
+# matplotlib, seaborn and plotly are imported inside the plotting methods so that
+# importing this module stays cheap for code that never draws anything.
 
 class VisualizationUtils:
     def __init__(self, data):
@@ -17,7 +16,8 @@ class VisualizationUtils:
         """
         self.data = data
 
-    def line_plot(self, x, y, title='Line Plot', xlabel='X-axis', ylabel='Y-axis', save_path=None):
+    def line_plot(self, x, y, title='Line Plot', xlabel='X-axis', ylabel='Y-axis', save_path=None,
+                  max_points=None, downsample='lttb'):
         """
         Creates a line plot.
 
@@ -27,9 +27,14 @@ class VisualizationUtils:
         :param xlabel: Label for the x-axis.
         :param ylabel: Label for the y-axis.
         :param save_path: Path to save the plot image (optional).
+        :param max_points: Points drawn at most; defaults to two per pixel of plot width, 0 draws all.
+        :param downsample: Downsampling method, 'lttb' or 'minmax' (see utils.downsampling).
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.ticker import MaxNLocator
+
         plt.figure(figsize=(12, 6))
-        plt.plot(self.data[x], self.data[y], marker='o')
+        plot_series(plt.gca(), self.data[x], self.data[y], max_points, downsample, marker='o')
         plt.title(title)
         plt.xlabel(xlabel)
         plt.ylabel(ylabel)
@@ -52,6 +57,9 @@ class VisualizationUtils:
         :param ylabel: Label for the y-axis.
         :param save_path: Path to save the plot image (optional).
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.ticker import MaxNLocator
+
         plt.figure(figsize=(12, 6))
         plt.scatter(self.data[x], self.data[y], alpha=0.7)
         plt.title(title)
@@ -76,6 +84,8 @@ class VisualizationUtils:
         :param bins: Number of bins for the histogram.
         :param save_path: Path to save the plot image (optional).
         """
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(12, 6))
         plt.hist(self.data[column], bins=bins, alpha=0.7, color='blue', edgecolor='black')
         plt.title(title)
@@ -96,6 +106,9 @@ class VisualizationUtils:
         :param title: Title of the heatmap.
         :param save_path: Path to save the plot image (optional).
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         plt.figure(figsize=(10, 8))
         sns.heatmap(correlation_matrix, annot=True, fmt=".2f", cmap='coolwarm', square=True, cbar_kws={"shrink": .8})
         plt.title(title)
@@ -114,6 +127,8 @@ class VisualizationUtils:
         :param title: Title of the plot.
         :param save_path: Path to save the plot as HTML (optional).
         """
+        import plotly.express as px
+
         fig = px.scatter(self.data, x=x, y=y, title=title, labels={x: x, y: y})
         fig.update_traces(marker=dict(size=10, opacity=0.7))
         
@@ -132,6 +147,8 @@ class VisualizationUtils:
         :param ylabel: Label for the y-axis.
         :param save_path: Path to save the chart image (optional).
         """
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(12, 6))
         plt.bar(self.data[x], self.data[y], color='skyblue', edgecolor='black')
         plt.title(title)
@@ -154,6 +171,9 @@ class VisualizationUtils:
         :param ylabel: Label for the y-axis.
         :param save_path: Path to save the plot image (optional).
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         plt.figure(figsize=(12, 6))
         sns.boxplot(data=self.data, y=column)
         plt.title(title)
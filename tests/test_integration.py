@@ -1,8 +1,13 @@
 # tests/test_integration.py
 
+import json
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from integration.qiskit_integration import QiskitIntegration
 from integration.cirq_integration import CirqIntegration
+from integration.external_api import ExternalAPI
+from utils.http_client import HTTPClient
 
 class TestIntegration(unittest.TestCase):
 
@@ -18,5 +23,114 @@ class TestIntegration(unittest.TestCase):
         circuit = cirq_backend.create_circuit(2)
         self.assertIsNotNone(circuit)
 
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Local stand-in for an external JSON API."""
+    protocol_version = "HTTP/1.1"
+    failures = {}
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _fail(self):
+        remaining = self.failures.get(self.path, 0)
+        if remaining:
+            self.failures[self.path] = remaining - 1
+        return remaining
+
+    def do_GET(self):
+        if self._fail():
+            self._reply(503, {"error": "unavailable"})
+        elif self.path == "/missing":
+            self._reply(404, {"error": "not found"})
+        else:
+            self._reply(200, {"path": self.path})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length))
+        if self._fail():
+            self._reply(503, {"error": "unavailable"})
+        else:
+            self._reply(200, {"path": self.path, "echo": body})
+
+    def log_message(self, format, *args):
+        pass
+
+class TestHTTPClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _StandInHandler.failures = {}
+        self.client = HTTPClient(self.base_url, timeout=2, backoff_factor=0.001)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_get_and_post(self):
+        """Test single requests through the pooled session."""
+        self.assertEqual(self.client.get("status").json(), {"path": "/status"})
+        response = self.client.post("items", json={"key": "value"})
+        self.assertEqual(response.json()["echo"], {"key": "value"})
+
+    def test_retries_transient_errors(self):
+        """Test that 503 responses are retried until success."""
+        _StandInHandler.failures = {"/flaky": 2}
+        self.assertEqual(self.client.get("flaky").status_code, 200)
+        self.assertEqual(_StandInHandler.failures["/flaky"], 0)
+
+    def test_gives_up_after_max_retries(self):
+        """Test that persistent failures surface as HTTP errors."""
+        _StandInHandler.failures = {"/down": 10}
+        client = HTTPClient(self.base_url, max_retries=1, backoff_factor=0.001)
+        with self.assertRaises(Exception):
+            client.get("down")
+        client.close()
+        self.assertEqual(_StandInHandler.failures["/down"], 8)
+
+    def test_post_is_not_retried_by_default(self):
+        """Test that non-idempotent requests are sent once unless retries are opted into."""
+        _StandInHandler.failures = {"/batch": 1}
+        with self.assertRaises(Exception):
+            self.client.post("batch", json=[1])
+        self.assertEqual(_StandInHandler.failures["/batch"], 0)
+
+        _StandInHandler.failures = {"/batch": 1}
+        client = HTTPClient(self.base_url, backoff_factor=0.001, retry_methods=None)
+        self.assertEqual(client.post("batch", json=[1]).json()["echo"], [1])
+        client.close()
+
+    def test_get_many_preserves_order(self):
+        """Test concurrent bulk GET ordering and exception capture."""
+        paths = [f"item/{i}" for i in range(20)]
+        results = self.client.get_many(paths)
+        self.assertEqual([r.json()["path"] for r in results], ["/" + p for p in paths])
+
+        results = self.client.get_many(["ok", "missing"], return_exceptions=True)
+        self.assertEqual(results[0].status_code, 200)
+        self.assertIsInstance(results[1], Exception)
+
+    def test_external_api_bulk(self):
+        """Test ExternalAPI bulk helpers backed by the shared client."""
+        api = ExternalAPI(self.base_url, client=self.client)
+        self.assertEqual(api.get_data("a"), {"path": "/a"})
+        posted = api.post_many([("a", {"n": 1}), ("b", {"n": 2})])
+        self.assertEqual([p["echo"]["n"] for p in posted], [1, 2])
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,33 @@
 # tests/test_utils.py
 
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
+import logging
+import time
 import unittest
+import numpy as np
+import pandas as pd
 from utils.math_utils import complex_to_polar, polar_to_complex
+from utils.cache_storage import SQLiteStore
+from utils.cache_eviction import EVICTION_POLICIES, make_eviction_policy, simulate_hit_rates
+from utils.single_flight import SingleFlight
+from utils.cache_serialization import CacheSerializer
+from utils.cache_filters import BloomFilter, NegativeCache
+from utils.state_compression import compress_state, state_fidelity
+from utils.cache_memoize import cached, hash_arguments
+from utils.performance_monitor import PerformanceMonitor, QuantileSketch
+from utils.telemetry_utils import RunningStatistics, TelemetryDataProcessor
+from utils.telemetry_store import TelemetryStore
+from utils.ring_buffer import ColumnarRingBuffer
+from utils.metrics_registry import MetricsRegistry
+from utils.downsampling import downsample, downsample_columns, lttb_indices, minmax_indices
+from utils.streaming_anomaly import CompiledIsolationForest, StreamingAnomalyDetector
+from utils.logger import (RateLimitFilter, SamplingFilter, configure_logging, setup_logger,
+                          shutdown_logging, throttle_logger)
 
 class TestMathUtils(unittest.TestCase):
 
@@ -20,5 +46,926 @@ class TestMathUtils(unittest.TestCase):
         self.assertAlmostEqual(complex_num.real, 1)
         self.assertAlmostEqual(complex_num.imag, 1)
 
+class TestSQLiteStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "cache.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_write_behind_read_your_writes(self):
+        """Test that queued writes are visible before and after a flush."""
+        store = SQLiteStore(self.db_path, flush_interval=60)
+        store.put("k", b"v", 0.9, 1.0)
+        store.touch("k", 2.0)
+        self.assertEqual(store.get("k"), (b"v", 0.9, 2, None))
+        self.assertEqual(store.flush(), 1)
+        self.assertEqual(store.pending(), 0)
+        self.assertEqual(store.get("k"), (b"v", 0.9, 2, None))
+        store.close()
+
+    def test_close_persists_pending_writes(self):
+        """Test that closing flushes the write-behind queue to disk."""
+        store = SQLiteStore(self.db_path, flush_interval=60)
+        for i in range(100):
+            store.put(f"k{i}", bytes([i]), 1.0, float(i))
+        store.close()
+        reopened = SQLiteStore(self.db_path, durability="write_through")
+        self.assertEqual(reopened.get("k42"), (bytes([42]), 1.0, 1, None))
+        reopened.close()
+
+    def test_bulk_put_and_get(self):
+        """Test batched writes and IN-query reads across pending and flushed rows."""
+        store = SQLiteStore(self.db_path, flush_interval=60, batch_size=10000)
+        store.put_many((f"k{i}", str(i).encode(), 1.0, 0.0, 1) for i in range(1200))
+        store.flush()
+        store.put("late", b"x", 0.5, 1.0)
+        store.touch_many(["k1", "k2"], 2.0)
+        found = store.get_many(["k1", "k2", "k1100", "late", "absent"])
+        self.assertEqual(found["k1"], (b"1", 1.0, 2, None))
+        self.assertEqual(found["k1100"], (b"1100", 1.0, 1, None))
+        self.assertEqual(found["late"], (b"x", 0.5, 1, None))
+        self.assertNotIn("absent", found)
+        self.assertEqual(len(store.get_many(f"k{i}" for i in range(1200))), 1200)
+        store.close()
+
+    def test_expired_rows_hidden_and_deleted(self):
+        """Test that rows past expires_at are never returned and are purged by maintenance."""
+        store = SQLiteStore(self.db_path, flush_interval=60, maintenance_interval=None)
+        now = time.time()
+        store.put("old", b"a", 1.0, now, expires_at=now - 1)
+        store.put("new", b"b", 1.0, now, expires_at=now + 60)
+        self.assertIsNone(store.get("old"))
+        self.assertEqual(store.get("new"), (b"b", 1.0, 1, now + 60))
+        stats = store.run_maintenance()
+        self.assertEqual(stats["expired"], 1)
+        self.assertEqual(store.rows_expired, 1)
+        self.assertEqual(store.get("new")[0], b"b")
+        store.close()
+
+    def test_disk_budget_evicts_coldest_rows(self):
+        """Test that maintenance deletes the least-accessed, oldest rows beyond the budget."""
+        store = SQLiteStore(self.db_path, durability="write_through",
+                            disk_budget_bytes=250, maintenance_interval=None)
+        for i in range(5):
+            store.put(f"k{i}", bytes(100), 1.0, float(i))
+        store.touch("k0", 10.0)
+        stats = store.run_maintenance()
+        self.assertEqual(stats["evicted"], 3)
+        self.assertLessEqual(store.disk_bytes, 250)
+        self.assertEqual(set(store.get_many(f"k{i}" for i in range(5))), {"k0", "k4"})
+        store.close()
+
+    def test_key_filter_rules_out_absent_keys(self):
+        """Test that the key filter is rebuilt from disk and tracks new and deleted rows."""
+        store = SQLiteStore(self.db_path, durability="write_through", maintenance_interval=None)
+        store.put_many((f"k{i}", b"v", 1.0, 0.0, 1) for i in range(100))
+        store.close()
+        store = SQLiteStore(self.db_path, flush_interval=60, maintenance_interval=None)
+        self.assertTrue(all(store.might_contain(f"k{i}") for i in range(100)))
+        store.put("late", b"v", 1.0, 0.0)
+        self.assertTrue(store.might_contain("late"))
+        self.assertEqual(store.get_many(["absent"]), {})
+        self.assertGreaterEqual(store.filter_negatives, 1)
+        store.put("gone", b"v", 1.0, 0.0, expires_at=1.0)
+        store.run_maintenance()
+        store.rebuild_filter()
+        self.assertFalse(store.might_contain("gone"))
+        self.assertTrue(store.might_contain("late"))
+        store.clear()
+        self.assertFalse(store.might_contain("k1"))
+        store.close()
+
+    def test_iter_hottest_orders_by_access_statistics(self):
+        """Test that warm-up rows stream most accessed first, then most recent, skipping expired rows."""
+        store = SQLiteStore(self.db_path, durability="write_through", maintenance_interval=None)
+        store.put_many([("cold", b"c", 1.0, 1.0, 1), ("warm", b"w", 1.0, 2.0, 1),
+                        ("hot", b"h", 1.0, 0.0, 5), ("dead", b"d", 1.0, 3.0, 9, 1.0)])
+        batches = list(store.iter_hottest(batch_size=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertEqual([row[0] for batch in batches for row in batch], ["hot", "warm", "cold"])
+        self.assertEqual([row[0] for batch in store.iter_hottest(limit=1) for row in batch], ["hot"])
+        store.close()
+
+    def test_reader_connections_of_exited_threads_are_closed(self):
+        """Test that thread churn does not accumulate read connections."""
+        store = SQLiteStore(self.db_path, durability="write_through", maintenance_interval=None)
+        store.put("k", b"v", 1.0, 0.0)
+        for _ in range(20):
+            thread = threading.Thread(target=store.get, args=("k",))
+            thread.start()
+            thread.join()
+        self.assertEqual(store.get("k")[0], b"v")
+        self.assertLessEqual(len(store._readers), 2)
+        store.close()
+
+    def test_failing_maintenance_hook_keeps_flushing(self):
+        """Test that an exception from maintenance_hook does not stop the write-behind thread."""
+        def hook():
+            raise RuntimeError("hook failed")
+        store = SQLiteStore(self.db_path, flush_interval=0.01, maintenance_interval=0.01, maintenance_hook=hook)
+        time.sleep(0.1)
+        store.put("k", b"v", 1.0, 0.0)
+        deadline = time.time() + 5
+        while store.pending() and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(store._worker.is_alive())
+        self.assertEqual(store.pending(), 0)
+        store.close()
+
+    def test_invalid_durability(self):
+        """Test that unknown durability modes are rejected."""
+        with self.assertRaises(ValueError):
+            SQLiteStore(self.db_path, durability="eventually")
+
+class TestEvictionPolicies(unittest.TestCase):
+
+    def test_capacity_respected(self):
+        """Test that every policy stays within capacity and reports its victims."""
+        for name in EVICTION_POLICIES:
+            policy = make_eviction_policy(name, 10)
+            cached = set()
+            for i in range(100):
+                key = i % 37
+                if key in policy:
+                    policy.access(key)
+                else:
+                    cached.add(key)
+                    cached -= set(policy.insert(key))
+                self.assertLessEqual(len(policy), 10, name)
+                self.assertEqual(len(policy), len(cached), name)
+
+    def test_lru_and_lfu_victims(self):
+        """Test the classic LRU and LFU victim choices."""
+        lru = make_eviction_policy("lru", 2)
+        lru.insert("a"); lru.insert("b"); lru.access("a")
+        self.assertEqual(lru.insert("c"), ["b"])
+
+        lfu = make_eviction_policy("lfu", 2)
+        lfu.insert("a"); lfu.insert("b"); lfu.access("b"); lfu.access("a"); lfu.access("a")
+        self.assertEqual(lfu.insert("c"), ["b"])
+
+    def test_fidelity_victim(self):
+        """Test that the lowest fidelity-weighted score is evicted."""
+        policy = make_eviction_policy("fidelity", 2)
+        policy.insert("low", 0.2)
+        policy.insert("high", 0.9)
+        policy.access("low")
+        self.assertEqual(policy.insert("new", 0.5), ["low"])
+
+    def test_evict_pops_victim(self):
+        """Test that evict() frees one key on demand and returns None when empty."""
+        for name in EVICTION_POLICIES:
+            policy = make_eviction_policy(name, 10)
+            for key in range(3):
+                policy.insert(key)
+            victim = policy.evict()
+            self.assertIn(victim, range(3))
+            self.assertNotIn(victim, policy)
+            policy.clear()
+            self.assertIsNone(policy.evict())
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            make_eviction_policy("random", 10)
+
+    def test_single_entry_capacity(self):
+        """Test that every policy works at capacity 1, as small caches give each shard."""
+        for name in EVICTION_POLICIES:
+            policy = make_eviction_policy(name, 1)
+            for key in range(5):
+                if key not in policy:
+                    policy.insert(key)
+                self.assertEqual(len(policy), 1, name)
+        from utils.cache_manager import QuantumCacheManager
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = QuantumCacheManager(db_path=os.path.join(tmpdir, "cache.db"), redis_host=None,
+                                          cache_size_limit=4, eviction_policy="tinylfu")
+            for i in range(40):
+                manager.put(f"key{i}", i)
+            self.assertEqual(manager.get("key39"), 39)
+            manager.close()
+
+    def test_tinylfu_counts_miss_and_fill_once(self):
+        """Test that a miss followed by the insert of the same key is one sketch increment."""
+        policy = make_eviction_policy("tinylfu", 100)
+        policy.miss("a")
+        policy.insert("a")
+        self.assertEqual(policy.sketch.estimate("a"), 1)
+        policy.insert("b")
+        self.assertEqual(policy.sketch.estimate("b"), 1)
+
+    def test_simulate_hit_rates(self):
+        """Test the trace replay harness."""
+        trace = [1, 2, 1, 2, 3, 1]
+        rates = simulate_hit_rates(trace, 2, policies=["lru"])
+        self.assertAlmostEqual(rates["lru"], 2 / 6)
+
+class TestCacheFilters(unittest.TestCase):
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        """Test that every added key is found and the FP rate stays near the target."""
+        bloom = BloomFilter(capacity=2000, error_rate=0.01)
+        bloom.update(f"key{i}" for i in range(2000))
+        self.assertTrue(all(f"key{i}" in bloom for i in range(2000)))
+        false_positives = sum(f"other{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives / 10000, 0.03)
+        self.assertAlmostEqual(bloom.estimated_fp_rate(), 0.01, delta=0.005)
+
+    def test_negative_cache_expiry_and_discard(self):
+        """Test that recorded misses expire, can be discarded and stay bounded."""
+        negative = NegativeCache(ttl=0.05, max_entries=3)
+        negative.add("a")
+        self.assertIn("a", negative)
+        negative.discard("a")
+        self.assertNotIn("a", negative)
+        negative.add("b")
+        time.sleep(0.1)
+        self.assertNotIn("b", negative)
+        for key in "cdef":
+            negative.add(key)
+        self.assertEqual(len(negative), 3)
+        self.assertNotIn("c", negative)
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_calls_share_one_load(self):
+        """Test that concurrent callers of one key trigger a single load."""
+        flight = SingleFlight()
+        calls = []
+
+        def load():
+            calls.append(1)
+            time.sleep(0.05)
+            return 42
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("k", load))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [42] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.shared, 7)
+
+    def test_errors_propagate_and_reset(self):
+        """Test that a failed load raises and does not poison later calls."""
+        flight = SingleFlight()
+        with self.assertRaises(KeyError):
+            flight.do("k", lambda: {}["missing"])
+        self.assertEqual(flight.do("k", lambda: 1), 1)
+
+class TestCacheSerializer(unittest.TestCase):
+
+    def setUp(self):
+        self.serializer = CacheSerializer(compression="zlib", compress_threshold=1024)
+
+    def test_ndarray_round_trip_is_zero_copy(self):
+        """Test that uncompressed arrays decode as views over the stored buffer."""
+        state = np.random.randn(64) + 1j * np.random.randn(64)
+        blob = self.serializer.dumps(state)
+        self.assertLess(len(blob), state.nbytes + 64)
+        decoded = self.serializer.loads(blob)
+        np.testing.assert_array_equal(decoded, state)
+        self.assertEqual(decoded.dtype, state.dtype)
+        self.assertFalse(decoded.flags.writeable)
+
+    def test_shapes_and_layouts(self):
+        """Test 0-d, empty and non-contiguous arrays."""
+        for array in (np.array(3.5), np.zeros((0, 4)), np.arange(12.0).reshape(3, 4)[:, ::2]):
+            decoded = self.serializer.loads(self.serializer.dumps(array))
+            self.assertEqual(decoded.shape, array.shape)
+            np.testing.assert_array_equal(decoded, array)
+
+    def test_compression_above_threshold(self):
+        """Test that large compressible payloads are compressed."""
+        array = np.zeros(4096)
+        blob = self.serializer.dumps(array)
+        self.assertLess(len(blob), array.nbytes // 10)
+        np.testing.assert_array_equal(self.serializer.loads(blob), array)
+
+    def test_pickle_fallback_and_legacy_blobs(self):
+        """Test non-array values and plain pickles from older cache rows."""
+        value = {"params": [0.1, 0.2], "label": "qaoa"}
+        self.assertEqual(self.serializer.loads(self.serializer.dumps(value)), value)
+        self.assertEqual(self.serializer.loads(pickle.dumps(value)), value)
+
+class TestStateCompression(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.state = rng.normal(size=256) + 1j * rng.normal(size=256)
+        self.state /= np.linalg.norm(self.state)
+
+    def test_fidelity_bound_holds_for_every_mode(self):
+        """Test that reconstructions meet the target and the recorded fidelity."""
+        for mode in ("sparse", "float16", "schmidt", "auto"):
+            compressed = compress_state(self.state, mode, target_fidelity=0.95)
+            restored = compressed.decompress()
+            self.assertEqual(restored.shape, self.state.shape)
+            self.assertEqual(restored.dtype, self.state.dtype)
+            self.assertGreaterEqual(compressed.fidelity, 0.95)
+            self.assertGreaterEqual(state_fidelity(self.state, restored), compressed.fidelity - 1e-9)
+
+    def test_structured_states_compress_well(self):
+        """Test that sparse and product states shrink far below their raw size."""
+        sparse = np.zeros(1024, dtype=complex)
+        sparse[[0, 1023]] = 2 ** -0.5
+        self.assertGreater(compress_state(sparse, "sparse").ratio, 100)
+        product = np.kron(self.state[:32], self.state[32:64])
+        compressed = compress_state(product, "schmidt", target_fidelity=0.999)
+        self.assertEqual(compressed.data["right"].shape[0], 1)
+        self.assertAlmostEqual(compressed.fidelity, 1.0)
+
+    def test_unknown_mode(self):
+        """Test that unknown compression modes are rejected."""
+        with self.assertRaises(ValueError):
+            compress_state(self.state, "qae")
+
+class TestCachedDecorator(unittest.TestCase):
+
+    def setUp(self):
+        from utils.cache_manager import QuantumCacheManager
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.manager = QuantumCacheManager(db_path=os.path.join(self.tmpdir.name, "cache.db"),
+                                           redis_host=None)
+
+    def tearDown(self):
+        self.manager.close()
+        self.tmpdir.cleanup()
+
+    def test_array_arguments_hash_by_content(self):
+        """Test that equal arrays share a key while dtype and shape changes do not."""
+        a = np.arange(6.0)
+        self.assertEqual(hash_arguments(a), hash_arguments(a.copy()))
+        self.assertEqual(hash_arguments(a[::2]), hash_arguments(np.array([0.0, 2.0, 4.0])))
+        self.assertNotEqual(hash_arguments(a), hash_arguments(a.astype(np.float32)))
+        self.assertNotEqual(hash_arguments(a), hash_arguments(a.reshape(2, 3)))
+
+    def test_results_are_memoized_and_copied(self):
+        """Test that repeated calls hit the cache and callers cannot corrupt cached arrays."""
+        calls = []
+
+        @cached(manager=self.manager, tiers=("memory",))
+        def double(x):
+            calls.append(x)
+            return x * 2
+
+        first = double(np.ones(4))
+        first[0] = 100
+        self.assertTrue(np.array_equal(double(np.ones(4)), np.full(4, 2.0)))
+        self.assertEqual(len(calls), 1)
+
+    def test_persistent_tier_and_ttl(self):
+        """Test that results survive the memory tier and expire after their TTL."""
+        calls = []
+
+        @cached(manager=self.manager, ttl=0.2, tiers=("memory", "sqlite"))
+        def describe(n):
+            calls.append(n)
+            return {"n": n}
+
+        describe(1)
+        for shard in self.manager.shards:
+            shard.clear()
+        self.assertEqual(describe(1), {"n": 1})
+        self.assertEqual(len(calls), 1)
+        time.sleep(0.3)
+        describe(1)
+        self.assertEqual(len(calls), 2)
+
+    def test_put_during_get_is_not_overwritten(self):
+        """Test that a get racing a put of the same key never restores the older value."""
+        self.manager.put("race", "old", tiers=("memory",))
+        cache_key = self.manager._generate_key("race")
+        shard = self.manager._shard(cache_key)
+        manager = self.manager
+
+        class PutAfterRead(dict):
+            """Runs a put right after the lock-free read in lookup(), before it takes the lock."""
+            raced = False
+
+            def get(self, key, default=None):
+                entry = super().get(key, default)
+                if key == cache_key and not PutAfterRead.raced:
+                    PutAfterRead.raced = True
+                    manager.put("race", "new", tiers=("memory",))
+                return entry
+
+        shard.entries = PutAfterRead(shard.entries)
+        self.assertEqual(self.manager.get("race", tiers=("memory",)), "old")
+        self.assertTrue(PutAfterRead.raced)
+        self.assertEqual(self.manager.get("race", tiers=("memory",)), "new")
+        self.assertEqual(shard.bytes, sum(entry[4] for entry in shard.entries.values()))
+
+    def test_rows_from_another_key_are_misses(self):
+        """Test that rows written under a different encryption key read as misses and are deleted."""
+        from utils.cache_manager import QuantumCacheManager
+        for key in ("a", "b", "c"):
+            self.manager.put(key, key.upper(), tiers=("sqlite",))
+        self.manager.close()
+        restarted = QuantumCacheManager(db_path=self.manager.db_path, redis_host=None)
+        self.addCleanup(restarted.close)
+        self.assertIsNone(restarted.get("a"))
+        self.assertEqual(restarted.get_many(["b", "c"]), [None, None])
+        self.assertEqual(restarted.store.get_many([restarted._generate_key(k) for k in "abc"]), {})
+        restarted.put("a", "fresh")
+        self.assertEqual(restarted.get("a", tiers=("sqlite",)), "fresh")
+
+    def test_warm_up_skips_rows_from_another_key(self):
+        """Test that warm-up loads the rows it can decrypt and drops the rest."""
+        from cryptography.fernet import Fernet
+        from utils.cache_manager import QuantumCacheManager
+        key = Fernet.generate_key()
+        self.manager.put("stale", 1, tiers=("sqlite",))
+        self.manager.close()
+        writer = QuantumCacheManager(db_path=self.manager.db_path, redis_host=None, encryption_key=key)
+        writer.put("kept", 2, tiers=("sqlite",))
+        writer.close()
+        warmed = QuantumCacheManager(db_path=self.manager.db_path, redis_host=None, encryption_key=key,
+                                     warm_up=True)
+        self.addCleanup(warmed.close)
+        self.assertTrue(warmed.wait_for_warm_up(5))
+        self.assertEqual(warmed.warmed_entries, 1)
+        self.assertEqual(warmed.get("kept", tiers=("memory",)), 2)
+        self.assertIsNone(warmed.store.get(warmed._generate_key("stale")))
+
+    def test_default_manager_is_private_to_the_process(self):
+        """Test that the lazily created default manager does not share a SQLite file between processes."""
+        from utils.cache_memoize import get_default_cache_manager
+        path = get_default_cache_manager().db_path
+        self.assertNotEqual(os.path.dirname(path), tempfile.gettempdir())
+        self.assertIs(get_default_cache_manager().db_path, path)
+
+    def test_memory_budget_is_shared_by_shards(self):
+        """Test that an entry larger than budget / num_shards is kept, evicting from other shards."""
+        from utils.cache_manager import QuantumCacheManager
+        manager = QuantumCacheManager(db_path=os.path.join(self.tmpdir.name, "budget.db"), redis_host=None,
+                                      memory_budget_bytes=16 * 8192, num_shards=16, eviction_policy="lru")
+        self.addCleanup(manager.close)
+        for i in range(16):
+            manager.put(f"small{i}", np.zeros(512, dtype=complex), tiers=("memory",))
+        large = np.ones(4096, dtype=complex)
+        manager.put("large", large, tiers=("memory",))
+        np.testing.assert_array_equal(manager.get("large", tiers=("memory",)), large)
+        memory_bytes = manager.get_metrics()["memory_bytes"]
+        self.assertGreaterEqual(memory_bytes, large.nbytes)
+        self.assertLessEqual(memory_bytes, manager.memory_budget_bytes)
+        self.assertEqual(manager.shards[0].budget.used, memory_bytes)
+
+    def test_explicit_full_tier_set_uses_negative_cache(self):
+        """Test that naming every tier behaves like the default tier selection for misses."""
+        from utils.cache_manager import QuantumCacheManager
+        # Without the key filter, only the negative cache answers repeated misses
+        manager = QuantumCacheManager(db_path=os.path.join(self.tmpdir.name, "tiers.db"), redis_host=None,
+                                      bloom_filter=False)
+        self.addCleanup(manager.close)
+        self.assertIsNone(manager.get("absent", tiers=["memory", "redis", "sqlite"]))
+        self.assertIn(manager._generate_key("absent"), manager.negative_cache)
+
+    def test_unknown_tier(self):
+        """Test that unknown tier names are rejected."""
+        with self.assertRaises(ValueError):
+            cached(tiers=("disk",))
+
+class TestPerformanceMonitor(unittest.TestCase):
+
+    def test_start_stop_timer(self):
+        """Test the original single start/stop timer."""
+        monitor = PerformanceMonitor()
+        with self.assertRaises(RuntimeError):
+            monitor.elapsed_time()
+        monitor.start()
+        self.assertGreaterEqual(monitor.stop(), 0.0)
+
+    def test_nested_spans_and_collapsed_stacks(self):
+        """Test that nested spans aggregate per name and report self time per stack."""
+        monitor = PerformanceMonitor()
+
+        @monitor.profile("outer")
+        def outer():
+            with monitor.span("inner"):
+                time.sleep(0.002)
+
+        for _ in range(5):
+            outer()
+        stats = monitor.stats()
+        self.assertEqual(stats["outer"]["count"], 5)
+        self.assertGreaterEqual(stats["inner"]["p50"], 0.0019)
+        self.assertGreaterEqual(stats["outer"]["total"], stats["inner"]["total"])
+        stacks = dict(line.rsplit(" ", 1) for line in monitor.collapsed_stacks())
+        self.assertEqual(set(stacks), {"outer", "outer;inner"})
+        self.assertGreater(int(stacks["outer;inner"]), int(stacks["outer"]))
+
+    def test_threads_keep_separate_stacks(self):
+        """Test that spans opened in other threads do not nest under each other."""
+        monitor = PerformanceMonitor()
+
+        def work():
+            with monitor.span("worker"):
+                time.sleep(0.001)
+
+        with monitor.span("main"):
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        stacks = {line.rsplit(" ", 1)[0] for line in monitor.collapsed_stacks()}
+        self.assertEqual(stacks, {"main", "worker"})
+
+    def test_disabled_records_nothing(self):
+        """Test that a disabled monitor skips recording entirely."""
+        monitor = PerformanceMonitor(enabled=False)
+        with monitor.span("ignored"):
+            pass
+        self.assertEqual(monitor.profile()(lambda: 3)(), 3)
+        self.assertEqual(monitor.stats(), {})
+
+    def test_quantile_sketch_accuracy(self):
+        """Test that sketch quantiles stay within the configured relative error."""
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        values = np.random.default_rng(0).lognormal(size=10000)
+        for value in values:
+            sketch.add(value)
+        for q in (0.5, 0.95, 0.99):
+            exact = np.quantile(values, q)
+            self.assertAlmostEqual(sketch.quantile(q) / exact, 1.0, delta=0.02)
+
+class TestLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.root = logging.getLogger()
+        self.saved = (list(self.root.handlers), self.root.level)
+
+    def tearDown(self):
+        shutdown_logging()
+        self.root.handlers[:] = self.saved[0]
+        self.root.setLevel(self.saved[1])
+
+    def make_record(self, msg="event %d", level=logging.INFO):
+        return logging.LogRecord("test", level, __file__, 0, msg, (1,), None)
+
+    def test_setup_logger_is_idempotent(self):
+        """Test that repeated setup_logger calls do not stack handlers."""
+        name = "quantumnet.test.idempotent"
+        logger = setup_logger(name)
+        setup_logger(name, logging.DEBUG)
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertEqual(logger.handlers[0].level, logging.DEBUG)
+        logger.handlers.clear()
+
+    def test_queue_listener_writes_records(self):
+        """Test that records reach the handler through the background listener."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test.log")
+            handler = logging.FileHandler(path)
+            configure_logging(logging.INFO, handlers=[handler], fmt="%(levelname)s %(message)s")
+            configure_logging(logging.INFO, handlers=[handler], fmt="%(levelname)s %(message)s")
+            self.assertEqual(len(self.root.handlers), 1)
+            logger = logging.getLogger("quantumnet.test.queue")
+            logger.info("value=%d", 7)
+            logger.debug("hidden")
+            # No handler is added on top of the shared queue
+            self.assertEqual(setup_logger("quantumnet.test.queue").handlers, [])
+            shutdown_logging()
+            handler.close()
+            with open(path) as f:
+                self.assertEqual(f.read().splitlines(), ["INFO value=7"])
+
+    def test_sampling_filter(self):
+        """Test that sampling keeps one record in N but never drops warnings."""
+        sampler = SamplingFilter(every=10)
+        kept = sum(sampler.filter(self.make_record()) for _ in range(100))
+        self.assertEqual(kept, 10)
+        self.assertEqual(sampler.dropped, 90)
+        self.assertTrue(sampler.filter(self.make_record(level=logging.WARNING)))
+
+    def test_rate_limit_filter(self):
+        """Test that each message template gets its own token bucket."""
+        limiter = RateLimitFilter(rate=1.0, burst=3)
+        kept = sum(limiter.filter(self.make_record()) for _ in range(10))
+        self.assertEqual(kept, 3)
+        self.assertTrue(limiter.filter(self.make_record("other %d")))
+        self.assertTrue(limiter.filter(self.make_record(level=logging.ERROR)))
+        limiter._buckets[("test", "event %d")] = (1.0, time.monotonic(), 7)
+        record = self.make_record()
+        self.assertTrue(limiter.filter(record))
+        self.assertEqual(record.suppressed, 7)
+
+    def test_throttle_logger_replaces_filters(self):
+        """Test that throttling a logger twice leaves one filter of each kind."""
+        name = "quantumnet.test.throttle"
+        throttle_logger(name, every=5, rate=10)
+        logger = throttle_logger(name, rate=20)
+        self.assertEqual([type(f) for f in logger.filters], [RateLimitFilter])
+        self.assertEqual(logger.filters[0].rate, 20)
+        throttle_logger(name)
+        self.assertEqual(logger.filters, [])
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_packages_defer_heavy_dependencies(self):
+        """Test that importing utils and quantum_state loads no plotting or HTTP libraries."""
+        src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+        probe = ("import sys, utils, quantum_state; "
+                 "print(sorted(m for m in ('matplotlib', 'requests', 'sklearn') if m in sys.modules))")
+        output = subprocess.run([sys.executable, "-c", probe], cwd=src_dir,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "[]")
+
+    def test_lazy_attribute_access(self):
+        """Test that lazily exported names resolve on first access."""
+        import utils
+        self.assertIn("HTTPClient", dir(utils))
+        self.assertEqual(utils.HTTPClient.__name__, "HTTPClient")
+        with self.assertRaises(AttributeError):
+            utils.does_not_exist
+
+class TestTelemetryStreaming(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.frame = pd.DataFrame({
+            "node_id": [f"node{i % 5}" for i in range(1000)],
+            "cpu": rng.normal(50, 10, 1000),
+            "memory": rng.integers(0, 100, 1000),
+        })
+        self.frame.loc[rng.choice(1000, 100, replace=False), "cpu"] = np.nan
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "telemetry.csv")
+        self.frame.to_csv(self.path, index=False)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_running_statistics_match_pandas(self):
+        """Test that chunked Welford statistics equal full-table statistics."""
+        processor = TelemetryDataProcessor(self.path, streaming=True, chunksize=128)
+        summary = processor.generate_summary_statistics()
+        numeric = self.frame[["cpu", "memory"]]
+        for column in numeric:
+            self.assertAlmostEqual(summary["mean"][column], numeric[column].mean())
+            self.assertAlmostEqual(summary["std_dev"][column], numeric[column].std())
+            self.assertEqual(summary["min"][column], numeric[column].min())
+            self.assertEqual(summary["count"][column], numeric[column].count())
+        self.assertNotIn("node_id", summary["mean"])
+
+    def test_streamed_chunks_match_batch_preprocessing(self):
+        """Test that filled and scaled chunks equal preprocess_data on the whole table."""
+        batch = TelemetryDataProcessor(self.path)
+        batch.data = batch.data[["cpu", "memory"]]
+        batch.preprocess_data()
+        streaming = TelemetryDataProcessor(self.path, streaming=True, chunksize=128)
+        chunks = list(streaming.stream_preprocessed_data())
+        self.assertEqual(len(chunks), 8)
+        streamed = pd.concat(chunks)
+        np.testing.assert_allclose(streamed[["cpu", "memory"]].to_numpy(), batch.data.to_numpy(), atol=1e-12)
+        self.assertEqual(list(streamed["node_id"]), list(self.frame["node_id"]))
+
+    def test_empty_chunk_is_ignored(self):
+        """Test that updating with no rows leaves the statistics unchanged."""
+        statistics = RunningStatistics(["cpu"])
+        statistics.update(self.frame.iloc[:0])
+        self.assertEqual(statistics.rows, 0)
+        self.assertTrue(np.isnan(statistics.mean[0]))
+
+class TestTelemetryStore(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        count = 5000
+        self.frame = pd.DataFrame({
+            "timestamp": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 3 * 86400, count), unit="s"),
+            "node_id": rng.choice(["node_1", "node_2", "node_3"], count),
+            "cpu_usage": rng.random(count),
+            "error_rate": rng.random(count),
+        })
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmpdir.name, "store")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_query_matches_dataframe_filter(self):
+        """Test that a node/time query returns the same rows as filtering the full table."""
+        store = TelemetryStore(self.root, format="npy")
+        store.append(self.frame.iloc[:3000])
+        store.append(self.frame.iloc[3000:])
+        result = store.query(["cpu_usage"], ["node_2"], "2024-01-02 12:00", "2024-01-03")
+        frame = self.frame
+        expected = frame[(frame.node_id == "node_2") & (frame.timestamp >= "2024-01-02 12:00")
+                         & (frame.timestamp < "2024-01-03")].sort_values("timestamp", kind="stable")
+        np.testing.assert_array_equal(result["cpu_usage"].to_numpy(), expected["cpu_usage"].to_numpy())
+        self.assertTrue((result["node_id"] == "node_2").all())
+        # Only the day-2 partitions of node_2 (one per append) are opened
+        start, end = pd.Timestamp("2024-01-02 12:00").value, pd.Timestamp("2024-01-03").value
+        self.assertEqual({segment["day"] for segment in store.segments(["node_2"], start, end)}, {"2024-01-02"})
+
+    def test_index_persists_and_csv_import(self):
+        """Test that a reopened store serves imported CSV rows from its index."""
+        csv_path = os.path.join(self.tmpdir.name, "node_telemetry.csv")
+        self.frame.to_csv(csv_path, index=False)
+        self.assertEqual(TelemetryStore(self.root).import_csv(csv_path, chunksize=1000), 5000)
+        store = TelemetryStore(self.root)
+        self.assertEqual(len(store), 5000)
+        self.assertEqual(store.nodes, ["node_1", "node_2", "node_3"])
+        self.assertEqual(store.columns, ["cpu_usage", "error_rate"])
+        self.assertEqual(len(store.query(nodes=["node_1"])), (self.frame.node_id == "node_1").sum())
+        with self.assertRaises(KeyError):
+            store.query(["missing_metric"])
+        # The five chunks are merged into one segment per day and node
+        self.assertEqual(len(store.segments()), 9)
+        self.assertEqual(sum(len(files) for _, _, files in os.walk(self.root)),
+                         1 + sum(len(segment["columns"]) + 1 if store.format == "npy" else 1
+                                 for segment in store.segments()))
+
+    def test_compact_merges_partitions(self):
+        """Test that compact leaves one segment per partition and the same query results."""
+        store = TelemetryStore(self.root, format="npy")
+        for start in range(0, 5000, 1000):
+            store.append(self.frame.iloc[start:start + 1000])
+        before = store.query(nodes="node_3")
+        self.assertTrue((before["node_id"] == "node_3").all())
+        self.assertEqual(store.compact(), 45)
+        self.assertEqual(len(store.segments()), 9)
+        # Rows with equal timestamps may come back in another order
+        columns = ["timestamp", "cpu_usage", "error_rate"]
+        pd.testing.assert_frame_equal(store.query(nodes="node_3").sort_values(columns, ignore_index=True),
+                                      before.sort_values(columns, ignore_index=True))
+        self.assertEqual(len(TelemetryStore(self.root)), 5000)
+
+class TestStreamingAnomaly(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(5)
+
+    def test_compiled_forest_matches_sklearn(self):
+        """Test that the compiled forest reproduces IsolationForest scores and labels."""
+        from sklearn.ensemble import IsolationForest
+        data = self.rng.normal(size=(1000, 3))
+        forest = IsolationForest(n_estimators=50, contamination=0.02, random_state=0).fit(data)
+        compiled = CompiledIsolationForest.from_sklearn(forest)
+        probe = self.rng.normal(scale=2.0, size=(200, 3))
+        np.testing.assert_allclose(compiled.score_samples(probe), -forest.score_samples(probe))
+        self.assertAlmostEqual(compiled.score_one(probe[0]), -forest.score_samples(probe[:1])[0])
+        np.testing.assert_array_equal(compiled.score_samples(probe) > compiled.decision_threshold,
+                                      forest.predict(probe) == -1)
+
+    def test_detector_adapts_to_level_shift(self):
+        """Test EWMA flagging before the first fit, and refits that follow a shifted stream."""
+        detector = StreamingAnomalyDetector(2, window=512, refit_every=256, n_estimators=50,
+                                            background=False, fit_in_subprocess=False, random_state=0)
+        for x in self.rng.normal(size=(100, 2)):
+            detector.update(x)
+        self.assertIsNone(detector.model)
+        self.assertTrue(detector.update(np.array([50.0, 0.0])))
+        for x in self.rng.normal(size=(1000, 2)):
+            detector.update(x)
+        self.assertGreater(detector.model_version, 0)
+        self.assertTrue(detector.update(np.array([8.0, -8.0])))
+        # After the level shift the window fills with new data and the refitted forest accepts it
+        detector.update_many(self.rng.normal(size=(1024, 2)) + 5.0)
+        flags = detector.update_many(self.rng.normal(size=(500, 2)) + 5.0)
+        self.assertLess(flags.mean(), 0.1)
+        self.assertEqual(detector.stats()["samples"], 100 + 1 + 1000 + 1 + 1024 + 500)
+
+    def test_stream_anomalies_from_csv(self):
+        """Test that stream_anomalies yields the injected outlier rows of a telemetry CSV."""
+        frame = pd.DataFrame(self.rng.normal(size=(3000, 2)), columns=["cpu_usage", "memory_usage"])
+        frame.loc[[1500, 2500], "cpu_usage"] = 40.0
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = os.path.join(tmpdir, "node_telemetry.csv")
+            frame.to_csv(csv_path, index=False)
+            processor = TelemetryDataProcessor(csv_path, streaming=True, chunksize=1000)
+            detector = StreamingAnomalyDetector(2, window=1024, refit_every=512, n_estimators=50,
+                                                background=False, fit_in_subprocess=False, random_state=0)
+            anomalies = pd.concat(list(processor.stream_anomalies(detector)))
+        self.assertTrue({1500, 2500} <= set(anomalies.index))
+        self.assertLess(len(anomalies), 100)
+
+    def test_subprocess_fit_spawns_and_closes_worker(self):
+        """Test that subprocess fits use a spawned worker that leaving the with block shuts down."""
+        with StreamingAnomalyDetector(2, window=256, n_estimators=10, max_samples=128,
+                                      background=False, fit_in_subprocess=True, random_state=0) as detector:
+            detector.update_many(self.rng.normal(size=(256, 2)))
+            self.assertEqual(detector.model_version, 1)
+            executor = detector._executor
+            self.assertEqual(executor._mp_context.get_start_method(), "spawn")
+        self.assertIsNone(detector._executor)
+        self.assertFalse(detector._executor_finalizer.alive)
+        self.assertTrue(executor._shutdown_thread)
+
+class TestColumnarRingBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.buffer = ColumnarRingBuffer(4, {"timestamp": "datetime64[ns]", "value": np.float64})
+        self.start = np.datetime64("2024-01-01T00:00:00", "ns")
+
+    def fill(self, count):
+        for i in range(count):
+            self.buffer.append(timestamp=self.start + np.timedelta64(i, "s"), value=float(i))
+
+    def test_window_is_a_view_of_the_newest_rows(self):
+        """Test that wrapped windows are contiguous read-only views, oldest row first."""
+        nbytes = self.buffer.nbytes
+        self.fill(10)
+        self.assertEqual(len(self.buffer), 4)
+        self.assertEqual(self.buffer.nbytes, nbytes)
+        window = self.buffer.window()
+        np.testing.assert_array_equal(window["value"], [6.0, 7.0, 8.0, 9.0])
+        self.assertIsNotNone(window["value"].base)
+        self.assertFalse(window["value"].flags.writeable)
+        np.testing.assert_array_equal(self.buffer.window(2)["value"], [8.0, 9.0])
+
+    def test_since_and_records(self):
+        """Test time-based selection and JSON export of only the selected rows."""
+        self.fill(6)
+        window = self.buffer.since("timestamp", self.start + np.timedelta64(4, "s"))
+        self.assertEqual(ColumnarRingBuffer.to_records(window), [
+            {"timestamp": "2024-01-01T00:00:04.000", "value": 4.0},
+            {"timestamp": "2024-01-01T00:00:05.000", "value": 5.0},
+        ])
+        with self.assertRaises(KeyError):
+            self.buffer.append(pressure=1.0)
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter_sums_thread_shards(self):
+        """Test that per-thread counter shards add up, including shards of finished threads."""
+        requests = self.registry.counter("requests_total", "Requests.", {"result": "hit"})
+        self.assertIs(self.registry.counter("requests_total", labels={"result": "hit"}), requests)
+
+        def work():
+            for _ in range(1000):
+                requests.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        requests.inc(5)
+        self.assertEqual(requests.value, 4005)
+        self.assertEqual(requests.value, 4005)
+        with self.assertRaises(ValueError):
+            self.registry.gauge("requests_total")
+
+    def test_histogram_and_text_format(self):
+        """Test cumulative histogram buckets and the Prometheus text rendering."""
+        latency = self.registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 3.0):
+            latency.observe(value)
+        self.assertEqual(latency.snapshot(), ([1, 3, 4], 4.05, 4))
+        self.registry.gauge("queue_depth").set_function(lambda: 7)
+        text = self.registry.render_text()
+        self.assertIn('# TYPE latency_seconds histogram', text)
+        self.assertIn('latency_seconds_bucket{le="1"} 3', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 4', text)
+        self.assertIn('latency_seconds_count 4', text)
+        self.assertIn('queue_depth 7', text)
+
+class TestDownsampling(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.values = rng.normal(size=10000).cumsum()
+        self.values[4321] = 1e3  # A single spike
+
+    def test_lttb_keeps_endpoints_and_spikes(self):
+        """Test that LTTB returns the requested count of increasing indices, keeping ends and peaks."""
+        indices = lttb_indices(None, self.values, 500)
+        self.assertEqual(len(indices), 500)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertEqual((indices[0], indices[-1]), (0, 9999))
+        self.assertIn(4321, indices)
+        np.testing.assert_array_equal(lttb_indices(None, self.values[:100], 500), np.arange(100))
+
+    def test_minmax_preserves_envelope(self):
+        """Test that min/max buckets keep every bucket's extremes, so the global ones survive."""
+        indices = minmax_indices(self.values, 200)
+        self.assertLessEqual(len(indices), 202)
+        self.assertEqual(self.values[indices].max(), self.values.max())
+        self.assertEqual(self.values[indices].min(), self.values.min())
+
+    def test_columns_share_datetime_x(self):
+        """Test downsampling several columns of a window on a shared datetime axis."""
+        timestamps = np.datetime64("2024-01-01", "ns") + np.arange(10000) * np.timedelta64(5, "s")
+        window = downsample_columns({"timestamp": timestamps, "a": self.values, "b": -self.values},
+                                    "timestamp", 300, "minmax")
+        self.assertEqual(window["timestamp"].dtype, timestamps.dtype)
+        self.assertLessEqual(len(window["a"]), 300)
+        self.assertIn(1e3, window["a"])
+        x, y = downsample(timestamps, self.values, 50)
+        self.assertEqual(len(x), 50)
+        with self.assertRaises(ValueError):
+            downsample(None, self.values, 50, method="average")
+
 if __name__ == "__main__":
     unittest.main()